@@ -0,0 +1,120 @@
+"""Per-request cpu time of the rest response path, replayed from recorded cassettes.
+
+    python benchmarks/bench_rest_decode.py [iterations]
+
+`before` reproduces the previous path (pmap of `Response.__dict__`, then one
+json decode per accessor), `after` is `noobit_markets.base.request.decode_response`.
+"""
+
+import sys
+import json
+import glob
+import time
+import asyncio
+from os import path
+
+import yaml
+import httpx
+from pyrsistent import pmap
+
+from noobit_markets.base.request import decode_response
+
+
+HERE = path.dirname(path.abspath(__file__))
+CASSETTES = path.join(HERE, "..", "tests", "exchanges", "*", "rest", "public", "cassettes", "*", "*.yaml")
+
+# number of json decodes per response in the previous implementation
+#   kraken: get_error_content + get_result_content
+#   binance: get_result_content (+ get_error_content on http errors)
+#   ftx: get_error_content + get_result_content (via Response.json())
+DECODES_BEFORE = {"kraken": 2, "binance": 1, "ftx": 2}
+
+
+
+
+# ============================================================
+# LOAD CASSETTES
+# ============================================================
+
+
+def load_responses():
+
+    responses = []
+
+    for filepath in sorted(glob.glob(CASSETTES)):
+        exchange = filepath.split(path.sep)[-6]
+        with open(filepath) as f:
+            cassette = yaml.safe_load(f)
+
+        for interaction in cassette["interactions"]:
+            resp = interaction["response"]
+            req = interaction["request"]
+
+            # httpx and aiohttp cassettes are not recorded in the same format
+            if "content" in resp:
+                status_code, content = resp["status_code"], resp["content"]
+            else:
+                status_code, content = resp["status"]["code"], resp["body"]["string"]
+
+            if isinstance(content, str):
+                content = content.encode()
+
+            response = httpx.Response(
+                status_code,
+                request=httpx.Request(req["method"], req.get("uri", req.get("url"))),
+                content=content
+            )
+            responses.append((exchange, response))
+
+    return responses
+
+
+
+
+# ============================================================
+# BENCHMARK
+# ============================================================
+
+
+def before(exchange, response):
+
+    resp = pmap(response.__dict__)
+    status_code = resp["status_code"]
+    for _ in range(DECODES_BEFORE[exchange]):
+        content = json.loads(resp["_content"])
+    return status_code, content
+
+
+async def after(exchange, response):
+    return await decode_response(response)
+
+
+async def run(responses, iterations):
+
+    t0 = time.process_time()
+    for _ in range(iterations):
+        for exchange, response in responses:
+            before(exchange, response)
+    t_before = time.process_time() - t0
+
+    t0 = time.process_time()
+    for _ in range(iterations):
+        for exchange, response in responses:
+            await after(exchange, response)
+    t_after = time.process_time() - t0
+
+    return t_before, t_after
+
+
+if __name__ == "__main__":
+
+    iterations = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+
+    responses = load_responses()
+    t_before, t_after = asyncio.run(run(responses, iterations))
+
+    n = iterations * len(responses)
+    print(f"{len(responses)} recorded responses, {iterations} iterations")
+    print(f"before : {t_before/n*10**6:10.1f} us/request")
+    print(f"after  : {t_after/n*10**6:10.1f} us/request")
+    print(f"speedup: {t_before/t_after:10.2f}x")
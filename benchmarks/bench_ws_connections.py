@@ -0,0 +1,112 @@
+"""Aggregate message throughput of N kraken ws connections sharing one event loop.
+
+    python benchmarks/bench_ws_connections.py [messages per connection]
+
+Each connection is an in-memory client replaying trade frames in bursts, with a
+simulated network round trip between bursts, so a single connection is mostly
+waiting on the network and throughput should scale with the number of
+connections until the loop is cpu bound.
+Also checks that every consumer only receives the messages of its own connection
+(with class level queues, all instances shared the same queues).
+"""
+
+import sys
+import time
+import asyncio
+
+from noobit_markets.base import codec
+from noobit_markets.exchanges.kraken.websockets.base import KrakenWsPublic
+from noobit_markets.exchanges.kraken.websockets.public.routing import msg_handler
+
+
+CONNECTIONS = [1, 2, 4, 8, 16, 32]
+
+BURST = 50
+# simulated network latency between two bursts (seconds)
+LATENCY = 0.005
+
+
+
+
+# ============================================================
+# FAKE CLIENT
+# ============================================================
+
+
+def trade_frame(conn_id: int, i: int) -> str:
+    return codec.dumps([
+        conn_id,
+        [["5541.20000", "0.15850568", f"{1534614057.321597 + i:.6f}", "s", "l", ""]],
+        "trade",
+        "XBT/USD"
+    ])
+
+
+class ReplayClient:
+
+    open = True
+
+    def __init__(self, conn_id: int, count: int):
+        self.frames = [trade_frame(conn_id, i) for i in range(count)]
+
+    async def send(self, msg):
+        pass
+
+    def __aiter__(self):
+        return self._replay()
+
+    async def _replay(self):
+        for i, frame in enumerate(self.frames):
+            if i % BURST == 0:
+                await asyncio.sleep(LATENCY)
+            yield frame
+        # connection stays open until shutdown
+        await asyncio.Event().wait()
+
+
+
+
+# ============================================================
+# RUN
+# ============================================================
+
+
+async def consume(kws: KrakenWsPublic, count: int) -> int:
+
+    received = 0
+    async for msg in kws.trade({"XBT-USD": "XBT/USD"}, "XBT-USD"):
+        received += len(msg.value.trades)
+        if received >= count:
+            break
+    return received
+
+
+async def run(n_conn: int, count: int):
+
+    loop = asyncio.get_event_loop()
+    apis = [KrakenWsPublic(ReplayClient(i, count), msg_handler, loop) for i in range(n_conn)]
+
+    start = time.perf_counter()
+    received = await asyncio.gather(*(consume(kws, count) for kws in apis))
+    elapsed = time.perf_counter() - start
+
+    for kws in apis:
+        kws.shutdown()
+
+    assert all(r == count for r in received), received
+    assert all(kws._count == count for kws in apis), [kws._count for kws in apis]
+
+    return elapsed
+
+
+def main(count: int):
+
+    print(f"{'connections':>12} {'messages':>10} {'elapsed (s)':>12} {'msg/s':>10}")
+    for n_conn in CONNECTIONS:
+        elapsed = asyncio.run(run(n_conn, count))
+        total = n_conn * count
+        print(f"{n_conn:>12} {total:>10} {elapsed:>12.3f} {total / elapsed:>10.0f}")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 2_000)
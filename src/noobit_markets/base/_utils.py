@@ -20,6 +20,7 @@ stackprinter.set_excepthook(style="darkbg2")
 
 from noobit_markets.base.models.rest.request import NoobitRequestOhlc
 from noobit_markets.base.models.rest.response import NoobitResponseOhlc
+from noobit_markets.base.models.rest.records import OhlcRecord
 from noobit_markets.exchanges.kraken.rest.public.ohlc.response import make_kraken_model_ohlc
 from noobit_markets.exchanges.kraken.rest.public.ohlc.request import KrakenRequestOhlc
 
@@ -207,7 +208,7 @@ def parse_result_data_ohlc(
         response: pydantic.BaseModel, 
         symbol: ntypes.SYMBOL,
         symbol_mapping
-    ) -> typing.Tuple[pmap]:
+    ) -> typing.Tuple[OhlcRecord, ...]:
 
 
     response_content = getattr(response, "result", None)
@@ -226,7 +227,7 @@ def parse_result_data_ohlc(
 def _single_candle(
         data: tuple,
         symbol: ntypes.SYMBOL
-    ) -> pmap:
+    ) -> OhlcRecord:
 
     parsed = {
         "symbol": symbol,
@@ -239,7 +240,7 @@ def _single_candle(
         "trdCount": data[7]
     }
 
-    return pmap(parsed)
+    return OhlcRecord(**parsed)
 
 
 def validate_input(noobit_input: pydantic.BaseModel, exchange_input: pydantic.BaseModel, parser: typing.Callable):
@@ -0,0 +1,365 @@
+import os
+import time
+import heapq
+import typing
+import itertools
+
+import httpx
+
+from noobit_markets.base import ntypes, codec
+from noobit_markets.base.errors import DDoSProtection, ExchangeNotAvailable, RequestTimeout
+from noobit_markets.base.history import History
+from noobit_markets.base.models.result import Result
+from noobit_markets.base.ratelimit import RateLimiter
+from noobit_markets.base.scheduler import Scheduler
+
+
+# Backfill of many (symbol, endpoint, range) jobs: each job is a History, jobs run
+# by priority with bounded concurrency. Requests are paced by the rate limiter of each
+# exchange (the one of the rest requests), so that the exchange budget is shared by
+# whichever jobs are running, and by any other request of the process.
+# Limiters passed by the caller (for ex to keep some budget for other processes) are
+# acquired before each page on top of that: they can slow the jobs down, not speed them up.
+
+
+# errors after which requests to the exchange are paused (then the job resumes)
+_BACKOFF_ERRORS = (DDoSProtection, ExchangeNotAvailable, RequestTimeout)
+
+# pause after a connection error (raised by the http client, not returned by the exchange)
+_NETWORK_ERROR_SLEEP = 5.
+
+
+
+
+# ============================================================
+# LIMITERS
+# ============================================================
+
+
+def exchange_limiters() -> typing.Dict[str, RateLimiter]:
+    """Rate limiters of the rest requests of each exchange.
+    """
+
+    # imported here, base modules do not depend on exchanges
+    from noobit_markets.exchanges.kraken.rest.base import KRAKEN_RATE_LIMITER
+    from noobit_markets.exchanges.binance.rest.base import BINANCE_RATE_LIMITER
+    from noobit_markets.exchanges.ftx.rest.base import FTX_RATE_LIMITER
+
+    return {
+        "kraken": KRAKEN_RATE_LIMITER,
+        "binance": BINANCE_RATE_LIMITER,
+        "ftx": FTX_RATE_LIMITER,
+    }
+
+
+
+
+class _PageLimiter:
+    """`acquire()` of a History, for the endpoint of a job.
+    """
+
+    __slots__ = ("limiter", "endpoint")
+
+    def __init__(self, limiter: RateLimiter, endpoint: typing.Optional[str]):
+        self.limiter = limiter
+        self.endpoint = endpoint
+
+    async def acquire(self):
+        await self.limiter.acquire(self.endpoint)
+
+
+
+
+# ============================================================
+# JOBS
+# ============================================================
+
+
+class BackfillJob(typing.NamedTuple):
+    """`history(start, end)` returns the History of the job, its requests are paced by the exchange limiter.
+    """
+
+    key: str
+    exchange: str
+    history: typing.Callable[[ntypes.TIMESTAMP, typing.Optional[ntypes.TIMESTAMP]], History]
+    start: ntypes.TIMESTAMP
+    end: typing.Optional[ntypes.TIMESTAMP] = None
+    # lower runs first
+    priority: int = 0
+    # exchange endpoint of the requests, its limits are paused on backoff (all limits if None)
+    endpoint: typing.Optional[str] = None
+
+
+class JobProgress(typing.NamedTuple):
+    cursor: typing.Optional[ntypes.TIMESTAMP]
+    pages: int
+    items: int
+    attempts: int
+    # "pending", "running", "done", "failed"
+    state: str
+    # fraction of [start, end) covered, None without end
+    done_ratio: typing.Optional[float]
+
+
+class BackfillStats(typing.NamedTuple):
+    jobs: int
+    pending: int
+    running: int
+    done: int
+    failed: int
+    pages: int
+    items: int
+    requests: int
+    backoffs: int
+    elapsed: float
+
+
+
+
+# ============================================================
+# CHECKPOINT
+# ============================================================
+
+
+class Checkpoint:
+    """Cursor of each job, saved to a json file after each page.
+
+    Jobs restart at their cursor after a crash: the items at the cursor time
+    are delivered again (at least once, dedupe on the consumer side if needed).
+    """
+
+    def __init__(self, path: typing.Optional[str] = None):
+
+        self.path = path
+        self._jobs: typing.Dict[str, typing.Dict[str, typing.Any]] = {}
+
+        if path is not None:
+            try:
+                with open(path, "rb") as f:
+                    self._jobs = codec.loads(f.read())
+            except (OSError, ValueError):
+                # no file yet, or corrupted: start over
+                self._jobs = {}
+
+
+    def cursor(self, key: str) -> typing.Optional[ntypes.TIMESTAMP]:
+        cursor = self._jobs.get(key, {}).get("cursor")
+        return None if cursor is None else int(cursor)
+
+
+    def is_done(self, key: str) -> bool:
+        return self._jobs.get(key, {}).get("done", False)
+
+
+    def update(self, key: str, cursor: typing.Optional[ntypes.TIMESTAMP], done: bool = False):
+
+        self._jobs[key] = {"cursor": None if cursor is None else int(cursor), "done": done}
+        self._save()
+
+
+    def _save(self):
+
+        if self.path is None:
+            return
+
+        tmp_path = f"{self.path}.{os.getpid()}.tmp"
+        try:
+            with open(tmp_path, "w") as f:
+                f.write(codec.dumps(self._jobs))
+            os.replace(tmp_path, self.path)
+        except OSError:
+            pass
+
+
+
+
+# ============================================================
+# BACKFILL
+# ============================================================
+
+
+class Backfill:
+    """Run backfill jobs by priority, `max_concurrency` at a time, under each exchange rate limiter.
+
+    `limiters` (exchange => RateLimiter) replace the exchange limiters for pauses, and are
+    acquired before each page of the jobs of their exchange (on top of the exchange limiter).
+
+    Pages are passed to `on_page(job, page)` (a coroutine) as they are received.
+    A job that hits a rate limit (or exchange unavailable) error pauses its exchange
+    (its rate limiter) for the `sleep` of the error, then resumes from its cursor (up to `max_attempts` times).
+    """
+
+    def __init__(
+            self,
+            on_page: typing.Callable[[BackfillJob, Result], typing.Awaitable[None]],
+            max_concurrency: int = 8,
+            limiters: typing.Optional[typing.Mapping[str, RateLimiter]] = None,
+            checkpoint: typing.Optional[str] = None,
+            max_attempts: int = 5,
+            max_backoff: float = 60.,
+        ):
+
+        self.on_page = on_page
+        self.max_concurrency = max_concurrency
+        self.max_attempts = max_attempts
+        self.max_backoff = max_backoff
+        self.checkpoint = Checkpoint(checkpoint)
+
+        defaults = exchange_limiters()
+        self.limiters = dict(limiters) if limiters is not None else defaults
+        # limiters of the caller, acquired before each page (exchange limiters already pace the requests)
+        self._page_limiters = {
+            exchange: limiter for exchange, limiter in self.limiters.items()
+            if limiter is not defaults.get(exchange)
+        }
+
+        self._queue: typing.List[typing.Tuple[int, int, BackfillJob]] = []
+        self._seq = itertools.count()
+        self._jobs: typing.Dict[str, BackfillJob] = {}
+        self._progress: typing.Dict[str, JobProgress] = {}
+        self._histories: typing.Dict[str, History] = {}
+
+        self.requests = 0
+        self.backoffs = 0
+        self._started: typing.Optional[float] = None
+
+
+    def add(self, job: BackfillJob):
+
+        if job.key in self._jobs:
+            raise ValueError(f"Duplicate backfill job {job.key}")
+        if job.exchange not in self.limiters:
+            raise ValueError(f"No rate limiter for exchange {job.exchange}")
+
+        self._jobs[job.key] = job
+
+        if self.checkpoint.is_done(job.key):
+            self._progress[job.key] = JobProgress(self.checkpoint.cursor(job.key), 0, 0, 0, "done", 1.)
+            return
+
+        self._progress[job.key] = JobProgress(self.checkpoint.cursor(job.key), 0, 0, 0, "pending", None)
+        heapq.heappush(self._queue, (job.priority, next(self._seq), job))
+
+
+    async def run(self) -> BackfillStats:
+        """Run all added jobs, returns once all are done or failed.
+        """
+
+        self._started = time.monotonic()
+
+        workers = Scheduler()
+        for i in range(self.max_concurrency):
+            workers.schedule(self._worker(), name=f"backfill-worker-{i}")
+        await workers.join()
+
+        return self.stats()
+
+
+    async def _worker(self):
+
+        while self._queue:
+            _, _, job = heapq.heappop(self._queue)
+            await self._run_job(job)
+
+
+    async def _run_job(self, job: BackfillJob):
+
+        limiter = self.limiters[job.exchange]
+        progress = self._progress[job.key]
+
+        while True:
+            start = progress.cursor if progress.cursor is not None else job.start
+            progress = progress._replace(state="running", attempts=progress.attempts + 1)
+            self._progress[job.key] = progress
+
+            history = job.history(start, job.end)
+            # pacing is done by the exchange limiter, in the requests of the history
+            history.min_interval = 0.
+            if job.exchange in self._page_limiters:
+                history.limiter = _PageLimiter(self._page_limiters[job.exchange], job.endpoint)
+            self._histories[job.key] = history
+
+            error = None
+            try:
+                async for page in history:
+                    if page.is_err():
+                        error = page.value
+                        break
+
+                    progress = progress._replace(
+                        cursor=history.cursor,
+                        pages=progress.pages + 1,
+                        items=progress.items + len(getattr(page.value, history.items_field)),
+                        done_ratio=self._done_ratio(job, history.cursor)
+                    )
+                    self._progress[job.key] = progress
+                    self.checkpoint.update(job.key, history.cursor)
+                    await self.on_page(job, page)
+
+            except Exception as e:
+                error = e
+
+            self.requests += history.requests
+
+            if error is None:
+                self._progress[job.key] = progress._replace(state="done", done_ratio=1.)
+                self.checkpoint.update(job.key, progress.cursor, done=True)
+                return
+
+            sleep = self._backoff(error)
+            if sleep is None or progress.attempts >= self.max_attempts:
+                self._progress[job.key] = progress._replace(state="failed")
+                return
+
+            self.backoffs += 1
+            limiter.pause(sleep, job.endpoint)
+
+
+    def _backoff(self, error: typing.Any) -> typing.Optional[float]:
+
+        if isinstance(error, httpx.HTTPError):
+            return _NETWORK_ERROR_SLEEP
+
+        # kraken returns a tuple of errors, other exchanges a single one
+        errors = error if isinstance(error, (tuple, list)) else (error, )
+        sleeps = [
+            getattr(e, "sleep", self.max_backoff)
+            for e in errors if isinstance(e, _BACKOFF_ERRORS)
+        ]
+        if not sleeps:
+            return None
+        return min(max(sleeps), self.max_backoff)
+
+
+    @staticmethod
+    def _done_ratio(job: BackfillJob, cursor: typing.Optional[ntypes.TIMESTAMP]) -> typing.Optional[float]:
+
+        if job.end is None or cursor is None or job.end <= job.start:
+            return None
+        return min(1., float(cursor - job.start) / (job.end - job.start))
+
+
+    def progress(self) -> typing.Dict[str, JobProgress]:
+        return dict(self._progress)
+
+
+    def stats(self) -> BackfillStats:
+
+        states = [p.state for p in self._progress.values()]
+        running_requests = sum(
+            history.requests for key, history in self._histories.items()
+            if self._progress[key].state == "running"
+        )
+
+        return BackfillStats(
+            len(self._jobs),
+            states.count("pending"),
+            states.count("running"),
+            states.count("done"),
+            states.count("failed"),
+            sum(p.pages for p in self._progress.values()),
+            sum(p.items for p in self._progress.values()),
+            self.requests + running_requests,
+            self.backoffs,
+            time.monotonic() - self._started if self._started is not None else 0.
+        )
@@ -0,0 +1,234 @@
+import asyncio
+import typing
+from collections import OrderedDict, deque
+
+from noobit_markets.base.queues import QUEUE_POLICY, QueueStats
+
+
+# Single producer, many consumers: messages are written once in a ring buffer
+# and each subscriber reads them through its own cursor, so all subscribers get
+# the same message objects (no copy, no queue per consumer).
+#
+# policies (see QUEUE_POLICY), applied to each subscriber:
+#   block: producer waits until the slowest subscriber has read the oldest message
+#   drop_oldest: a subscriber more than `capacity` messages behind skips the overwritten ones
+#   conflate: like drop_oldest, but a lagging subscriber reads pending messages
+#             conflated by key (merged with `merge` if given, else latest wins)
+
+
+
+
+# ============================================================
+# SUBSCRIBER
+# ============================================================
+
+
+class Subscriber:
+
+    __slots__ = ("_broadcast", "cursor", "drops", "conflated", "_pending")
+
+
+    def __init__(self, broadcast: "Broadcast"):
+        self._broadcast = broadcast
+        # sequence number of the next message to read
+        self.cursor = broadcast._head
+        self.drops = 0
+        self.conflated = 0
+        self._pending: typing.Deque = deque()
+
+
+    @property
+    def lag(self) -> int:
+        return self._broadcast._head - self.cursor + len(self._pending)
+
+
+    async def get(self) -> typing.Any:
+
+        if self._pending:
+            return self._pending.popleft()
+
+        bc = self._broadcast
+        while self.cursor == bc._head:
+            await bc._wait_publish()
+
+        lag = bc._head - self.cursor
+        if lag > bc.capacity:
+            # overwritten while we were behind
+            self.drops += lag - bc.capacity
+            bc.drops += lag - bc.capacity
+            self.cursor = bc._head - bc.capacity
+            lag = bc.capacity
+
+        if bc.policy == "conflate" and lag > 1:
+            return self._get_conflated()
+
+        msg = bc._buffer[self.cursor % bc.capacity]
+        self.cursor += 1
+        bc._notify_space()
+        return msg
+
+
+    def _get_conflated(self) -> typing.Any:
+
+        bc = self._broadcast
+
+        latest: typing.MutableMapping[typing.Hashable, typing.Any] = OrderedDict()
+        for seq in range(self.cursor, bc._head):
+            msg = bc._buffer[seq % bc.capacity]
+            key = bc.key(msg)
+            if key in latest and bc.merge:
+                latest[key] = bc.merge(latest[key], msg)
+            else:
+                latest[key] = msg
+
+        count = bc._head - self.cursor
+        self.conflated += count - len(latest)
+        bc.conflated += count - len(latest)
+
+        self.cursor = bc._head
+        bc._notify_space()
+
+        self._pending.extend(latest.values())
+        return self._pending.popleft()
+
+
+    def close(self):
+        self._broadcast._subscribers.discard(self)
+        self._broadcast._notify_space()
+
+
+    def __aiter__(self):
+        return self
+
+
+    async def __anext__(self):
+        return await self.get()
+
+
+
+
+# ============================================================
+# BROADCAST
+# ============================================================
+
+
+class Broadcast:
+    """Fan-out of one message stream to any number of subscribers.
+
+    Has the same `put` coroutine as FeedQueue, so the router can publish to it,
+    consumers call `subscribe` and only receive messages published after that.
+    """
+
+    def __init__(
+            self,
+            capacity: int = 1024,
+            policy: QUEUE_POLICY = "block",
+            key: typing.Optional[typing.Callable[[typing.Any], typing.Hashable]] = None,
+            merge: typing.Optional[typing.Callable[[typing.Any, typing.Any], typing.Any]] = None,
+        ):
+
+        if policy == "conflate" and key is None:
+            raise ValueError("conflate policy requires a key function")
+
+        self.capacity = capacity
+        self.policy = policy
+        self.key = key
+        self.merge = merge
+
+        self._buffer: typing.List[typing.Any] = [None] * capacity
+        # sequence number of the next message
+        self._head = 0
+        # messages before this one have been read by all subscribers (and released)
+        self._tail = 0
+        self._subscribers: typing.Set[Subscriber] = set()
+
+        # one future per waiting subscriber (a shared one would be cancelled with any of them)
+        self._publish_waiters: typing.List[asyncio.Future] = []
+        self._space_waiter: typing.Optional[asyncio.Future] = None
+
+        self.puts = 0
+        self.drops = 0
+        self.conflated = 0
+        self.high_water = 0
+
+
+    def subscribe(self) -> Subscriber:
+
+        sub = Subscriber(self)
+        self._subscribers.add(sub)
+        return sub
+
+
+    def _max_lag(self) -> int:
+        return self._head - min((sub.cursor for sub in self._subscribers), default=self._head)
+
+
+    def _release(self) -> int:
+        """Drop references to messages read by all subscribers (so they can be freed), returns max lag.
+        """
+
+        min_cursor = min((sub.cursor for sub in self._subscribers), default=self._head)
+        for seq in range(max(self._tail, self._head - self.capacity), min_cursor):
+            self._buffer[seq % self.capacity] = None
+        self._tail = max(self._tail, min_cursor)
+        return self._head - min_cursor
+
+
+    async def _wait_publish(self):
+
+        waiter = asyncio.get_event_loop().create_future()
+        self._publish_waiters.append(waiter)
+        try:
+            await waiter
+        except asyncio.CancelledError:
+            if waiter in self._publish_waiters:
+                self._publish_waiters.remove(waiter)
+            raise
+
+
+    def _notify_space(self):
+
+        if self._space_waiter is not None and self._max_lag() < self.capacity:
+            self._space_waiter.set_result(None)
+            self._space_waiter = None
+
+
+    def put_nowait(self, msg: typing.Any):
+
+        self._buffer[self._head % self.capacity] = msg
+        self._head += 1
+        self.puts += 1
+
+        if self._publish_waiters:
+            for waiter in self._publish_waiters:
+                if not waiter.done():
+                    waiter.set_result(None)
+            self._publish_waiters.clear()
+
+
+    async def put(self, msg: typing.Any):
+
+        if self.policy == "block":
+            while self._max_lag() >= self.capacity:
+                if self._space_waiter is None:
+                    self._space_waiter = asyncio.get_event_loop().create_future()
+                await asyncio.shield(self._space_waiter)
+
+        self.put_nowait(msg)
+        self.high_water = max(self.high_water, min(self._release(), self.capacity))
+
+
+    def stats(self) -> QueueStats:
+        return QueueStats(
+            self.policy,
+            self.capacity,
+            min(self._max_lag(), self.capacity),
+            self.high_water,
+            self.puts,
+            self.drops,
+            self.conflated
+        )
+
+
+    def __repr__(self) -> str:
+        return f"Broadcast(policy={self.policy}, capacity={self.capacity}, subscribers={len(self._subscribers)})"
@@ -0,0 +1,75 @@
+import os
+import json
+import typing
+from decimal import Decimal
+
+
+# json backend is selected once, at import time:
+#   orjson > ujson > stdlib json
+# set NOOBIT_JSON_CODEC=json (or ujson) to force a given backend
+_PREFERRED = os.environ.get("NOOBIT_JSON_CODEC", None)
+
+
+def _select_backend(preferred: typing.Optional[str]) -> str:
+
+    candidates = ["orjson", "ujson", "json"]
+    if preferred in candidates:
+        candidates = candidates[candidates.index(preferred):]
+
+    for name in candidates:
+        try:
+            __import__(name)
+            return name
+        except ImportError:
+            continue
+
+    return "json"
+
+
+JSON_CODEC = _select_backend(_PREFERRED)
+
+
+if JSON_CODEC == "orjson":
+    import orjson
+
+    _loads = orjson.loads
+
+    def _dumps(obj: typing.Any) -> str:
+        return orjson.dumps(obj).decode()
+
+elif JSON_CODEC == "ujson":
+    import ujson
+
+    _loads = ujson.loads
+    _dumps = ujson.dumps
+
+else:
+    _loads = json.loads
+    _dumps = json.dumps
+
+
+
+
+# ============================================================
+# CODEC
+# ============================================================
+
+
+def loads(s: typing.Union[str, bytes], decimal: bool = False) -> typing.Any:
+    """Decode json string or bytes.
+
+    With `decimal=True`, json numbers with a fractional part are decoded
+    straight to `Decimal` (never going through float, which only keeps ~17 digits).
+    Only stdlib json supports this, so it is slower than the default path: use it
+    for payloads that carry prices as numbers (ftx), prices sent as strings
+    (kraken, binance) are already validated to Decimal without loss.
+    """
+
+    if decimal:
+        return json.loads(s, parse_float=Decimal)
+
+    return _loads(s)
+
+
+def dumps(obj: typing.Any) -> str:
+    return _dumps(obj)
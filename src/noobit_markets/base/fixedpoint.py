@@ -0,0 +1,103 @@
+import functools
+import typing
+from decimal import Decimal
+
+from noobit_markets.base import ntypes
+from noobit_markets.base.models.rest.response import NoobitResponseItemSymbols, NoobitResponseSymbols
+
+
+# Prices and volumes as int64 scaled by 10**decimals of the symbol
+# (`price_decimals` and `volume_decimals` of NoobitResponseItemSymbols):
+#   "5541.3" with 2 price decimals => 554130
+#
+# Ints hash and compare much faster than Decimals, and the conversion is exact
+# both ways: a value with more decimals than the scale raises instead of being rounded.
+# (round trip gives back an equal Decimal, with the precision of the scale, eg 5541.30)
+
+
+
+
+# ============================================================
+# CONVERSION
+# ============================================================
+
+
+# price levels come back again and again in book updates, conversions are cached
+@functools.lru_cache(maxsize=2**16)
+def to_scaled(value: typing.Union[str, Decimal, int, float], decimals: int) -> int:
+    """Exact conversion to a scaled int, raises ValueError if value has more than `decimals` decimals.
+    """
+
+    if isinstance(value, int):
+        return value * 10**decimals
+
+    if isinstance(value, str) and "e" not in value and "E" not in value:
+        # fast path for exchange strings, without going through Decimal
+        sign = 1
+        if value[:1] == "-":
+            sign, value = -1, value[1:]
+        whole, _, frac = value.partition(".")
+        if len(frac) == decimals:
+            return sign * int(whole + frac)
+        if len(frac) > decimals:
+            if frac[decimals:].strip("0"):
+                raise ValueError(f"{value} has more than {decimals} decimals")
+            frac = frac[:decimals]
+        return sign * int((whole + frac.ljust(decimals, "0")) or "0")
+
+    if isinstance(value, float):
+        # shortest repr, so that 0.1 is not 0.1000000000000000055...
+        value = repr(value)
+
+    scaled = Decimal(value).scaleb(decimals)
+    if scaled != scaled.to_integral_value():
+        raise ValueError(f"{value} has more than {decimals} decimals")
+    return int(scaled)
+
+
+def from_scaled(value: int, decimals: int) -> Decimal:
+    return Decimal(value).scaleb(-decimals)
+
+
+
+
+# ============================================================
+# SCALE
+# ============================================================
+
+
+class Scale(typing.NamedTuple):
+    """Decimals of prices and volumes of a symbol.
+    """
+
+    price_decimals: int
+    volume_decimals: int
+
+
+    @classmethod
+    def from_symbol(cls, item: NoobitResponseItemSymbols) -> "Scale":
+        return cls(item.price_decimals, item.volume_decimals)
+
+
+    def price(self, value: typing.Union[str, Decimal, int, float]) -> int:
+        return to_scaled(value, self.price_decimals)
+
+
+    def volume(self, value: typing.Union[str, Decimal, int, float]) -> int:
+        return to_scaled(value, self.volume_decimals)
+
+
+    def price_decimal(self, value: int) -> Decimal:
+        return from_scaled(value, self.price_decimals)
+
+
+    def volume_decimal(self, value: int) -> Decimal:
+        return from_scaled(value, self.volume_decimals)
+
+
+def scales_from_symbols(symbols: NoobitResponseSymbols) -> typing.Dict[ntypes.SYMBOL, Scale]:
+
+    return {
+        symbol: Scale.from_symbol(item)
+        for symbol, item in symbols.asset_pairs.items()
+    }
@@ -0,0 +1,173 @@
+import time
+import typing
+import asyncio
+from collections import Counter
+
+from noobit_markets.base import ntypes
+from noobit_markets.base.models.result import Result, Ok, Err
+
+
+# Backfill of [start, end) by walking the `since` cursor of a getter:
+# each page starts at the cursor returned by the exchange (kraken `last`), or else at the
+# time of the last item of the previous page, so pages overlap by (at least) the items at
+# that time, which are dropped the second time they are seen.
+# Only this overlap is deduplicated, by counting items (kraken trades have no id, two identical
+# fills in the same millisecond are two trades): an item is dropped as many times as the
+# previous page had it after the cursor, never within a page.
+#
+# `end` is capped at the time the iteration starts, and candles that are still open
+# (last candle of a page) are held back until a later page has them closed,
+# so the iteration always ends once it has caught up with the exchange.
+#
+# Pages are yielded as soon as they are received, with the same type as the getter
+# (NoobitResponseTrades, NoobitResponseOhlc), only keeping new items within the range.
+
+
+
+
+# ============================================================
+# STATS
+# ============================================================
+
+
+class HistoryStats(typing.NamedTuple):
+    requests: int
+    items: int
+    duplicates: int
+    # noobit timestamp (ms) up to which history was covered
+    cursor: typing.Optional[ntypes.TIMESTAMP]
+
+
+
+
+# ============================================================
+# HISTORY
+# ============================================================
+
+
+def _item_key(item: typing.Any) -> typing.Tuple:
+    # records and pydantic items both iterate over (field, value)
+    return tuple(value for _, value in (item.items() if isinstance(item, typing.Mapping) else item))
+
+
+class History:
+    """Async iterator over the pages of `fetch_page` covering [start, end).
+
+    `fetch_page(since)` is a coroutine returning a Result of a response with
+    an `items_field` tuple, whose items have a `time_field` noobit timestamp (ms).
+    `cursor(response)` returns the `since` of the next page (default: time of the last item).
+    With `hold_last`, the last item of each page is only yielded by the next page (open candle).
+    Requests are spaced by at least `min_interval` seconds (rate limit of the endpoint).
+    Items redelivered after the cursor are deduplicated on `key` (all their values by default),
+    as a multiset against the previous page.
+    The iteration stops at `end` (or once caught up with the exchange), and after yielding an Err.
+    """
+
+    def __init__(
+            self,
+            fetch_page: typing.Callable[[ntypes.TIMESTAMP], typing.Awaitable[Result]],
+            start: ntypes.TIMESTAMP,
+            end: typing.Optional[ntypes.TIMESTAMP] = None,
+            items_field: str = "trades",
+            time_field: str = "transactTime",
+            min_interval: float = 0.,
+            max_pages: typing.Optional[int] = None,
+            key: typing.Callable[[typing.Any], typing.Hashable] = _item_key,
+            limiter: typing.Optional[typing.Any] = None,
+            cursor: typing.Optional[typing.Callable[[typing.Any], typing.Optional[ntypes.TIMESTAMP]]] = None,
+            hold_last: bool = False,
+        ):
+
+        self.fetch_page = fetch_page
+        self.start = start
+        self.end = end
+        self.items_field = items_field
+        self.time_field = time_field
+        self.min_interval = min_interval
+        self.max_pages = max_pages
+        self.key = key
+        # shared with other histories: `await limiter.acquire()` before each request
+        self.limiter = limiter
+        self.cursor_of = cursor
+        self.hold_last = hold_last
+
+        self.requests = 0
+        self.items = 0
+        self.duplicates = 0
+        # `since` of the next page: history is complete up to it
+        self.cursor: typing.Optional[ntypes.TIMESTAMP] = None
+
+
+    def stats(self) -> HistoryStats:
+        return HistoryStats(self.requests, self.items, self.duplicates, self.cursor)
+
+
+    async def __aiter__(self) -> typing.AsyncIterator[Result]:
+
+        # nothing after now can be closed yet
+        now = int(time.time() * 10**3)
+        end = now if self.end is None else min(self.end, now)
+
+        since = self.start
+        # key => count of the items of the previous page at or after `since`, which the next page returns again
+        overlap: typing.Counter[typing.Hashable] = Counter()
+        last_request = None
+
+        while since < end and (self.max_pages is None or self.requests < self.max_pages):
+
+            if last_request is not None:
+                wait = last_request + self.min_interval - time.monotonic()
+                if wait > 0:
+                    await asyncio.sleep(wait)
+
+            if self.limiter is not None:
+                await self.limiter.acquire()
+
+            last_request = time.monotonic()
+            self.requests += 1
+            result = await self.fetch_page(since)
+
+            if result.is_err():
+                yield result
+                return
+
+            received = getattr(result.value, self.items_field)
+            items = [item for item in received if since <= getattr(item, self.time_field) < end]
+
+            held_time = None
+            if self.hold_last and items:
+                # only the last item the exchange returned can still be open
+                last_time = max(getattr(item, self.time_field) for item in received)
+                if last_time < end:
+                    held_time = last_time
+                    items = [item for item in items if getattr(item, self.time_field) != held_time]
+
+            new_items = []
+            for item in items:
+                key = self.key(item)
+                if overlap[key] > 0:
+                    overlap[key] -= 1
+                    self.duplicates += 1
+                    continue
+                new_items.append(item)
+
+            if not new_items:
+                # nothing (closed) after the cursor: caught up with the exchange
+                return
+
+            if held_time is not None:
+                next_since = held_time
+            else:
+                next_since = max(getattr(item, self.time_field) for item in new_items)
+                if self.cursor_of is not None:
+                    cursor = self.cursor_of(result.value)
+                    if cursor is not None:
+                        next_since = max(cursor, since)
+
+            self.items += len(new_items)
+            self.cursor = next_since
+            yield Ok(result.value.copy(update={self.items_field: tuple(new_items)}))
+
+            since = next_since
+            # the next page starts with all the items of this one at or after `since`
+            overlap = Counter(self.key(item) for item in items if getattr(item, self.time_field) >= since)
@@ -0,0 +1,84 @@
+import typing
+from collections import OrderedDict
+from functools import wraps
+
+from noobit_markets.base import ntypes
+from noobit_markets.base.models.frozenbase import FrozenBaseModel
+
+
+
+
+# ============================================================
+# MODEL CACHE
+# ============================================================
+
+
+class CacheInfo(typing.NamedTuple):
+    hits: int
+    misses: int
+    maxsize: int
+    currsize: int
+
+    @property
+    def hit_rate(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.
+
+
+class ModelCache:
+    """Bounded LRU for dynamically created response models.
+
+    Models are keyed by (exchange symbol, model kind), since the exchange
+    symbol is the only thing that changes between two generated models of a kind.
+    """
+
+    def __init__(self, maxsize: int = 1024):
+        self.maxsize = maxsize
+        self._models: typing.MutableMapping[typing.Tuple[str, str], FrozenBaseModel] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+
+    def get(self, key: typing.Tuple[str, str], factory: typing.Callable[[], FrozenBaseModel]) -> FrozenBaseModel:
+
+        try:
+            model = self._models[key]
+            self._models.move_to_end(key)
+            self.hits += 1
+            return model
+        except KeyError:
+            pass
+
+        self.misses += 1
+        model = factory()
+        self._models[key] = model
+        if len(self._models) > self.maxsize:
+            self._models.popitem(last=False)
+        return model
+
+
+    def info(self) -> CacheInfo:
+        return CacheInfo(self.hits, self.misses, self.maxsize, len(self._models))
+
+
+    def clear(self):
+        self._models.clear()
+        self.hits = 0
+        self.misses = 0
+
+
+# shared by all exchanges
+MODEL_CACHE = ModelCache()
+
+
+def cached_model(kind: str, cache: ModelCache = MODEL_CACHE) -> typing.Callable:
+    """Memoize a `make_<exchange>_model_<kind>(symbol, symbol_mapping)` factory.
+    """
+
+    def decorator(factory: typing.Callable) -> typing.Callable:
+        @wraps(factory)
+        def wrapper(symbol: ntypes.SYMBOL, symbol_mapping: ntypes.SYMBOL_TO_EXCHANGE) -> FrozenBaseModel:
+            key = (symbol_mapping[symbol], kind)
+            return cache.get(key, lambda: factory(symbol, symbol_mapping))
+        return wrapper
+    return decorator
@@ -1,11 +1,15 @@
 import typing
 import asyncio
+import inspect
+from functools import wraps
 
 import pydantic
 
 from noobit_markets.base.models.rest import endpoints
 from noobit_markets.base.models.frozenbase import FrozenBaseModel
 from noobit_markets.base import ntypes
+from noobit_markets.base.models.result import Result, Ok
+from noobit_markets.base.models.trusted import validate_level
 
 from noobit_markets.base.auth import BaseAuth as Auth
 
@@ -15,7 +19,9 @@ from noobit_markets.base.models.rest.response import (
     NoobitResponseOrderBook,
     NoobitResponseSymbols,
     NoobitResponseBalances,
-    NoobitResponseExposure
+    NoobitResponseExposure,
+    NoobitResponseInstrument,
+    NoobitResponseSpread
 )
 
 
@@ -122,6 +128,33 @@ class _PublicInterface(FrozenBaseModel):
         NoobitResponseOhlc
     ]
 
+    # single request for many symbols, not available on all exchanges
+    instruments: typing.Optional[typing.Callable[
+        #argument types
+        [
+            ntypes.CLIENT,
+            typing.Iterable[ntypes.SYMBOL],
+            ntypes.SYMBOL_TO_EXCHANGE,
+            pydantic.AnyHttpUrl,
+            str
+        ],
+        # return type
+        typing.Mapping[ntypes.SYMBOL, NoobitResponseInstrument]
+    ]] = None
+
+    spreads: typing.Optional[typing.Callable[
+        #argument types
+        [
+            ntypes.CLIENT,
+            typing.Iterable[ntypes.SYMBOL],
+            ntypes.SYMBOL_TO_EXCHANGE,
+            pydantic.AnyHttpUrl,
+            str
+        ],
+        # return type
+        typing.Mapping[ntypes.SYMBOL, NoobitResponseSpread]
+    ]] = None
+
 # ============================================================
 # REST PRIVATE ENDPOINTS
 # ============================================================
@@ -244,4 +277,45 @@ class WsInterface(FrozenBaseModel):
 class ExchangeInterface(FrozenBaseModel):
 
     rest: RestInterface
-    ws: WsInterface 
\ No newline at end of file
+    ws: WsInterface 
+
+
+
+# ============================================================
+# VALIDATION LEVEL
+# ============================================================
+
+
+def with_validation(interface: ExchangeInterface, validation: ntypes.VALIDATION) -> Result[ExchangeInterface, ValueError]:
+    """Copy of `interface` where public rest endpoints default to given validation level.
+
+    Only applies to endpoints that accept a `validation` argument, the others are left as is.
+    """
+
+    valid_level = validate_level(validation)
+    if valid_level.is_err():
+        return valid_level
+
+    def _wrap(func):
+        if func is None:
+            return func
+
+        signature = inspect.signature(func)
+        if "validation" not in signature.parameters:
+            return func
+
+        @wraps(func)
+        async def wrapper(*args, **kwargs):
+            # level passed by the caller (as keyword or positional) takes precedence
+            if "validation" not in signature.bind_partial(*args, **kwargs).arguments:
+                kwargs["validation"] = validation
+            return await func(*args, **kwargs)
+
+        return wrapper
+
+    public = {key: _wrap(func) for key, func in interface.rest.public}
+
+    return Ok(ExchangeInterface(
+        rest={"public": public, "private": interface.rest.private},
+        ws=interface.ws
+    ))
@@ -0,0 +1,118 @@
+import time
+import typing
+
+from pydantic import BaseModel, ValidationError
+
+from noobit_markets.base.models.result import Result, Ok, Err
+from noobit_markets.base.models.rest.records import BaseRecord
+
+
+
+
+# ============================================================
+# LAZY VIEW
+# ============================================================
+
+
+def _plain(value: typing.Any) -> typing.Any:
+    # nested models and records back to dicts, so that they get validated too
+    if isinstance(value, BaseModel):
+        return value.dict()
+    if isinstance(value, BaseRecord):
+        return dict(value)
+    if isinstance(value, (tuple, list)):
+        return [_plain(item) for item in value]
+    return value
+
+
+class WsView:
+    """Read only view of a ws frame, with the same fields as `model`.
+
+    Nothing is parsed when the view is created: each field is decoded on first
+    access by the `_decode_<field>` method of the subclass (fields without a decoder
+    have their model default), then cached.
+    The pydantic model is only built (and validated) by `validate`.
+
+    Since fields are not validated, accessing a field of a malformed frame raises,
+    use `validate` to get a Result instead.
+    """
+
+    model: typing.Type[BaseModel]
+
+    __slots__ = ("rawJson", "received", "_fields", "_validated")
+
+
+    def __init__(
+            self,
+            frame: typing.Any,
+            received: typing.Optional[int] = None,
+            fields: typing.Optional[typing.Mapping[str, typing.Any]] = None
+        ):
+
+        self.rawJson = frame
+        # ms timestamp
+        self.received = received if received is not None else int(time.time() * 10**3)
+        self._fields: typing.Dict[str, typing.Any] = dict(fields) if fields else {}
+        self._validated: typing.Optional[Result] = None
+
+
+    def __getattr__(self, name: str) -> typing.Any:
+
+        # only called for names that are not slots (= model fields)
+        if name.startswith("_"):
+            raise AttributeError(name)
+
+        try:
+            return self._fields[name]
+        except KeyError:
+            pass
+
+        decoder = getattr(type(self), f"_decode_{name}", None)
+        if decoder is not None:
+            value = decoder(self)
+        elif name in self.model.__fields__:
+            value = self.model.__fields__[name].default
+        else:
+            raise AttributeError(f"{type(self).__name__} has no field {name}")
+
+        self._fields[name] = value
+        return value
+
+
+    def copy(self, update: typing.Optional[typing.Mapping[str, typing.Any]] = None) -> "WsView":
+        """Same signature as pydantic's `copy`, used to merge messages.
+        """
+
+        update = dict(update or {})
+        frame = update.pop("rawJson", self.rawJson)
+        return type(self)(frame, self.received, {**self._fields, **update})
+
+
+    def dict(self) -> typing.Dict[str, typing.Any]:
+        return {name: getattr(self, name) for name in self.model.__fields__}
+
+
+    def validate(self) -> Result:
+        """Build the full pydantic model (only once).
+        """
+
+        if self._validated is None:
+            try:
+                values = {name: _plain(value) for name, value in self.dict().items()}
+                values["rawJson"] = self.rawJson
+                self._validated = Ok(self.model(**values))
+            except ValidationError as e:
+                self._validated = Err(e)
+
+        return self._validated
+
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self.rawJson!r})"
+
+
+def model_type(value: typing.Any) -> typing.Type:
+    """Model class of a pydantic model or of a view.
+    """
+
+    return value.model if isinstance(value, WsView) else type(value)
@@ -0,0 +1,201 @@
+import typing
+from array import array
+from decimal import Decimal
+
+from noobit_markets.base import ntypes
+from noobit_markets.base.fixedpoint import Scale
+from noobit_markets.base.models.rest.response import NoobitResponseOhlc, NoobitResponseTrades
+
+
+# Struct-of-arrays alternatives to NoobitResponseOhlc and NoobitResponseTrades.
+# Columns are stdlib arrays (no per-row object), so they can be handed to numpy
+# without copy (see `to_numpy`), and converted to the row based model on demand.
+#
+# typecodes:
+#   q: int64 (timestamps in ms, counts)
+#   d: float64 (prices, volumes)
+#   b: int8 (enums, see below)
+#
+# if a Scale is given, price and volume columns are exact scaled ints (q) instead of floats
+
+SIDE_BUY, SIDE_SELL = 1, -1
+ORDTYPE_MARKET, ORDTYPE_LIMIT = 1, 0
+
+
+
+
+# ============================================================
+# BASE
+# ============================================================
+
+
+def transpose(rows: typing.Sequence[typing.Sequence], ncols: int) -> typing.List[tuple]:
+    """Rows of raw json arrays to columns (single pass in C through zip).
+    """
+
+    if not rows:
+        return [()] * ncols
+    return list(zip(*rows))
+
+
+class _NoobitColumns:
+
+    # column name => array typecode
+    _columns: typing.Mapping[str, str] = {}
+    # price and volume columns, floats or scaled ints
+    _prices: typing.Tuple[str, ...] = ()
+    _volumes: typing.Tuple[str, ...] = ()
+
+    __slots__ = ("symbol", "rawJson", "scale")
+
+
+    def __init__(
+            self,
+            symbol: ntypes.SYMBOL,
+            rawJson: typing.Any = None,
+            scale: typing.Optional[Scale] = None,
+            **columns: typing.Iterable
+        ):
+        """Price and volume columns can be passed as exchange strings, Decimals or floats.
+        """
+
+        self.symbol = symbol
+        self.rawJson = rawJson
+        self.scale = scale
+
+        for name, typecode in self._columns.items():
+            values = columns.get(name, ())
+            if name in self._prices or name in self._volumes:
+                if scale is None:
+                    values = map(float, values)
+                else:
+                    typecode = "q"
+                    values = map(scale.price if name in self._prices else scale.volume, values)
+            setattr(self, name, array(typecode, values))
+
+        lengths = {len(getattr(self, name)) for name in self._columns}
+        if len(lengths) > 1:
+            raise ValueError(f"Columns have different lengths: {lengths}")
+
+
+    def __len__(self) -> int:
+        return len(getattr(self, next(iter(self._columns))))
+
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}(symbol={self.symbol}, rows={len(self)})"
+
+
+    def _price(self, value: typing.Union[float, int]) -> Decimal:
+        return Decimal(repr(value)) if self.scale is None else self.scale.price_decimal(value)
+
+
+    def _volume(self, value: typing.Union[float, int]) -> Decimal:
+        return Decimal(repr(value)) if self.scale is None else self.scale.volume_decimal(value)
+
+
+    def to_numpy(self) -> typing.Mapping[str, typing.Any]:
+        """Zero-copy numpy views of each column (numpy is an optional dependency).
+        """
+
+        try:
+            import numpy as np
+        except ImportError as e:
+            raise ImportError("to_numpy requires numpy to be installed") from e
+
+        return {
+            name: np.frombuffer(getattr(self, name), dtype=getattr(self, name).typecode)
+            for name in self._columns
+        }
+
+
+
+
+# ============================================================
+# OHLC
+# ============================================================
+
+
+class NoobitColumnsOhlc(_NoobitColumns):
+
+    _columns = {
+        "utcTime": "q",
+        "open": "d",
+        "high": "d",
+        "low": "d",
+        "close": "d",
+        "volume": "d",
+        "trdCount": "q",
+    }
+    _prices = ("open", "high", "low", "close")
+    _volumes = ("volume", )
+
+    __slots__ = tuple(_columns)
+
+
+    def to_model(self) -> NoobitResponseOhlc:
+
+        ohlc = [
+            {
+                "symbol": self.symbol,
+                "utcTime": utc_time,
+                "open": self._price(o),
+                "high": self._price(h),
+                "low": self._price(l),
+                "close": self._price(c),
+                "volume": self._volume(v),
+                "trdCount": count
+            }
+            for utc_time, o, h, l, c, v, count in zip(
+                self.utcTime, self.open, self.high, self.low, self.close, self.volume, self.trdCount
+            )
+        ]
+
+        return NoobitResponseOhlc(ohlc=ohlc, rawJson=self.rawJson)
+
+
+
+
+# ============================================================
+# TRADES
+# ============================================================
+
+
+class NoobitColumnsTrades(_NoobitColumns):
+
+    _columns = {
+        "transactTime": "q",
+        # SIDE_BUY / SIDE_SELL
+        "side": "b",
+        # ORDTYPE_MARKET / ORDTYPE_LIMIT
+        "ordType": "b",
+        "avgPx": "d",
+        "cumQty": "d",
+    }
+    _prices = ("avgPx", )
+    _volumes = ("cumQty", )
+
+    __slots__ = tuple(_columns)
+
+
+    def to_model(self) -> NoobitResponseTrades:
+
+        trades = []
+        for transact_time, side, ord_type, px, qty in zip(
+                self.transactTime, self.side, self.ordType, self.avgPx, self.cumQty
+            ):
+            avg_px, cum_qty = self._price(px), self._volume(qty)
+            trades.append({
+                "symbol": self.symbol,
+                "orderID": None,
+                "trdMatchID": None,
+                "transactTime": transact_time,
+                "side": "buy" if side == SIDE_BUY else "sell",
+                "ordType": "market" if ord_type == ORDTYPE_MARKET else "limit",
+                "avgPx": avg_px,
+                "cumQty": cum_qty,
+                "grossTradeAmt": avg_px * cum_qty,
+                "text": None
+            })
+
+        return NoobitResponseTrades(trades=trades, rawJson=self.rawJson)
@@ -0,0 +1,156 @@
+import typing
+
+from pydantic import BaseModel, ValidationError
+
+from noobit_markets.base.models.result import Result, Ok, Err
+from noobit_markets.base.models.trusted import _coerce, construct_trusted
+from noobit_markets.base.models.rest.response import (
+    NoobitResponseItemOhlc,
+    NoobitResponseItemTrade,
+    NoobitResponseItemSpread,
+    NoobitResponseItemOrder,
+)
+
+
+# Compact, immutable alternatives to the pydantic response items, for holding
+# large amounts of market data in memory.
+# A record has the same fields as its model (in slots, without per instance
+# __dict__ or __fields_set__) and is a read only Mapping, so it can be passed
+# wherever the parsed pmaps were (model validation, construct_trusted).
+# Values are cast to the field type (Decimal, int) but NOT validated, missing
+# fields are None (even if required): use `validate` to get the checked model.
+
+
+
+
+# ============================================================
+# BASE
+# ============================================================
+
+
+class BaseRecord(typing.Mapping):
+
+    model: typing.ClassVar[typing.Type[BaseModel]]
+    # field name => default
+    _defaults: typing.ClassVar[typing.Mapping[str, typing.Any]] = {}
+
+    __slots__ = ()
+
+
+    def __init__(self, **values: typing.Any):
+
+        unknown = values.keys() - self._defaults.keys()
+        if unknown:
+            raise TypeError(f"{type(self).__name__} got unexpected fields {sorted(unknown)}")
+
+        fields = self.model.__fields__
+        for name, default in self._defaults.items():
+            value = values.get(name, default)
+            object.__setattr__(self, name, _coerce(fields[name], value))
+
+
+    @classmethod
+    def from_model(cls, item: BaseModel) -> "BaseRecord":
+
+        record = cls.__new__(cls)
+        for name in cls._defaults:
+            object.__setattr__(record, name, getattr(item, name))
+        return record
+
+
+    def to_model(self) -> BaseModel:
+        """Pydantic model with the same values (not validated).
+        """
+        return construct_trusted(self.model, self)
+
+
+    def validate(self) -> Result:
+
+        try:
+            return Ok(self.model(**self))
+        except ValidationError as e:
+            return Err(e)
+
+
+    def __setattr__(self, name: str, value: typing.Any):
+        raise AttributeError(f"{type(self).__name__} is immutable")
+
+
+    def __delattr__(self, name: str):
+        raise AttributeError(f"{type(self).__name__} is immutable")
+
+
+    def __getitem__(self, key: str) -> typing.Any:
+        if key not in self._defaults:
+            raise KeyError(key)
+        return getattr(self, key)
+
+
+    def __iter__(self) -> typing.Iterator[str]:
+        return iter(self._defaults)
+
+
+    def __len__(self) -> int:
+        return len(self._defaults)
+
+
+    def __hash__(self) -> int:
+        return hash(tuple(self.values()))
+
+
+    def __reduce__(self):
+        return (_rebuild, (type(self).__name__, dict(self)))
+
+
+    def __repr__(self) -> str:
+        values = ", ".join(f"{name}={getattr(self, name)!r}" for name in self._defaults)
+        return f"{type(self).__name__}({values})"
+
+
+def _make_record(name: str, model: typing.Type[BaseModel]) -> typing.Type[BaseRecord]:
+    """Record class with one slot per field of `model`.
+    """
+
+    defaults = {
+        field_name: field.default
+        for field_name, field in model.__fields__.items()
+    }
+
+    return type(name, (BaseRecord, ), {
+        "__slots__": tuple(defaults),
+        "__module__": __name__,
+        "__doc__": f"Compact record of {model.__name__}.",
+        "model": model,
+        "_defaults": defaults,
+    })
+
+
+
+
+# ============================================================
+# RECORDS
+# ============================================================
+
+
+OhlcRecord = _make_record("OhlcRecord", NoobitResponseItemOhlc)
+TradeRecord = _make_record("TradeRecord", NoobitResponseItemTrade)
+SpreadRecord = _make_record("SpreadRecord", NoobitResponseItemSpread)
+OrderRecord = _make_record("OrderRecord", NoobitResponseItemOrder)
+
+
+_RECORDS = {record.__name__: record for record in (OhlcRecord, TradeRecord, SpreadRecord, OrderRecord)}
+_BY_MODEL = {record.model: record for record in _RECORDS.values()}
+
+
+def _rebuild(name: str, values: typing.Mapping) -> BaseRecord:
+    return _RECORDS[name](**values)
+
+
+def to_records(items: typing.Iterable[BaseModel]) -> typing.Tuple[BaseRecord, ...]:
+    """Response items (for ex the `trades` of a NoobitResponseTrades) to records.
+    """
+
+    return tuple(
+        item if isinstance(item, BaseRecord) else _BY_MODEL[type(item)].from_model(item)
+        for item in items
+    )
@@ -1,7 +1,7 @@
 import typing
 from decimal import Decimal
 
-from pydantic import PositiveInt, Field
+from pydantic import PositiveInt, Field, validator, root_validator
 from typing_extensions import Literal
 
 from noobit_markets.base.models.frozenbase import FrozenBaseModel
@@ -80,6 +80,37 @@ class NoobitRequestSpread(FrozenBaseModel):
 
 
 
+
+# ============================================================
+# Multiple symbols (single request)
+# ============================================================
+
+
+class NoobitRequestInstruments(FrozenBaseModel):
+
+    symbols: typing.Tuple[ntypes.SYMBOL, ...]
+    symbol_mapping: ntypes.SYMBOL_TO_EXCHANGE
+
+    @validator("symbols")
+    def check_symbols(cls, v):
+        if not v:
+            raise ValueError("At least one symbol is required")
+        return v
+
+    @root_validator(skip_on_failure=True)
+    def check_mapping(cls, values):
+        unknown = [symbol for symbol in values["symbols"] if symbol not in values["symbol_mapping"]]
+        if unknown:
+            raise ValueError(f"Symbols not in mapping : {unknown}")
+        return values
+
+
+class NoobitRequestSpreads(NoobitRequestInstruments):
+    pass
+
+
+
+
 # ============================================================
 # Orders
 # ============================================================
@@ -0,0 +1,122 @@
+import copy
+import functools
+import typing
+from decimal import Decimal
+
+from pydantic import BaseModel
+from pydantic.fields import (
+    ModelField,
+    SHAPE_SINGLETON,
+    SHAPE_LIST,
+    SHAPE_SEQUENCE,
+    SHAPE_TUPLE_ELLIPSIS,
+    SHAPE_MAPPING,
+)
+
+from noobit_markets.base import ntypes
+from noobit_markets.base.models.result import Result, Ok, Err
+
+
+
+
+# ============================================================
+# UNCHECKED CONSTRUCTION
+# ============================================================
+
+
+def _coerce_singleton(type_: typing.Any, value: typing.Any) -> typing.Any:
+
+    if value is None:
+        return value
+
+    try:
+        if issubclass(type_, Decimal):
+            return value if isinstance(value, Decimal) else Decimal(str(value))
+        # timestamps etc, we do not check for constraints
+        if issubclass(type_, int) and isinstance(value, (str, float)):
+            return int(value)
+        if issubclass(type_, BaseModel) and isinstance(value, typing.Mapping):
+            return construct_trusted(type_, value)
+    except TypeError:
+        # type_ is not a class (Literal, Any, ...)
+        pass
+
+    return value
+
+
+def _coerce(field: ModelField, value: typing.Any) -> typing.Any:
+
+    if value is None:
+        return value
+
+    if field.shape == SHAPE_SINGLETON:
+        return _coerce_singleton(field.type_, value)
+
+    if field.shape in (SHAPE_LIST, SHAPE_SEQUENCE, SHAPE_TUPLE_ELLIPSIS):
+        return tuple(_coerce_singleton(field.type_, item) for item in value)
+
+    if field.shape == SHAPE_MAPPING:
+        return {
+            _coerce_singleton(field.key_field.type_, k): _coerce_singleton(field.type_, v)
+            for k, v in value.items()
+        }
+
+    # other shapes are passed as is
+    return value
+
+
+# defaults of these types can be shared between instances
+_IMMUTABLE = (type(None), bool, int, float, str, Decimal, frozenset)
+
+
+@functools.lru_cache(maxsize=None)
+def _split_defaults(model: typing.Type[BaseModel]) -> typing.Tuple[dict, dict]:
+
+    shared, copied = {}, {}
+    for key, value in model.__field_defaults__.items():
+        if isinstance(value, _IMMUTABLE):
+            shared[key] = value
+        else:
+            copied[key] = value
+    return shared, copied
+
+
+def construct_trusted(model: typing.Type[BaseModel], values: typing.Mapping) -> BaseModel:
+    """Build `model` from `values` without running validators.
+
+    Unlike `model.construct`, nested models are constructed too and numeric
+    values are cast to the field type (Decimal, int), so the returned instance can be
+    used the same way as a validated one. Constraints are NOT checked.
+    """
+
+    fields = model.__fields__
+    coerced = {
+        key: _coerce(fields[key], value) if key in fields else value
+        for key, value in values.items()
+    }
+
+    # same as `model.construct`, without deep copying immutable defaults
+    shared, copied = _split_defaults(model)
+    m = model.__new__(model)
+    object.__setattr__(m, "__dict__", {**shared, **(copy.deepcopy(copied) if copied else {}), **coerced})
+    object.__setattr__(m, "__fields_set__", set(coerced))
+    return m
+
+
+
+
+# ============================================================
+# VALIDATION LEVEL
+# ============================================================
+
+
+VALIDATION_LEVELS: typing.Tuple[str, ...] = ntypes.VALIDATION.__args__
+
+
+def validate_level(validation: typing.Any) -> Result[ntypes.VALIDATION, ValueError]:
+    """Check `validation` is one of ntypes.VALIDATION (getters treat any other value as "response").
+    """
+
+    if validation not in VALIDATION_LEVELS:
+        return Err(ValueError(f"Unknown validation level {validation!r}, expected one of {VALIDATION_LEVELS}"))
+    return Ok(validation)
@@ -28,6 +28,17 @@ EXCHANGE = Literal[
 PERCENT = conint(ge=0, le=100)
 
 
+# validation level of rest responses
+#   full: validate raw exchange response, then parsed noobit response
+#   response: only validate parsed noobit response
+#   none: trusted source, build noobit response without validation
+VALIDATION = Literal[
+    "full",
+    "response",
+    "none"
+]
+
+
 
 # ============================================================
 # TIME
@@ -0,0 +1,260 @@
+import typing
+from bisect import bisect_left
+from decimal import Decimal
+
+from noobit_markets.base import ntypes
+from noobit_markets.base.fixedpoint import Scale, to_scaled
+from noobit_markets.base.models.rest.response import NoobitResponseOrderBook
+
+
+
+
+# ============================================================
+# BOOK SIDE
+# ============================================================
+
+
+class BookSide(typing.Mapping[Decimal, Decimal]):
+    """Price levels of one side of the book.
+
+    Prices are kept in a sorted list (ascending) next to a price => volume dict:
+        - lookup: O(1)
+        - insert/delete: O(log n) search (list shift is a memmove)
+        - best level: O(1)
+
+    Iteration goes from best to worst price.
+    Prices and volumes are Decimals, or scaled ints for books with a scale (see OrderBook).
+    """
+
+    __slots__ = ("is_bid", "_prices", "_volumes")
+
+
+    def __init__(self, is_bid: bool, levels: typing.Optional[typing.Mapping[Decimal, Decimal]] = None):
+
+        self.is_bid = is_bid
+        self._prices: typing.List[Decimal] = []
+        self._volumes: typing.Dict[Decimal, Decimal] = {}
+
+        if levels:
+            self.replace(levels)
+
+
+    def replace(self, levels: typing.Mapping[Decimal, Decimal]):
+
+        self._volumes = {price: volume for price, volume in levels.items() if volume > 0}
+        self._prices = sorted(self._volumes)
+
+
+    def update(self, price: Decimal, volume: Decimal):
+        """Set volume of a price level, a volume of 0 removes the level.
+        """
+
+        if volume > 0:
+            if price not in self._volumes:
+                self._prices.insert(bisect_left(self._prices, price), price)
+            self._volumes[price] = volume
+
+        elif price in self._volumes:
+            del self._volumes[price]
+            del self._prices[bisect_left(self._prices, price)]
+
+
+    def truncate(self, depth: int) -> typing.List[Decimal]:
+        """Only keep the `depth` best levels, returns removed prices.
+        """
+
+        excess = len(self._prices) - depth
+        if excess <= 0:
+            return []
+
+        if self.is_bid:
+            removed, self._prices = self._prices[:excess], self._prices[excess:]
+        else:
+            removed, self._prices = self._prices[depth:], self._prices[:depth]
+
+        for price in removed:
+            del self._volumes[price]
+        return removed
+
+
+    def best(self) -> typing.Optional[typing.Tuple[Decimal, Decimal]]:
+
+        if not self._prices:
+            return None
+
+        price = self._prices[-1] if self.is_bid else self._prices[0]
+        return price, self._volumes[price]
+
+
+    def top(self, n: int) -> typing.List[typing.Tuple[Decimal, Decimal]]:
+
+        prices = self._prices[:-n-1:-1] if self.is_bid else self._prices[:n]
+        return [(price, self._volumes[price]) for price in prices]
+
+
+    def __getitem__(self, price: Decimal) -> Decimal:
+        return self._volumes[price]
+
+
+    def __contains__(self, price: object) -> bool:
+        return price in self._volumes
+
+
+    def __iter__(self) -> typing.Iterator[Decimal]:
+        return reversed(self._prices) if self.is_bid else iter(self._prices)
+
+
+    def __len__(self) -> int:
+        return len(self._prices)
+
+
+    def __repr__(self) -> str:
+        side = "bids" if self.is_bid else "asks"
+        return f"BookSide({side}, levels={len(self)}, best={self.best()})"
+
+
+
+
+# ============================================================
+# ORDER BOOK
+# ============================================================
+
+
+class OrderBook:
+    """Incremental L2 order book.
+
+    Seed it with a snapshot (from ws, or from any exchange's rest orderbook with `from_response`),
+    then apply updates as they come in.
+    If `depth` is given, levels beyond it are dropped after each update (as required by kraken).
+
+    If `scale` is given, levels are kept as scaled ints (see fixedpoint), which are much
+    cheaper to hash and compare: `asks` and `bids` are then keyed by ints, while all other
+    accessors still return Decimals.
+    """
+
+    __slots__ = ("symbol", "depth", "scale", "asks", "bids", "utcTime")
+
+
+    def __init__(
+            self,
+            symbol: ntypes.SYMBOL,
+            depth: typing.Optional[int] = None,
+            scale: typing.Optional[Scale] = None
+        ):
+
+        self.symbol = symbol
+        self.depth = depth
+        self.scale = scale
+        self.asks = BookSide(is_bid=False)
+        self.bids = BookSide(is_bid=True)
+        self.utcTime: typing.Optional[ntypes.TIMESTAMP] = None
+
+
+    @classmethod
+    def from_response(
+            cls,
+            response: NoobitResponseOrderBook,
+            depth: typing.Optional[int] = None,
+            scale: typing.Optional[Scale] = None
+        ) -> "OrderBook":
+
+        book = cls(response.symbol, depth, scale)
+        book.apply_snapshot(response.asks, response.bids, response.utcTime)
+        return book
+
+
+    def apply_snapshot(
+            self,
+            asks: ntypes.ASKS,
+            bids: ntypes.BIDS,
+            utc_time: typing.Optional[ntypes.TIMESTAMP] = None
+        ):
+
+        self.asks.replace(self._scaled(asks))
+        self.bids.replace(self._scaled(bids))
+        self._truncate()
+        if utc_time is not None:
+            self.utcTime = utc_time
+
+
+    def apply_update(
+            self,
+            asks: ntypes.ASKS,
+            bids: ntypes.BIDS,
+            utc_time: typing.Optional[ntypes.TIMESTAMP] = None
+        ):
+
+        for price, volume in self._scaled(asks).items():
+            self.asks.update(price, volume)
+        for price, volume in self._scaled(bids).items():
+            self.bids.update(price, volume)
+        self._truncate()
+        if utc_time is not None:
+            self.utcTime = utc_time
+
+
+    def _truncate(self):
+
+        if self.depth:
+            self.asks.truncate(self.depth)
+            self.bids.truncate(self.depth)
+
+
+    def _scaled(self, levels: typing.Mapping) -> typing.Mapping:
+
+        if self.scale is None:
+            return levels
+
+        # (cached) to_scaled directly rather than through Scale methods, this is the hot path
+        price_decimals, volume_decimals = self.scale
+        return {to_scaled(p, price_decimals): to_scaled(v, volume_decimals) for p, v in levels.items()}
+
+
+    def _level(self, level: typing.Optional[tuple]) -> typing.Optional[typing.Tuple[Decimal, Decimal]]:
+
+        if self.scale is None or level is None:
+            return level
+        return self.scale.price_decimal(level[0]), self.scale.volume_decimal(level[1])
+
+
+    @property
+    def best_ask(self) -> typing.Optional[typing.Tuple[Decimal, Decimal]]:
+        return self._level(self.asks.best())
+
+
+    @property
+    def best_bid(self) -> typing.Optional[typing.Tuple[Decimal, Decimal]]:
+        return self._level(self.bids.best())
+
+
+    @property
+    def spread(self) -> typing.Optional[Decimal]:
+
+        if not (self.asks and self.bids):
+            return None
+
+        spread = self.asks.best()[0] - self.bids.best()[0]
+        return spread if self.scale is None else self.scale.price_decimal(spread)
+
+
+    def top(self, n: int) -> typing.Mapping[str, typing.List[typing.Tuple[Decimal, Decimal]]]:
+
+        return {
+            "asks": [self._level(level) for level in self.asks.top(n)],
+            "bids": [self._level(level) for level in self.bids.top(n)]
+        }
+
+
+    def to_model(self, raw_json: typing.Any = None) -> NoobitResponseOrderBook:
+
+        return NoobitResponseOrderBook(
+            symbol=self.symbol,
+            utcTime=self.utcTime,
+            asks=dict(map(self._level, self.asks._volumes.items())),
+            bids=dict(map(self._level, self.bids._volumes.items())),
+            rawJson=raw_json
+        )
+
+
+    def __repr__(self) -> str:
+        return f"OrderBook({self.symbol}, best_ask={self.best_ask}, best_bid={self.best_bid})"
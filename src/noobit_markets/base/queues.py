@@ -0,0 +1,138 @@
+import asyncio
+import typing
+from collections import OrderedDict, deque
+
+from typing_extensions import Literal
+
+
+# what to do when a message is put into a full queue:
+#   block: wait for the consumer (backpressure on the dispatcher, no message lost)
+#   drop_oldest: discard the oldest message
+#   conflate: a pending message with the same key is replaced with the new one
+#             (or merged with it), if the queue is still full the oldest is discarded
+QUEUE_POLICY = Literal["block", "drop_oldest", "conflate"]
+
+
+
+
+# ============================================================
+# STATS
+# ============================================================
+
+
+class QueueStats(typing.NamedTuple):
+    policy: str
+    maxsize: int
+    depth: int
+    high_water: int
+    puts: int
+    drops: int
+    conflated: int
+
+
+
+
+# ============================================================
+# FEED QUEUE
+# ============================================================
+
+
+class FeedQueue(asyncio.Queue):
+    """Bounded asyncio.Queue with a policy for when consumers can not keep up.
+
+    Args:
+        maxsize: maximum number of pending messages (0 means unbounded)
+        policy: see QUEUE_POLICY
+        key: for conflate policy, returns the conflation key of a message (for ex the symbol)
+        merge: for conflate policy, (pending, new) => message; defaults to keeping the new one
+    """
+
+    def __init__(
+            self,
+            maxsize: int = 0,
+            policy: QUEUE_POLICY = "block",
+            key: typing.Optional[typing.Callable[[typing.Any], typing.Hashable]] = None,
+            merge: typing.Optional[typing.Callable[[typing.Any, typing.Any], typing.Any]] = None,
+        ):
+
+        if policy == "conflate" and key is None:
+            raise ValueError("conflate policy requires a key function")
+
+        self.policy = policy
+        self.key = key
+        self.merge = merge
+
+        self.puts = 0
+        self.drops = 0
+        self.conflated = 0
+        self.high_water = 0
+
+        super().__init__(maxsize)
+
+
+    # asyncio.Queue storage hooks (same as PriorityQueue / LifoQueue)
+
+    def _init(self, maxsize):
+        if self.policy == "conflate":
+            self._queue = OrderedDict()
+        else:
+            self._queue = deque()
+
+
+    def _put(self, item):
+        if self.policy == "conflate":
+            self._queue[self.key(item)] = item
+        else:
+            self._queue.append(item)
+
+
+    def _get(self):
+        if self.policy == "conflate":
+            return self._queue.popitem(last=False)[1]
+        return self._queue.popleft()
+
+
+    def put_nowait(self, item):
+
+        self.puts += 1
+
+        if self.policy == "conflate":
+            key = self.key(item)
+            if key in self._queue:
+                pending = self._queue[key]
+                self._queue[key] = self.merge(pending, item) if self.merge else item
+                self.conflated += 1
+                return
+
+        if self.policy != "block" and self.full():
+            self._get()
+            self.drops += 1
+
+        super().put_nowait(item)
+        self.high_water = max(self.high_water, self.qsize())
+
+
+    async def put(self, item):
+
+        if self.policy == "block":
+            # waits until a slot is free, then calls put_nowait
+            return await super().put(item)
+
+        # other policies never block the dispatcher
+        self.put_nowait(item)
+
+
+    def stats(self) -> QueueStats:
+        return QueueStats(
+            self.policy,
+            self.maxsize,
+            self.qsize(),
+            self.high_water,
+            self.puts,
+            self.drops,
+            self.conflated
+        )
+
+
+    def __repr__(self) -> str:
+        return f"FeedQueue(policy={self.policy}, maxsize={self.maxsize}, depth={self.qsize()})"
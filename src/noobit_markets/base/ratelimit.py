@@ -0,0 +1,248 @@
+import time
+import typing
+import asyncio
+
+from noobit_markets.base.errors import DDoSProtection
+
+
+# Client side rate limits, modeled on the rules of each exchange:
+#   kraken: counter increased by the cost of each call, decaying at a fixed rate,
+#           calls are rejected once it exceeds the max of the account tier
+#   binance: request weight of each endpoint, max 1200 per minute per ip
+#   ftx: 30 requests per second
+#
+# All are token buckets (capacity = max counter, rate = decay), requests wait
+# until their cost is available instead of being rejected (and locked out) by the exchange.
+# Limiters are defined next to the transport of each exchange, so they are shared
+# by all coroutines of the process.
+
+
+# cost of an endpoint: fixed, or computed from the request params (binance weights)
+Cost = typing.Union[float, typing.Callable[[typing.Mapping[str, typing.Any]], float]]
+
+
+
+
+# ============================================================
+# TOKEN BUCKET
+# ============================================================
+
+
+class TokenBucket:
+    """`capacity` tokens, refilled at `rate` tokens per second.
+
+    `acquire(cost)` reserves `cost` tokens right away (the count can go below zero)
+    and waits until they are refilled, so concurrent requests are served in order.
+    """
+
+    def __init__(self, capacity: float, rate: float):
+
+        self.capacity = capacity
+        self.rate = rate
+        self._tokens = capacity
+        self._updated = time.monotonic()
+
+
+    @property
+    def tokens(self) -> float:
+        self._refill()
+        return self._tokens
+
+
+    def _refill(self):
+
+        now = time.monotonic()
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+
+    def reserve(self, cost: float) -> float:
+        """Take `cost` tokens, returns the delay (s) before they are available.
+        """
+
+        self._refill()
+        self._tokens -= cost
+        return max(0., -self._tokens / self.rate)
+
+
+    def refund(self, cost: float):
+        self._refill()
+        self._tokens = min(self.capacity, self._tokens + cost)
+
+
+    async def acquire(self, cost: float = 1.):
+
+        delay = self.reserve(cost)
+        if delay > 0:
+            try:
+                await asyncio.sleep(delay)
+            except asyncio.CancelledError:
+                # request will not be sent
+                self.refund(cost)
+                raise
+
+
+    def pause(self, seconds: float):
+        """No tokens for `seconds` (after a rate limit error from the exchange).
+
+        Pauses do not add up, the same error can be reported by the request and its caller.
+        """
+
+        self._refill()
+        self._tokens = min(self._tokens, -seconds * self.rate)
+
+
+
+
+# ============================================================
+# RATE LIMITS
+# ============================================================
+
+
+class RateLimit(typing.NamedTuple):
+
+    # max cost of requests sent back to back
+    capacity: float
+    # cost given back per second
+    rate: float
+    # one bucket per api key (account limits), else shared by all keys (ip limits)
+    per_key: bool = False
+
+
+class RateLimits(typing.NamedTuple):
+    """Rate limits of an exchange, and cost of its endpoints in each limit.
+    """
+
+    limits: typing.Mapping[str, RateLimit]
+    # exchange endpoint => {limit name: cost}
+    costs: typing.Mapping[str, typing.Mapping[str, Cost]]
+    # cost of endpoints missing from `costs`
+    default: typing.Mapping[str, Cost]
+    # header of requests holding the api key (per key limits)
+    key_header: typing.Optional[str] = None
+
+
+
+
+# ============================================================
+# LIMITER
+# ============================================================
+
+
+class RateLimiter:
+    """Delays requests so that they stay within the rate limits of an exchange.
+
+    `await limiter.acquire(endpoint, params, headers)` before sending a request.
+    """
+
+    def __init__(self, rate_limits: RateLimits):
+
+        self.rate_limits = rate_limits
+        self._buckets: typing.Dict[typing.Tuple[str, typing.Optional[str]], TokenBucket] = {}
+
+        self.requests = 0
+        self.waits = 0
+        self.waited = 0.
+
+
+    def set_limit(self, name: str, limit: RateLimit):
+        """Change a limit (for ex kraken private limit depends on the account tier).
+        """
+
+        self.rate_limits = self.rate_limits._replace(limits={**self.rate_limits.limits, name: limit})
+        for bucket_name, key in list(self._buckets):
+            if bucket_name == name:
+                del self._buckets[(bucket_name, key)]
+
+
+    def _key(self, headers: typing.Optional[typing.Mapping[str, str]]) -> typing.Optional[str]:
+
+        key_header = self.rate_limits.key_header
+        return headers.get(key_header) if (headers and key_header) else None
+
+
+    def bucket(self, name: str, key: typing.Optional[str] = None) -> TokenBucket:
+
+        limit = self.rate_limits.limits[name]
+        bucket_key = (name, key if limit.per_key else None)
+
+        try:
+            return self._buckets[bucket_key]
+        except KeyError:
+            bucket = TokenBucket(limit.capacity, limit.rate)
+            self._buckets[bucket_key] = bucket
+            return bucket
+
+
+    def costs(
+            self,
+            endpoint: str,
+            params: typing.Optional[typing.Mapping[str, typing.Any]] = None
+        ) -> typing.Dict[str, float]:
+
+        costs = self.rate_limits.costs.get(endpoint, self.rate_limits.default)
+        return {
+            name: cost(params or {}) if callable(cost) else cost
+            for name, cost in costs.items()
+        }
+
+
+    async def acquire(
+            self,
+            endpoint: str,
+            params: typing.Optional[typing.Mapping[str, typing.Any]] = None,
+            headers: typing.Optional[typing.Mapping[str, str]] = None
+        ):
+
+        key = self._key(headers)
+
+        reserved = [
+            (self.bucket(name, key), cost)
+            for name, cost in self.costs(endpoint, params).items() if cost
+        ]
+        delay = max((bucket.reserve(cost) for bucket, cost in reserved), default=0.)
+
+        self.requests += 1
+        if delay > 0:
+            self.waits += 1
+            self.waited += delay
+            try:
+                await asyncio.sleep(delay)
+            except asyncio.CancelledError:
+                for bucket, cost in reserved:
+                    bucket.refund(cost)
+                raise
+
+
+    def pause(
+            self,
+            seconds: float,
+            endpoint: typing.Optional[str] = None,
+            headers: typing.Optional[typing.Mapping[str, str]] = None
+        ):
+        """Pause the limits `endpoint` counts in (all if None), for the key of `headers`.
+        """
+
+        key = self._key(headers)
+
+        names = self.rate_limits.limits if endpoint is None else self.costs(endpoint)
+        for name in names:
+            self.bucket(name, key).pause(seconds)
+
+
+    def on_errors(
+            self,
+            errors: typing.Iterable[Exception],
+            endpoint: typing.Optional[str] = None,
+            headers: typing.Optional[typing.Mapping[str, str]] = None
+        ):
+        """Pause after the exchange rejected a request anyway (limits shared with another process, wrong tier).
+        """
+
+        sleeps = [error.sleep for error in errors if isinstance(error, DDoSProtection)]
+        if sleeps:
+            self.pause(max(sleeps), endpoint, headers)
+
+
+    def __repr__(self) -> str:
+        return f"RateLimiter(buckets={len(self._buckets)}, requests={self.requests}, waits={self.waits}, waited={self.waited:.1f}s)"
@@ -1,7 +1,6 @@
 import typing
 import types
 from urllib.parse import urljoin
-import json
 import asyncio
 from functools import wraps
 
@@ -10,11 +9,12 @@ from pyrsistent import pmap
 import httpx
 from pydantic import AnyHttpUrl, PositiveInt, ValidationError
 
-from noobit_markets.base import ntypes
+from noobit_markets.base import ntypes, codec
 from noobit_markets.base.errors import BaseError
 from noobit_markets.base.models.frozenbase import FrozenBaseModel
 
 from noobit_markets.base.models.result import Ok, Err, Result
+from noobit_markets.base.retry import RetryPolicy, with_retry
 
 
 
@@ -81,6 +81,39 @@ def make_httpx_post_request(
     return pmap(req_dict)
 
 
+# ============================================================
+# DECODE RESPONSE
+# ============================================================
+
+
+class DecodedResponse(typing.NamedTuple):
+    """Response body decoded once, along with the few transport fields we need.
+    """
+    status_code: int
+    request: typing.Any
+    # decoded json body, None if body is not valid json
+    content: typing.Any
+    raw: bytes
+
+
+async def decode_response(response: typing.Any, decimal: bool = False) -> DecodedResponse:
+
+    # httpx responses are already read, aiohttp responses need to be awaited
+    if isinstance(response, httpx.Response):
+        status_code, sent_request, raw = response.status_code, response.request, response.content
+    else:
+        status_code, sent_request, raw = response.status, response.request_info, await response.read()
+
+    try:
+        content = codec.loads(raw, decimal=decimal)
+    except ValueError:
+        content = None
+
+    return DecodedResponse(status_code, sent_request, content, raw)
+
+
+
+
 # ============================================================
 # SEND REQUEST
 # ============================================================
@@ -89,24 +122,100 @@ def make_httpx_post_request(
 async def send_public_request(
         client: httpx.AsyncClient,
         request_args: pmap
-    ) -> pmap:
+    ) -> DecodedResponse:
 
     response = await client.get(**request_args)
 
-    # return frozendict(response.json())
-    return pmap(response.__dict__)
+    return await decode_response(response)
 
 
 async def send_private_request(
         client: httpx.AsyncClient,
         request_args: pmap
-    ) -> pmap:
+    ) -> DecodedResponse:
 
     response = await client.post(**request_args)
 
-    # return pmap(response.___dict__)
-    # FIXME this is just for testing purposes
-    return pmap(response.__dict__)
+    return await decode_response(response)
+
+
+# ============================================================
+# COALESCE REQUESTS
+# ============================================================
+
+
+def request_key(*parts: typing.Any) -> typing.Optional[typing.Hashable]:
+    """Hashable key of a request (url, params, headers ...), None if a part can not be hashed.
+    """
+
+    key = []
+    try:
+        for part in parts:
+            if isinstance(part, FrozenBaseModel):
+                part = part.dict(exclude_none=True)
+            if isinstance(part, typing.Mapping):
+                part = frozenset(part.items())
+            key.append(part)
+        key = tuple(key)
+        hash(key)
+    except TypeError:
+        return None
+    return key
+
+
+class SingleFlight:
+    """Concurrent calls with the same key share a single call.
+
+    The first caller starts the call, callers arriving while it is in flight await
+    the same Result. The call is not cancelled if one of the callers is.
+    """
+
+    def __init__(self):
+
+        self._inflight: typing.Dict[typing.Hashable, asyncio.Future] = {}
+
+        self.calls = 0
+        self.shared = 0
+
+
+    async def call(
+            self,
+            key: typing.Optional[typing.Hashable],
+            func: typing.Callable[..., typing.Awaitable[typing.Any]],
+            *args,
+            **kwargs
+        ) -> typing.Any:
+
+        if key is None:
+            return await func(*args, **kwargs)
+
+        inflight = self._inflight.get(key)
+        # futures are bound to the loop they were created in
+        if inflight is not None and inflight.get_loop() is asyncio.get_running_loop():
+            self.shared += 1
+            return await asyncio.shield(inflight)
+
+        inflight = asyncio.ensure_future(func(*args, **kwargs))
+        self._inflight[key] = inflight
+        inflight.add_done_callback(lambda future: self._done(key, future))
+
+        self.calls += 1
+        return await asyncio.shield(inflight)
+
+
+    def _done(self, key: typing.Hashable, future: asyncio.Future):
+
+        if self._inflight.get(key) is future:
+            del self._inflight[key]
+        # retrieved even if all callers were cancelled (no "exception never retrieved" warning)
+        if not future.cancelled():
+            future.exception()
+
+
+    def __len__(self) -> int:
+        return len(self._inflight)
+
+
 
 
 # ============================================================
@@ -114,55 +223,17 @@ async def send_private_request(
 # ============================================================
 
 
-#TODO make more explicit model (ie FrozenNoobitResponse) ==> for return value ?
 def retry_request(
         retries: PositiveInt,
         logger: typing.Callable,
-    ) -> Result[FrozenBaseModel, BaseError]:
+    ) -> typing.Callable:
+    """Decorator retrying up to `retries` times, kept for existing callers.
+
+    Interfaces retry through `base.retry.with_retry` and the RetryPolicy of each exchange.
+    """
 
     def decorator(func: types.CoroutineType):
-        @wraps(func)
-        async def wrapper(*args, **kwargs):
-            retried = 0
-            while retried < retries:
-                result = await func(*args, **kwargs)
-                if result.is_ok():
-                    return result
-                elif result.is_err():
-                    try:
-                        if len(result.value)>1:
-                            return result
-                    except TypeError:
-                        # no len() ==> we have a single Error
-                        if isinstance(result.value, ValidationError):
-                            return result
-                        if result.value.accept:
-                            return result
-                        else:
-                            msg = f"Retrying in {result.value[0].sleep} seconds - Retry Attempts: {retried}"
-                            logger(msg)
-                            #! returns a tuple of errors
-                            await asyncio.sleep(result.value[0].sleep)
-                            retried += 1
-                    except Exception as e:
-                        return e
-
-                    #! returns a tuple of errors
-                    #FIXME kraken returns a tuple of errors
-                    #   binance for examples returns a dict
-                    #   containing error code and error message
-                    # if result.value[0].accept:
-                    #     return result
-                    # else:
-                    #     msg = f"Retrying in {result.value[0].sleep} seconds - Retry Attempts: {retried}"
-                    #     logger(msg)
-                    #     #! returns a tuple of errors
-                    #     await asyncio.sleep(result.value[0].sleep)
-                    #     retried += 1
-            else:
-                return result
-
-        return wrapper
+        return with_retry(func, RetryPolicy(max_attempts=retries, logger=logger))
     return decorator
 
 
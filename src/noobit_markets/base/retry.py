@@ -0,0 +1,233 @@
+import time
+import random
+import typing
+import asyncio
+import collections
+from functools import wraps
+
+import httpx
+
+from noobit_markets.base.errors import (
+    BaseError,
+    NetworkError,
+    DDoSProtection,
+    InvalidNonce,
+    OnMaintenance,
+)
+from noobit_markets.base.models.result import Result, Err
+
+
+# Retries of failed rest requests:
+#   - only for errors that can go away (network errors, rate limits, exchange unavailable),
+#     exchange errors (bad request, invalid order, auth ...) are returned right away
+#   - exponential backoff with full jitter, so that clients failing at the same time
+#     do not retry at the same time
+#   - a retry budget shared by the whole process: once retries go over a fraction of
+#     the requests, errors are returned instead of retried (no retry storm during an outage)
+#
+# Waiting for rate limits is done by the rate limiter (paused on rate limit errors),
+# not by the retry delay.
+
+
+
+
+# ============================================================
+# DECISIONS
+# ============================================================
+
+
+# retry or not, by error class (looked up along the mro of the error)
+DEFAULT_DECISIONS: typing.Mapping[typing.Type[Exception], bool] = {
+    BaseError: False,
+    NetworkError: True,
+    # usually lasts longer than any backoff
+    OnMaintenance: False,
+}
+
+
+# errors of requests that were rejected before being processed, safe to retry
+# for requests that are not idempotent (new order)
+_NOT_PROCESSED_ERRORS = (DDoSProtection, InvalidNonce)
+
+# client errors of requests that were never sent
+_NOT_SENT_ERRORS = (httpx.ConnectError, httpx.ConnectTimeout, httpx.PoolTimeout)
+
+
+
+
+# ============================================================
+# BUDGET
+# ============================================================
+
+
+class RetryBudget:
+    """Retries allowed over the last `window` seconds: `min_retries` + `ratio` of the requests.
+    """
+
+    def __init__(self, ratio: float = .2, min_retries: int = 10, window: float = 10.):
+
+        self.ratio = ratio
+        self.min_retries = min_retries
+        self.window = window
+
+        self._requests: typing.Deque[float] = collections.deque()
+        self._retries: typing.Deque[float] = collections.deque()
+
+        self.rejected = 0
+
+
+    def _trim(self, now: float):
+
+        for times in (self._requests, self._retries):
+            while times and times[0] < now - self.window:
+                times.popleft()
+
+
+    def on_request(self):
+        self._requests.append(time.monotonic())
+
+
+    def try_retry(self) -> bool:
+
+        now = time.monotonic()
+        self._trim(now)
+
+        if len(self._retries) >= self.min_retries + self.ratio * len(self._requests):
+            self.rejected += 1
+            return False
+
+        self._retries.append(now)
+        return True
+
+
+# shared by all policies that are not given their own
+RETRY_BUDGET = RetryBudget()
+
+
+
+
+# ============================================================
+# POLICY
+# ============================================================
+
+
+class RetryPolicy:
+    """When and how long to wait before retrying a failed request.
+
+    Requests are sent at most `max_attempts` times. The delay before retry n is random
+    in [0, min(max_delay, base_delay * 2**(n-1))].
+    Requests that are not idempotent are only retried if they were not processed.
+    Exceptions of the http client are retried like network errors, and returned as an Err.
+    """
+
+    def __init__(
+            self,
+            max_attempts: int = 4,
+            base_delay: float = .5,
+            max_delay: float = 30.,
+            decisions: typing.Optional[typing.Mapping[typing.Type[Exception], bool]] = None,
+            budget: typing.Optional[RetryBudget] = None,
+            logger: typing.Optional[typing.Callable[[str], typing.Any]] = None,
+        ):
+
+        self.max_attempts = max_attempts
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.decisions = {**DEFAULT_DECISIONS, **(decisions or {})}
+        self.budget = budget if budget is not None else RETRY_BUDGET
+        self.logger = logger
+
+        self.retries = 0
+
+
+    def should_retry(self, error: typing.Any, idempotent: bool = True) -> bool:
+
+        # kraken returns a tuple of errors, other exchanges a single one
+        errors = error if isinstance(error, (tuple, list)) else (error, )
+        return bool(errors) and all(self._should_retry(e, idempotent) for e in errors)
+
+
+    def _should_retry(self, error: typing.Any, idempotent: bool) -> bool:
+
+        if isinstance(error, httpx.HTTPError):
+            return idempotent or isinstance(error, _NOT_SENT_ERRORS)
+
+        # validation errors, status errors ...
+        if not isinstance(error, BaseError):
+            return False
+
+        if not idempotent and not isinstance(error, _NOT_PROCESSED_ERRORS):
+            return False
+
+        for cls in type(error).__mro__:
+            if cls in self.decisions:
+                return self.decisions[cls]
+        return False
+
+
+    def delay(self, attempt: int) -> float:
+        return random.uniform(0, min(self.max_delay, self.base_delay * 2 ** (attempt - 1)))
+
+
+    async def call(
+            self,
+            func: typing.Callable[..., typing.Awaitable[Result]],
+            args: typing.Sequence = (),
+            kwargs: typing.Optional[typing.Mapping[str, typing.Any]] = None,
+            idempotent: bool = True
+        ) -> Result:
+
+        kwargs = kwargs or {}
+        attempt = 0
+
+        while True:
+            attempt += 1
+            self.budget.on_request()
+
+            try:
+                result = await func(*args, **kwargs)
+            except httpx.HTTPError as e:
+                result = Err(e)
+
+            if result.is_ok():
+                return result
+
+            if attempt >= self.max_attempts or not self.should_retry(result.value, idempotent):
+                return result
+
+            if not self.budget.try_retry():
+                return result
+
+            delay = self.delay(attempt)
+            if self.logger is not None:
+                self.logger(f"Retrying {getattr(func, '__name__', func)} in {delay:.2f}s - attempt {attempt}: {result.value!r}")
+
+            self.retries += 1
+            await asyncio.sleep(delay)
+
+
+
+
+# ============================================================
+# INTERFACE HELPERS
+# ============================================================
+
+
+def with_retry(func: typing.Callable, policy: RetryPolicy, idempotent: bool = True) -> typing.Callable:
+    """Retry coroutine according to `policy` (read on each call, so it can be changed at runtime).
+    """
+
+    @wraps(func)
+    async def wrapper(*args, **kwargs):
+        return await policy.call(func, args, kwargs, idempotent)
+
+    return wrapper
+
+
+def retrying(policy: RetryPolicy, idempotent: bool = True) -> typing.Callable[[typing.Callable], typing.Callable]:
+    """Decorator form of `with_retry`, for coroutines that are not mapped by an interface.
+    """
+
+    def decorator(func: typing.Callable) -> typing.Callable:
+        return with_retry(func, policy, idempotent)
+    return decorator
@@ -0,0 +1,169 @@
+import copy
+import time
+import types
+import typing
+
+from noobit_markets.base import codec
+from noobit_markets.base.models.result import Ok, Err
+
+
+# (parser module with `parse_msg` and `validate_parsed`, name of the data queue)
+# a route set to None is known but ignored (no parser yet)
+# if the module also has a `View` (see models.lazy), lazy routers publish views instead
+ROUTE = typing.Optional[typing.Tuple[types.ModuleType, str]]
+
+
+
+
+# ============================================================
+# STATS
+# ============================================================
+
+
+class RouteStats(typing.NamedTuple):
+    count: int
+    # nanoseconds spent parsing and validating (or creating views)
+    total_ns: int
+    max_ns: int
+    # frames that failed to parse or validate (not published)
+    errors: int
+
+    @property
+    def mean_us(self) -> float:
+        return self.total_ns / self.count / 1e3 if self.count else 0.
+
+
+class _RouteCounter:
+
+    __slots__ = ("count", "total_ns", "max_ns", "errors")
+
+    def __init__(self):
+        self.count = 0
+        self.total_ns = 0
+        self.max_ns = 0
+        self.errors = 0
+
+
+    def add(self, elapsed_ns: int, is_err: bool):
+        self.count += 1
+        self.total_ns += elapsed_ns
+        if elapsed_ns > self.max_ns:
+            self.max_ns = elapsed_ns
+        if is_err:
+            self.errors += 1
+
+
+
+
+# ============================================================
+# ROUTER
+# ============================================================
+
+
+class WsRouter:
+    """Route raw ws frames to parsers and data/status queues.
+
+    Each frame is decoded once, events (json objects) are dispatched on their
+    `event` key, data frames (json arrays) through a table of channel => route,
+    filled as channels are discovered. Parse + validate time is recorded per route.
+
+    Channel ids are only valid for one connection: a ws api instance uses its own
+    copy of the router (see `copy`).
+
+    If `lazy`, frames of routes with a `View` are published as views (decoded on access,
+    validated on demand by `view.validate()`), instead of parsed and validated models.
+    Off by default, since consumers then get views instead of models: exchange routers
+    whose feeds have views turn it on (kraken public feeds).
+
+    Exchange routers set `routes` and implement `channel_id` and `channel_name`.
+    """
+
+    # channel name prefix (for ex "book" for "book-10") => route
+    routes: typing.Mapping[str, ROUTE] = {}
+
+
+    def __init__(self, lazy: bool = False):
+        self.lazy = lazy
+        self._channels: typing.Dict[typing.Hashable, ROUTE] = {}
+        self._counters: typing.Dict[str, _RouteCounter] = {}
+
+
+    def copy(self) -> "WsRouter":
+        """Same routes, fresh channel table and counters.
+        """
+
+        new = copy.copy(self)
+        new._channels = {}
+        new._counters = {}
+        return new
+
+
+    def channel_id(self, frame: list) -> typing.Hashable:
+        raise NotImplementedError
+
+
+    def channel_name(self, frame: list) -> str:
+        raise NotImplementedError
+
+
+    def route_for(self, name: str) -> ROUTE:
+        return self.routes.get(name.split("-", 1)[0], None)
+
+
+    def learn(self, channel_id: typing.Hashable, name: str):
+        self._channels[channel_id] = self.route_for(name)
+
+
+    async def on_event(self, event: dict, status_queues: typing.Mapping):
+        raise NotImplementedError
+
+
+    async def __call__(self, msg: typing.Union[str, bytes], data_queues: typing.Mapping, status_queues: typing.Mapping):
+
+        frame = codec.loads(msg)
+
+        if isinstance(frame, dict):
+            return await self.on_event(frame, status_queues)
+
+        channel_id = self.channel_id(frame)
+        try:
+            route = self._channels[channel_id]
+        except KeyError:
+            route = self.route_for(self.channel_name(frame))
+            self._channels[channel_id] = route
+
+        if route is None:
+            return
+
+        module, queue = route
+
+        start = time.perf_counter_ns()
+        view = getattr(module, "View", None) if self.lazy else None
+        try:
+            if view is not None:
+                valid_parsed_msg = Ok(view(frame))
+            else:
+                valid_parsed_msg = module.validate_parsed(frame, module.parse_msg(frame))
+        except Exception as e:
+            # malformed frame: counted in the route errors, the connection keeps going
+            valid_parsed_msg = Err(e)
+        elapsed = time.perf_counter_ns() - start
+
+        try:
+            counter = self._counters[queue]
+        except KeyError:
+            counter = self._counters[queue] = _RouteCounter()
+        counter.add(elapsed, valid_parsed_msg.is_err())
+
+        # invalid frames are only counted (see `stats`), not published
+        if valid_parsed_msg.is_ok():
+            await data_queues[queue].put(valid_parsed_msg)
+            return valid_parsed_msg
+
+
+    def stats(self) -> typing.Dict[str, RouteStats]:
+
+        return {
+            queue: RouteStats(c.count, c.total_ns, c.max_ns, c.errors)
+            for queue, c in self._counters.items()
+        }
@@ -0,0 +1,139 @@
+import asyncio
+import time
+import typing
+from collections import deque
+
+
+
+
+# ============================================================
+# STATS
+# ============================================================
+
+
+class TaskStats(typing.NamedTuple):
+    scheduled: int
+    running: int
+    done: int
+    failed: int
+    cancelled: int
+    # time between `schedule` and the coroutine starting
+    mean_delay_ms: float
+    max_delay_ms: float
+    # time between the coroutine starting and its completion
+    mean_run_ms: float
+    max_run_ms: float
+
+
+
+
+# ============================================================
+# SCHEDULER
+# ============================================================
+
+
+class Scheduler:
+    """Run coroutines as tasks as soon as they are scheduled, and keep track of them.
+
+    Acts as a task group: running tasks can be awaited with `join`, cancelled with `cancel_all`.
+    Failures are counted and the last ones kept in `failures` (task name, exception).
+    """
+
+    def __init__(self, max_failures: int = 100):
+
+        self._tasks: typing.Set[asyncio.Future] = set()
+
+        self.failures: typing.Deque[typing.Tuple[str, BaseException]] = deque(maxlen=max_failures)
+
+        self.scheduled = 0
+        self.done = 0
+        self.failed = 0
+        self.cancelled = 0
+
+        self._started = 0
+        self._finished = 0
+        self._total_delay = 0.
+        self._max_delay = 0.
+        self._total_run = 0.
+        self._max_run = 0.
+
+
+    def schedule(self, coro: typing.Awaitable, name: typing.Optional[str] = None) -> asyncio.Future:
+
+        name = name or getattr(coro, "__qualname__", repr(coro))
+        task = asyncio.ensure_future(self._run(coro, time.perf_counter()))
+        task.add_done_callback(lambda t: self._on_done(t, name, coro))
+
+        self._tasks.add(task)
+        self.scheduled += 1
+        return task
+
+
+    async def _run(self, coro: typing.Awaitable, scheduled_at: float) -> typing.Any:
+
+        start = time.perf_counter()
+        delay = start - scheduled_at
+        self._started += 1
+        self._total_delay += delay
+        self._max_delay = max(self._max_delay, delay)
+
+        try:
+            return await coro
+        finally:
+            run = time.perf_counter() - start
+            self._finished += 1
+            self._total_run += run
+            self._max_run = max(self._max_run, run)
+
+
+    def _on_done(self, task: asyncio.Future, name: str, coro: typing.Awaitable):
+
+        self._tasks.discard(task)
+
+        if task.cancelled():
+            self.cancelled += 1
+            # cancelled before it started (no "coroutine was never awaited" warning)
+            if asyncio.iscoroutine(coro):
+                coro.close()
+        elif task.exception() is not None:
+            self.failed += 1
+            self.failures.append((name, task.exception()))
+        else:
+            self.done += 1
+
+
+    async def join(self) -> typing.List[typing.Any]:
+        """Wait for all running tasks, returns results (or exceptions).
+        """
+
+        if not self._tasks:
+            return []
+        return await asyncio.gather(*self._tasks, return_exceptions=True)
+
+
+    def cancel_all(self):
+
+        for task in list(self._tasks):
+            task.cancel()
+
+
+    def stats(self) -> TaskStats:
+
+        started = self._started or 1
+        finished = self._finished or 1
+
+        return TaskStats(
+            self.scheduled,
+            len(self._tasks),
+            self.done,
+            self.failed,
+            self.cancelled,
+            self._total_delay / started * 1e3,
+            self._max_delay * 1e3,
+            self._total_run / finished * 1e3,
+            self._max_run * 1e3
+        )
+
+
+    def __len__(self) -> int:
+        return len(self._tasks)
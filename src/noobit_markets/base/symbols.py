@@ -0,0 +1,398 @@
+import os
+import sys
+import time
+import typing
+import asyncio
+import inspect
+import functools
+from functools import wraps
+
+from noobit_markets.base import ntypes, codec
+from noobit_markets.base.models.result import Result, Ok, Err
+from noobit_markets.base.models.trusted import construct_trusted
+from noobit_markets.base.models.rest.response import NoobitResponseSymbols
+
+
+# symbols files are written to $NOOBIT_CACHE_DIR (default ~/.cache/noobit_markets)
+CACHE_DIR = os.environ.get("NOOBIT_CACHE_DIR", os.path.join(os.path.expanduser("~"), ".cache", "noobit_markets"))
+
+
+
+
+# ============================================================
+# INDEX
+# ============================================================
+
+
+class BiMap(dict):
+    """dict that carries its inverse (computed once, values must be unique).
+    """
+
+    __slots__ = ("inverse", )
+
+    def __init__(self, items: typing.Iterable[typing.Tuple[str, str]] = ()):
+
+        super().__init__(items)
+        inverse = BiMap.__new__(BiMap)
+        dict.update(inverse, ((v, k) for k, v in self.items()))
+        inverse.inverse = self
+        self.inverse = inverse
+
+
+def inverse(mapping: typing.Mapping[str, str]) -> typing.Mapping[str, str]:
+    """Inverse of a mapping (for ex SYMBOL_TO_EXCHANGE => SYMBOL_FROM_EXCHANGE), free for BiMaps.
+    """
+
+    if isinstance(mapping, BiMap):
+        return mapping.inverse
+    return {v: k for k, v in mapping.items()}
+
+
+@functools.lru_cache(maxsize=None)
+def symbol_from_ws_name(ws_name: str) -> ntypes.SYMBOL:
+    """Default noobit symbol of a ws pair name ("XBT/USD" => "XBT-USD"), for pairs missing from the index.
+    """
+    return sys.intern(ws_name.replace("/", "-"))
+
+
+class SymbolsIndex:
+    """All names of the symbols and assets of an exchange, precomputed (and interned) once.
+
+    Noobit symbol <=> rest name (`to_exchange`), ws name (`to_ws`), altname (`to_altname`,
+    ws name without "/", used by kraken in orders), and noobit asset <=> exchange asset (`assets`).
+    Each is a BiMap, so both directions are a single dict lookup.
+    """
+
+    __slots__ = ("symbols", "to_exchange", "to_ws", "to_altname", "assets", "quotes", "_names")
+
+
+    def __init__(self, symbols: NoobitResponseSymbols):
+
+        self.symbols = symbols
+
+        intern = sys.intern
+        pairs = [(intern(symbol), item) for symbol, item in symbols.asset_pairs.items()]
+
+        self.to_exchange = BiMap((symbol, intern(item.exchange_name)) for symbol, item in pairs)
+        self.to_ws = BiMap((symbol, intern(item.ws_name)) for symbol, item in pairs if item.ws_name)
+        self.to_altname = BiMap((symbol, intern(ws_name.replace("/", ""))) for symbol, ws_name in self.to_ws.items())
+        self.assets = BiMap((intern(asset), intern(exchange_asset)) for asset, exchange_asset in symbols.assets.items())
+        self.quotes = {symbol: intern(symbol.partition("-")[2]) for symbol, _ in pairs}
+
+        # any known name => noobit symbol
+        self._names: typing.Dict[str, ntypes.SYMBOL] = {
+            **self.to_altname.inverse,
+            **self.to_ws.inverse,
+            **self.to_exchange.inverse,
+            **{symbol: symbol for symbol, _ in pairs}
+        }
+
+
+    @classmethod
+    def of(cls, symbols: NoobitResponseSymbols) -> "SymbolsIndex":
+        """Index of `symbols`, only built the first time.
+        """
+
+        index = _INDEXES.get(id(symbols))
+        if index is None or index.symbols is not symbols:
+            index = cls(symbols)
+            _INDEXES[id(symbols)] = index
+            # keeps the last few (symbols are refreshed every few hours at most)
+            while len(_INDEXES) > 8:
+                del _INDEXES[next(iter(_INDEXES))]
+        return index
+
+
+    def lookup(self, name: str) -> typing.Optional[ntypes.SYMBOL]:
+        """Noobit symbol of any name of a pair (noobit, rest, ws or altname).
+        """
+        return self._names.get(name)
+
+
+    def from_ws(self, ws_name: str) -> ntypes.SYMBOL:
+        return self.to_ws.inverse.get(ws_name) or symbol_from_ws_name(ws_name)
+
+
+    def __len__(self) -> int:
+        return len(self.to_exchange)
+
+
+    def __repr__(self) -> str:
+        return f"SymbolsIndex(pairs={len(self.to_exchange)}, assets={len(self.assets)})"
+
+
+_INDEXES: typing.Dict[int, SymbolsIndex] = {}
+
+
+
+
+# ============================================================
+# REGISTRY
+# ============================================================
+
+
+class SymbolsRegistry:
+    """Symbols (asset pairs + assets) of an exchange, cached in memory and on disk.
+
+    `get` returns cached symbols without any request as long as they are younger than `ttl`.
+    Older symbols are still returned right away but refreshed in the background,
+    symbols older than `max_age` are refreshed before being returned (cached ones are
+    returned if the refresh fails).
+
+    Fetched symbols are saved to a json file that is loaded on first use, so that a restarted
+    process does not need to query (and validate) the symbols endpoint again.
+    The file is trusted (written by us), it is not validated again.
+
+    `fetch` is called with `client=` when a client is passed to the query methods
+    (for ex a partial of the symbols endpoint with a default `client` keyword).
+    """
+
+    def __init__(
+            self,
+            exchange: str,
+            fetch: typing.Callable[..., typing.Awaitable[Result[NoobitResponseSymbols, Exception]]],
+            ttl: float = 6 * 3600,
+            max_age: float = 7 * 24 * 3600,
+            path: typing.Optional[str] = None,
+            persist: bool = True
+        ):
+
+        self.exchange = exchange
+        self.ttl = ttl
+        self.max_age = max_age
+        self.path = path or os.path.join(CACHE_DIR, f"{exchange.lower()}_symbols.json")
+        self.persist = persist
+
+        self._fetch = fetch
+        self._symbols: typing.Optional[NoobitResponseSymbols] = None
+        # wall clock, so that the age of symbols loaded from file is known
+        self._fetched_at = 0.
+        self._loaded = False
+        self._refreshing: typing.Optional[asyncio.Future] = None
+
+        self.fetches = 0
+
+
+    @property
+    def age(self) -> float:
+        return time.time() - self._fetched_at
+
+
+    async def get(self, client: typing.Optional[ntypes.CLIENT] = None) -> Result[NoobitResponseSymbols, Exception]:
+
+        if not self._loaded:
+            self._load()
+
+        if self._symbols is None or self.age > self.max_age:
+            refreshed = await self.refresh(client)
+            if refreshed.is_err() and self._symbols is not None:
+                return Ok(self._symbols)
+            return refreshed
+
+        if self.age > self.ttl:
+            self.refresh_in_background(client)
+
+        return Ok(self._symbols)
+
+
+    async def refresh(self, client: typing.Optional[ntypes.CLIENT] = None) -> Result[NoobitResponseSymbols, Exception]:
+        """Fetch symbols from the exchange (concurrent calls share the same request).
+        """
+
+        return await asyncio.shield(self.refresh_in_background(client))
+
+
+    def refresh_in_background(self, client: typing.Optional[ntypes.CLIENT] = None) -> asyncio.Future:
+
+        if self._refreshing is None:
+            self._refreshing = asyncio.ensure_future(self._refresh(client))
+            self._refreshing.add_done_callback(self._clear_refreshing)
+        return self._refreshing
+
+
+    def _clear_refreshing(self, task: asyncio.Future):
+        if self._refreshing is task:
+            self._refreshing = None
+
+
+    async def _refresh(self, client: typing.Optional[ntypes.CLIENT] = None) -> Result[NoobitResponseSymbols, Exception]:
+
+        self.fetches += 1
+        try:
+            result = await (self._fetch() if client is None else self._fetch(client=client))
+        except Exception as e:
+            return Err(e)
+
+        if result.is_ok():
+            self.set(result.value)
+        return result
+
+
+    def set(self, symbols: NoobitResponseSymbols, fetched_at: typing.Optional[float] = None):
+
+        self._symbols = symbols
+        self._fetched_at = fetched_at if fetched_at is not None else time.time()
+        self._loaded = True
+        if self.persist and fetched_at is None:
+            self._save()
+
+
+    def clear(self):
+
+        self._symbols = None
+        self._fetched_at = 0.
+        # do not reload file
+        self._loaded = True
+
+
+    # ========================================
+    # PERSISTENCE
+
+
+    def _load(self):
+
+        self._loaded = True
+        if not self.persist:
+            return
+
+        try:
+            with open(self.path, "rb") as f:
+                content = codec.loads(f.read())
+            symbols = construct_trusted(NoobitResponseSymbols, content["symbols"])
+            fetched_at = float(content["fetched_at"])
+        except (OSError, ValueError, KeyError, TypeError):
+            # no file yet, or corrupted: will be fetched
+            return
+
+        self._symbols = symbols
+        self._fetched_at = fetched_at
+
+
+    def _save(self):
+
+        content = {
+            "exchange": self.exchange,
+            "fetched_at": self._fetched_at,
+            # decimals (order_min) are kept as strings
+            "symbols": codec.loads(self._symbols.json(exclude={"rawJson"}, encoder=str))
+        }
+
+        # write to a temp file then rename, a crash while writing does not leave a corrupted file
+        tmp_path = f"{self.path}.{os.getpid()}.tmp"
+        try:
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            with open(tmp_path, "w") as f:
+                f.write(codec.dumps(content))
+            os.replace(tmp_path, self.path)
+        except OSError:
+            # persistence is best effort
+            pass
+
+
+    # ========================================
+    # MAPPINGS
+
+
+    async def index(self, client: typing.Optional[ntypes.CLIENT] = None) -> Result[SymbolsIndex, Exception]:
+
+        symbols = await self.get(client)
+        if symbols.is_err():
+            return symbols
+        return Ok(SymbolsIndex.of(symbols.value))
+
+
+    def index_nowait(self) -> typing.Optional[SymbolsIndex]:
+        """Index of the cached symbols (loaded from file if needed), without any request.
+        """
+
+        if not self._loaded:
+            self._load()
+        if self._symbols is None:
+            return None
+        return SymbolsIndex.of(self._symbols)
+
+
+    def symbol_from_ws(self, ws_name: str) -> ntypes.SYMBOL:
+        """Noobit symbol of a ws pair name, for ws parsers (sync, no request).
+        """
+
+        index = self.index_nowait()
+        if index is None:
+            return symbol_from_ws_name(ws_name)
+        return index.from_ws(ws_name)
+
+
+    async def symbol_to_exchange(self, client: typing.Optional[ntypes.CLIENT] = None) -> Result[ntypes.SYMBOL_TO_EXCHANGE, Exception]:
+
+        index = await self.index(client)
+        if index.is_err():
+            return index
+        return Ok(index.value.to_exchange)
+
+
+    async def asset_to_exchange(self, client: typing.Optional[ntypes.CLIENT] = None) -> Result[ntypes.ASSET_TO_EXCHANGE, Exception]:
+
+        index = await self.index(client)
+        if index.is_err():
+            return index
+        return Ok(index.value.assets)
+
+
+    def __repr__(self) -> str:
+        pairs = len(self._symbols.asset_pairs) if self._symbols is not None else 0
+        return f"SymbolsRegistry({self.exchange}, pairs={pairs}, age={self.age:.0f}s)"
+
+
+
+
+# ============================================================
+# INTERFACE HELPERS
+# ============================================================
+
+
+def _mapping(index: SymbolsIndex, annotation: typing.Any, name: str) -> typing.Any:
+
+    if annotation is NoobitResponseSymbols:
+        return index.symbols
+    if name.startswith("asset_to"):
+        return index.assets
+    if name.startswith("asset_from"):
+        return index.assets.inverse
+    return index.to_exchange
+
+
+# argument names of symbol mappings in endpoints
+_MAPPING_ARGS = ("symbol_to_exchange", "symbols_to_exchange", "asset_to_exchange", "asset_from_exchange")
+
+
+def with_symbols(func: typing.Callable, registry: SymbolsRegistry) -> typing.Callable:
+    """Fill symbol mapping arguments from `registry` when coroutine is called without them.
+    """
+
+    signature = inspect.signature(func)
+    args_to_fill = [
+        (name, signature.parameters[name].annotation)
+        for name in _MAPPING_ARGS if name in signature.parameters
+    ]
+
+    if not args_to_fill:
+        return func
+
+    @wraps(func)
+    async def wrapper(*args, **kwargs):
+
+        bound = signature.bind_partial(*args, **kwargs)
+        missing = [(name, annotation) for name, annotation in args_to_fill if bound.arguments.get(name, None) is None]
+
+        if not missing:
+            return await func(*args, **kwargs)
+
+        index = await registry.index()
+        if index.is_err():
+            return index
+
+        for name, annotation in missing:
+            bound.arguments[name] = _mapping(index.value, annotation, name)
+        return await func(*bound.args, **bound.kwargs)
+
+    return wrapper
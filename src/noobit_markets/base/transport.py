@@ -0,0 +1,165 @@
+import typing
+import asyncio
+import inspect
+from functools import wraps
+from urllib.parse import urlsplit
+
+import httpx
+import httpcore
+from pydantic import AnyHttpUrl
+
+from noobit_markets.base.models.rest.endpoints import RESTEndpoints
+
+
+# http2 is optional, httpx needs the `h2` package to negotiate it
+try:
+    import h2   # noqa: F401
+    _HTTP2_AVAILABLE = True
+except ImportError:
+    _HTTP2_AVAILABLE = False
+
+
+
+
+# ============================================================
+# TRANSPORT
+# ============================================================
+
+
+def _running_loop() -> typing.Optional[asyncio.AbstractEventLoop]:
+    try:
+        return asyncio.get_running_loop()
+    except RuntimeError:
+        return None
+
+
+
+class HttpTransport:
+    """Pooled keep-alive http client, shared across all rest endpoints of an exchange.
+
+    Exposes the same `get`/`post`/`request` coroutines as `httpx.AsyncClient`,
+    so it can be passed anywhere a `client` argument is expected.
+    The underlying client is created lazily (on first request), so that it is bound
+    to the running event loop and not to the one active at import time. It is created
+    again (along with the host semaphores) when used from another event loop.
+    """
+
+
+    def __init__(
+            self,
+            rest_endpoints: RESTEndpoints,
+            max_connections: int = 100,
+            max_keepalive_connections: int = 20,
+            keepalive_expiry: float = 60.0,
+            max_per_host: int = 10,
+            http2: bool = False,
+            timeout: float = 10.0,
+        ):
+
+        self.rest_endpoints = rest_endpoints
+
+        self.max_connections = max_connections
+        self.max_keepalive_connections = max_keepalive_connections
+        self.keepalive_expiry = keepalive_expiry
+        self.max_per_host = max_per_host
+        self.http2 = http2 and _HTTP2_AVAILABLE
+        self.timeout = timeout
+
+        # one ssl context for the whole pool so tls sessions can be resumed
+        self._ssl_context = httpx.create_ssl_context(http2=self.http2)
+
+        self._client: typing.Optional[httpx.AsyncClient] = None
+        self._host_semaphores: typing.Dict[str, asyncio.Semaphore] = {}
+        # loop the client and semaphores are bound to
+        self._loop: typing.Optional[asyncio.AbstractEventLoop] = None
+
+
+    @property
+    def client(self) -> httpx.AsyncClient:
+
+        loop = _running_loop()
+        if self._client is not None and loop is not self._loop:
+            # previous loop is closed (or not running): its connections can not be reused
+            self._client = None
+
+        if self._client is None:
+            pool = httpcore.AsyncConnectionPool(
+                ssl_context=self._ssl_context,
+                max_connections=self.max_connections,
+                max_keepalive_connections=self.max_keepalive_connections,
+                keepalive_expiry=self.keepalive_expiry,
+                http2=self.http2,
+            )
+            self._client = httpx.AsyncClient(
+                transport=pool,
+                timeout=self.timeout,
+            )
+            # semaphores are bound to the loop of the previous client
+            self._host_semaphores = {}
+            self._loop = loop
+
+        return self._client
+
+
+    def _semaphore(self, url: AnyHttpUrl) -> asyncio.Semaphore:
+
+        host = urlsplit(str(url)).netloc
+        if host not in self._host_semaphores:
+            self._host_semaphores[host] = asyncio.Semaphore(self.max_per_host)
+        return self._host_semaphores[host]
+
+
+    async def request(self, method: str, url: AnyHttpUrl, **kwargs) -> httpx.Response:
+
+        client = self.client
+        async with self._semaphore(url):
+            return await client.request(method, url, **kwargs)
+
+
+    async def get(self, url: AnyHttpUrl, **kwargs) -> httpx.Response:
+        return await self.request("GET", url, **kwargs)
+
+
+    async def post(self, url: AnyHttpUrl, **kwargs) -> httpx.Response:
+        return await self.request("POST", url, **kwargs)
+
+
+    async def aclose(self):
+
+        if self._client is not None and self._loop is _running_loop():
+            await self._client.aclose()
+        self._client = None
+
+
+    async def __aenter__(self):
+        return self
+
+
+    async def __aexit__(self, *args):
+        await self.aclose()
+
+
+
+
+# ============================================================
+# INTERFACE HELPERS
+# ============================================================
+
+
+def with_transport(func: typing.Callable, transport: HttpTransport) -> typing.Callable:
+    """Use `transport` as client when coroutine is called without one (or with None).
+    """
+
+    signature = inspect.signature(func)
+
+    @wraps(func)
+    async def wrapper(*args, **kwargs):
+
+        bound = signature.bind_partial(*args, **kwargs)
+        if bound.arguments.get("client", None) is not None:
+            return await func(*args, **kwargs)
+
+        bound.arguments["client"] = transport
+        return await func(*bound.args, **bound.kwargs)
+
+    return wrapper
@@ -1,5 +1,4 @@
 import asyncio
-import json
 import typing
 
 from typing_extensions import Literal
@@ -8,6 +7,7 @@ import pydantic
 from websockets import WebSocketClientProtocol
 from websockets.exceptions import ConnectionClosed
 
+from noobit_markets.base import codec
 from noobit_markets.base.models.result import Result, Ok, Err
 
 
@@ -36,7 +36,7 @@ async def subscribe(client: WebSocketClientProtocol, sub_model: SubModel, q_maxs
   payload = (sub_model.msg).dict(exclude_none=True)
 
   # TODO sub_msg = parse_sub(subscription)
-  await client.send(json.dumps(payload))
+  await client.send(codec.dumps(payload))
   return Ok()
   # msg = await client.recv()
   # if "subscription" in msg:
@@ -53,6 +53,16 @@ async def subscribe(client: WebSocketClientProtocol, sub_model: SubModel, q_maxs
 
 
 
+async def resubscribe(client: WebSocketClientProtocol, sub_model: KrakenSubModel):
+  """Unsubscribe then subscribe again to the same feed (forces a new snapshot).
+  """
+
+  unsub_msg = sub_model.msg.copy(update={"event": "unsubscribe"})
+  await subscribe(client, sub_model.copy(update={"msg": unsub_msg}))
+  return await subscribe(client, sub_model)
+
+
+
 def merge_queues(feed_queues):
 
   merged = {}
@@ -1,4 +1,8 @@
+import typing
+
 from pydantic import ValidationError
+
+from noobit_markets.base import ratelimit
 from noobit_markets.base.models.rest import endpoints
 
 
@@ -65,4 +69,55 @@ BINANCE_ENDPOINTS = endpoints.RESTEndpoints(**{
             "ws_token": "api/v3/userDataStream" #for SPOT wallet
         }
     }
-})
\ No newline at end of file
+})
+
+
+# https://github.com/binance-exchange/binance-official-api-docs/blob/master/rest-api.md#limits
+#   request weight: 1200 per minute per ip (fixed one minute windows)
+#   orders: 10 per second per account
+# so that no minute window goes over 1200: capacity + 60 * rate <= 1200
+
+def _depth_weight(params: typing.Mapping) -> int:
+    limit = int(params.get("limit", 100))
+    return 1 if limit <= 100 else 5 if limit <= 500 else 10 if limit <= 1000 else 50
+
+
+def _symbols_weight(single: int, all_symbols: int) -> typing.Callable[[typing.Mapping], int]:
+
+    def weight(params: typing.Mapping) -> int:
+        if "symbol" in params:
+            return single
+        if "symbols" in params:
+            # json array of symbols
+            return min(all_symbols, single * (params["symbols"].count(",") + 1))
+        return all_symbols
+
+    return weight
+
+
+BINANCE_RATE_LIMITS = ratelimit.RateLimits(
+    limits={
+        "weight": ratelimit.RateLimit(capacity=200, rate=1000 / 60),
+        "orders": ratelimit.RateLimit(capacity=10, rate=10, per_key=True),
+    },
+    costs={
+        "time": {"weight": 1},
+        "exchangeInfo": {"weight": 10},
+        "ticker/24hr": {"weight": _symbols_weight(1, 40)},
+        "klines": {"weight": 1},
+        "depth": {"weight": _depth_weight},
+        "trades": {"weight": 1},
+        "ticker/bookTicker": {"weight": _symbols_weight(1, 2)},
+        "historicalTrades": {"weight": 5},
+        "api/v3/account": {"weight": 10},
+        "api/v3/allOrders": {"weight": 10},
+        "api/v3/myTrades": {"weight": 10},
+        "api/v3/openOrders": {"weight": _symbols_weight(3, 40)},
+        # new order (1) / cancel order (1) / query order (2)
+        "api/v3/order": {"weight": 2, "orders": 1},
+        "api/v3/userDataStream": {"weight": 1},
+        "sapi/v1/accountSnapshot": {"weight": 1},
+    },
+    default={"weight": 1},
+    key_header="X-MBX-APIKEY",
+)
@@ -1,4 +1,9 @@
 from noobit_markets.base.models.interface import ExchangeInterface
+from noobit_markets.base.transport import with_transport
+from noobit_markets.base.symbols import with_symbols
+from noobit_markets.base.retry import RetryPolicy, with_retry
+
+from noobit_markets.exchanges.binance.rest.base import BINANCE_TRANSPORT, BINANCE_RETRY_POLICY
 
 # private endpoints
 
@@ -7,27 +12,41 @@ from noobit_markets.base.models.interface import ExchangeInterface
 from noobit_markets.exchanges.binance.rest.public.ohlc.get import get_ohlc_binance
 from noobit_markets.exchanges.binance.rest.public.orderbook.get import get_orderbook_binance
 from noobit_markets.exchanges.binance.rest.public.trades.get import get_trades_binance
-from noobit_markets.exchanges.binance.rest.public.instrument.get import get_instrument_binance
-
-
-BINANCE = ExchangeInterface(**{
-    "rest": {
-        "public": {
-            "ohlc": get_ohlc_binance,
-            "orderbook": get_orderbook_binance, 
-            "symbols": None, 
-            "trades": get_trades_binance, 
-            "instrument": get_instrument_binance, 
-            "spread": None, 
-        },
-        "private": {
-            "balances": None, 
-            "exposure": None, 
-            "trades": None, 
-            "open_positions": None, 
-            "open_orders": None, 
-            "closed_orders": None, 
-            "new_order": None, 
+from noobit_markets.exchanges.binance.rest.public.instrument.get import get_instrument_binance, get_instruments_binance
+from noobit_markets.exchanges.binance.rest.public.spread.get import get_spreads_binance
+from noobit_markets.exchanges.binance.rest.public.symbols.get import BINANCE_SYMBOLS
+
+
+def binance_interface(retry_policy: RetryPolicy = BINANCE_RETRY_POLICY) -> ExchangeInterface:
+    """Binance interface, with the retry policy of its rest endpoints.
+    """
+
+    def rest(func, idempotent=True):
+        return with_symbols(with_retry(with_transport(func, BINANCE_TRANSPORT), retry_policy, idempotent), BINANCE_SYMBOLS)
+
+    return ExchangeInterface(**{
+        "rest": {
+            "public": {
+                "ohlc": rest(get_ohlc_binance),
+                "orderbook": rest(get_orderbook_binance),
+                "symbols": None,
+                "trades": rest(get_trades_binance),
+                "instrument": rest(get_instrument_binance),
+                "spread": None,
+                "instruments": rest(get_instruments_binance),
+                "spreads": rest(get_spreads_binance),
+            },
+            "private": {
+                "balances": None,
+                "exposure": None,
+                "trades": None,
+                "open_positions": None,
+                "open_orders": None,
+                "closed_orders": None,
+                "new_order": None,
+            }
         }
-    }
-})
\ No newline at end of file
+    })
+
+
+BINANCE = binance_interface()
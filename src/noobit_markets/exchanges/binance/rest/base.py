@@ -16,43 +16,61 @@ from noobit_markets.base.request import (
     make_httpx_get_request,
     send_public_request,
     make_httpx_post_request,
-    send_private_request
+    send_private_request,
+    DecodedResponse,
+    SingleFlight,
+    request_key,
 )
 from noobit_markets.base.models.result import Ok, Err, Result
 from noobit_markets.base.models.frozenbase import FrozenBaseModel
+from noobit_markets.base.transport import HttpTransport
+from noobit_markets.base.ratelimit import RateLimiter
+from noobit_markets.base.retry import RetryPolicy
 
 #binance
 from noobit_markets.exchanges.binance.errors import ERRORS_FROM_EXCHANGE
+from noobit_markets.exchanges.binance import endpoints
 
 
+# pooled keep-alive client, used by default by all coroutines in `interface.py`
+BINANCE_TRANSPORT = HttpTransport(endpoints.BINANCE_ENDPOINTS)
 
+# requests of all coroutines wait here until they are within the rate limits of the exchange
+BINANCE_RATE_LIMITER = RateLimiter(endpoints.BINANCE_RATE_LIMITS)
 
-def get_response_status_code(response_json: pmap) -> Result[PositiveInt, str]:
-    status_code = response_json["status_code"]
+# concurrent identical public requests share the same http call
+BINANCE_PUBLIC_REQUESTS = SingleFlight()
+
+# retries of the rest endpoints of `interface.py` (change attributes to tune, or pass another policy to the interface)
+BINANCE_RETRY_POLICY = RetryPolicy()
+
+
+
+
+def get_response_status_code(response_json: DecodedResponse) -> Result[PositiveInt, str]:
+    status_code = response_json.status_code
     err_msg = f"HTTP Status Error: {status_code}"
     return Ok(status_code) if status_code == 200 else Err(err_msg)
 
 
-def get_sent_request(response_json: pmap) -> str:
-    return response_json["request"]
+def get_sent_request(response_json: DecodedResponse) -> str:
+    return response_json.request
 
 #FIXME binance gives error detail in _content, example :
-#'_content': b'{"code":-1105,"msg":"Parameter \'startTime\' was empty."}'
+#content: {"code":-1105,"msg":"Parameter 'startTime' was empty."}
 #! not applicable to binance (no "error" key)
-def get_error_content(response_json: pmap) -> list:
-    error_content = json.loads(response_json["_content"])
+def get_error_content(response_json: DecodedResponse) -> list:
+    error_content = response_json.content
     return [error_content]
 
 
 #! not applicable to binance (no "result" key)
-def get_result_content(response_json: pmap) -> typing.Any:
+def get_result_content(response_json: DecodedResponse) -> typing.Any:
 
-    try:
-        result_content = json.loads(response_json["_content"])
-        return result_content
-    except json.JSONDecodeError as e:
-        msg = (f"Invalid json string : {response_json['_content']}")
-        raise ValueError(msg) from e
+    if response_json.content is None:
+        msg = (f"Invalid json string : {response_json.raw}")
+        raise ValueError(msg)
+    return response_json.content
 
 
 def parse_error_content(
@@ -74,6 +92,24 @@ async def get_result_content_from_public_req(
         endpoint: str,
     ) -> Result[pmap, typing.Any]:
 
+    # same client, endpoint and validated params: callers get the Result of the request in flight
+    # (a client passed by the caller may have its own settings, proxies ...)
+    key = request_key(id(client), base_url, endpoint, valid_binance_req, headers)
+    return await BINANCE_PUBLIC_REQUESTS.call(
+        key,
+        _get_result_content_from_public_req,
+        client, valid_binance_req, headers, base_url, endpoint
+    )
+
+
+async def _get_result_content_from_public_req(
+        client: ntypes.CLIENT,
+        valid_binance_req: FrozenBaseModel,
+        headers: typing.Mapping,
+        base_url: AnyHttpUrl,
+        endpoint: str,
+    ) -> Result[pmap, typing.Any]:
+
 
     # binance returns error message inside result content
     # no special index like in kraken
@@ -82,17 +118,20 @@ async def get_result_content_from_public_req(
     # input: valid_request_model must be FrozenBaseModel !!! not dict !! // output: pmap
     make_req = make_httpx_get_request(base_url, endpoint, headers, valid_binance_req)
 
-    # input: pmap // output: pmap
+    await BINANCE_RATE_LIMITER.acquire(endpoint, make_req["params"], headers)
+
+    # input: pmap // output: DecodedResponse
     resp = await send_public_request(client, make_req)
     
-    # input: pmap // output: pmap
+    # input: DecodedResponse // output: typing.Any
     result_content = get_result_content(resp)
 
-    # input: pmap // output: Result[PositiveInt, str]
+    # input: DecodedResponse // output: Result[PositiveInt, str]
     valid_status = get_response_status_code(resp)
     if valid_status.is_err():
         err_content = get_error_content(resp)
         parsed_err_content = parse_error_content(err_content, get_sent_request(resp))
+        BINANCE_RATE_LIMITER.on_errors(parsed_err_content.value, endpoint, headers)
         return parsed_err_content
 
     # input: pmap // output: frozenset
@@ -122,17 +161,20 @@ async def get_result_content_from_private_req(
     # input: valid_request_model must be FrozenBaseModel !!! not dict !! // output: pmap
     make_req = make_httpx_post_request(base_url, endpoint, headers, valid_binance_req)
 
-    # input: pmap // output: pmap
+    await BINANCE_RATE_LIMITER.acquire(endpoint, make_req["data"], headers)
+
+    # input: pmap // output: DecodedResponse
     resp = await send_private_request(client, make_req)
 
-    # input: pmap // output: pmap
+    # input: DecodedResponse // output: typing.Any
     result_content = get_result_content(resp)
 
-    # input: pmap // output: Result[PositiveInt, str]
+    # input: DecodedResponse // output: Result[PositiveInt, str]
     valid_status = get_response_status_code(resp)
     if valid_status.is_err():
         err_content = get_error_content(resp)
         parsed_err_content = parse_error_content(err_content, get_sent_request(resp))
+        BINANCE_RATE_LIMITER.on_errors(parsed_err_content.value, endpoint, headers)
         return parsed_err_content
 
     return Ok(result_content)
\ No newline at end of file
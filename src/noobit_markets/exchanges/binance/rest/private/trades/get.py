@@ -11,6 +11,7 @@ from .response import *
 # Base
 from noobit_markets.base import ntypes
 from noobit_markets.base.request import retry_request
+from noobit_markets.base.symbols import inverse
 from noobit_markets.base.models.rest.response import NoobitResponseClosedOrders
 from noobit_markets.base.models.result import Result, Ok, Err
 
@@ -76,7 +77,7 @@ async def get_trades_binance(
         return valid_result_content
     
 
-    symbols_from_exchange = {v: k for k, v in symbols_to_exchange.items()}
+    symbols_from_exchange = inverse(symbols_to_exchange)
 
     # input: typing.Tuple[tuple] // output: typing.Tuple[pmap]
     parsed_result = parse_result_data_trades(valid_result_content.value, symbols_from_exchange) 
@@ -1,3 +1,5 @@
+import typing
+
 import pydantic
 
 from .request import *
@@ -6,7 +8,7 @@ from .response import *
 
 # Base
 from noobit_markets.base import ntypes
-from noobit_markets.base.request import retry_request
+from noobit_markets.base.symbols import inverse
 from noobit_markets.base.models.rest.response import NoobitResponseInstrument
 
 # binance
@@ -15,7 +17,6 @@ from noobit_markets.exchanges.binance.rest.base import get_result_content_from_p
 
 
 
-@retry_request(retries=10, logger=lambda *args: print("===xxxxx>>>> : ", *args))
 async def get_instrument_binance(
         client: ntypes.CLIENT,
         symbol: ntypes.SYMBOL,
@@ -52,7 +53,7 @@ async def get_instrument_binance(
     if valid_result_content.is_err():
         return valid_result_content
 
-    symbol_from_exchange = {v: k for k, v in symbol_to_exchange.items()}
+    symbol_from_exchange = inverse(symbol_to_exchange)
 
     # input: typing.Tuple[tuple] // output: typing.Tuple[pmap]
     parsed_result = parse_result_data_instrument(valid_result_content.value, symbol, symbol_from_exchange )
@@ -61,3 +62,64 @@ async def get_instrument_binance(
     # input: typing.Tuple[pmap] //  output: Result[NoobitResponseOhlc, ValidationError]
     valid_parsed_response_data = validate_parsed_result_data_instrument(parsed_result, result_content.value)
     return valid_parsed_response_data
+
+
+
+
+async def get_instruments_binance(
+        client: ntypes.CLIENT,
+        symbols: typing.Iterable[ntypes.SYMBOL],
+        symbol_to_exchange: ntypes.SYMBOL_TO_EXCHANGE,
+        base_url: pydantic.AnyHttpUrl = endpoints.BINANCE_ENDPOINTS.public.url,
+        endpoint: str = endpoints.BINANCE_ENDPOINTS.public.endpoints.instrument,
+    ) -> Result[typing.Mapping[ntypes.SYMBOL, NoobitResponseInstrument], Exception]:
+    """Instruments of all `symbols` in a single request.
+    """
+
+
+    # output: Result[NoobitRequestInstruments, ValidationError]
+    valid_req = validate_request_instruments(symbols, symbol_to_exchange)
+    if valid_req.is_err():
+        return valid_req
+
+    symbols = valid_req.value.symbols
+
+
+    # output: pmap
+    parsed_req = parse_request_instruments(valid_req.value)
+
+
+    # output: Result[BinanceRequestInstruments, ValidationError]
+    valid_binance_req = validate_parsed_request_instruments(parsed_req)
+    if valid_binance_req.is_err():
+        return valid_binance_req
+
+
+    headers = {}
+    result_content = await get_result_content_from_public_req(client, valid_binance_req.value, headers, base_url, endpoint)
+    if result_content.is_err():
+        return result_content
+
+
+    # input: typing.Tuple[pmap] // output: Result[typing.Tuple[BinanceResponseInstrument, ...], Exception]
+    valid_result_content = validate_raw_result_content_instruments(result_content.value, symbols, symbol_to_exchange)
+    if valid_result_content.is_err():
+        return valid_result_content
+
+
+    symbol_from_exchange = inverse(symbol_to_exchange)
+
+    instruments = {}
+    for raw_item, result_data in zip(result_content.value, valid_result_content.value):
+
+        symbol = symbol_from_exchange[result_data.symbol]
+        parsed_result = parse_result_data_instrument(result_data, symbol, symbol_from_exchange)
+
+        # raw json of each instrument is only its own item
+        valid_parsed_response_data = validate_parsed_result_data_instrument(parsed_result, raw_item)
+        if valid_parsed_response_data.is_err():
+            return valid_parsed_response_data
+
+        instruments[symbol] = valid_parsed_response_data.value
+
+    return Ok(pmap(instruments))
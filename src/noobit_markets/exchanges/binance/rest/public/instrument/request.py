@@ -6,7 +6,7 @@ from pydantic import ValidationError, constr
 
 from noobit_markets.base import ntypes
 from noobit_markets.base.models.frozenbase import FrozenBaseModel
-from noobit_markets.base.models.rest.request import NoobitRequestInstrument
+from noobit_markets.base.models.rest.request import NoobitRequestInstrument, NoobitRequestInstruments
 
 from noobit_markets.base.models.result import Ok, Err, Result
 
@@ -21,6 +21,12 @@ class BinanceRequestInstrument(FrozenBaseModel):
     symbol: constr(regex=r'[A-Z]+')
 
 
+class BinanceRequestInstruments(FrozenBaseModel):
+
+    # json array of symbols, without spaces: ["BTCUSDT","ETHUSDT"]
+    symbols: constr(regex=r'^\["[A-Z0-9]+"(,"[A-Z0-9]+")*\]$')
+
+
 
 
 # ============================================================
@@ -42,6 +48,19 @@ def parse_request_instrument(
     return pmap(payload)
 
 
+def parse_request_instruments(
+        valid_request: NoobitRequestInstruments
+    ) -> pmap:
+
+    exch_symbols = (valid_request.symbol_mapping[symbol] for symbol in valid_request.symbols)
+
+    payload = {
+        "symbols": "[" + ",".join(f'"{exch_symbol}"' for exch_symbol in exch_symbols) + "]",
+    }
+
+    return pmap(payload)
+
+
 
 
 # ============================================================
@@ -84,3 +103,33 @@ def validate_parsed_request_instrument(
 
     except Exception as e:
         raise e
+
+
+def validate_request_instruments(
+        symbols: typing.Iterable[ntypes.SYMBOL],
+        symbol_mapping: ntypes.SYMBOL_TO_EXCHANGE,
+    ) -> Result[NoobitRequestInstruments, ValidationError]:
+
+    try:
+        valid_req = NoobitRequestInstruments(
+            symbols=tuple(symbols),
+            symbol_mapping=symbol_mapping,
+        )
+        return Ok(valid_req)
+
+    except ValidationError as e:
+        return Err(e)
+
+
+def validate_parsed_request_instruments(
+        parsed_request: pmap
+    ) -> Result[BinanceRequestInstruments, ValidationError]:
+
+    try:
+        validated = BinanceRequestInstruments(
+            **parsed_request
+        )
+        return Ok(validated)
+
+    except ValidationError as e:
+        return Err(e)
@@ -146,6 +146,26 @@ def validate_raw_result_content_instrument(
         raise e
 
 
+def validate_raw_result_content_instruments(
+        result_content: typing.Tuple[pmap],
+        symbols: typing.Tuple[ntypes.SYMBOL, ...],
+        symbol_mapping: ntypes.SYMBOL_TO_EXCHANGE
+    ) -> Result[typing.Tuple[BinanceResponseInstrument, ...], Exception]:
+
+    try:
+        validated = tuple(BinanceResponseInstrument(**item) for item in result_content)
+    except (ValidationError, TypeError) as e:
+        return Err(e)
+
+    # one item per requested symbol
+    requested = set(symbol_mapping[symbol] for symbol in symbols)
+    received = set(item.symbol for item in validated)
+    if requested != received:
+        return Err(ValueError(f"Requested : {sorted(requested)}, got : {sorted(received)}"))
+
+    return Ok(validated)
+
+
 def validate_parsed_result_data_instrument(
         parsed_result: typing.Tuple[pmap],
         raw_json: typing.Any
@@ -9,7 +9,11 @@ from pydantic import PositiveInt, PositiveFloat, create_model, ValidationError,
 # noobit base
 from noobit_markets.base import ntypes
 from noobit_markets.base.models.frozenbase import FrozenBaseModel
+from noobit_markets.base.models.trusted import construct_trusted
 from noobit_markets.base.models.rest.response import NoobitResponseOhlc
+from noobit_markets.base.models.rest.records import OhlcRecord
+from noobit_markets.base.fixedpoint import Scale
+from noobit_markets.base.models.rest.columnar import NoobitColumnsOhlc, transpose
 from noobit_markets.base.models.result import Ok, Err, Result
 
 
@@ -117,7 +121,7 @@ def verify_symbol_ohlc(
 def parse_result_data_ohlc(
         result_data: typing.Tuple[tuple],
         symbol: ntypes.SYMBOL
-    ) -> typing.Tuple[pmap]:
+    ) -> typing.Tuple[OhlcRecord, ...]:
 
     parsed_ohlc = [_single_candle(data, symbol) for data in result_data]
 
@@ -127,7 +131,7 @@ def parse_result_data_ohlc(
 def _single_candle(
         data: tuple,
         symbol: ntypes.SYMBOL
-    ) -> pmap:
+    ) -> OhlcRecord:
 
     parsed = {
         "symbol": symbol,
@@ -141,7 +145,38 @@ def _single_candle(
         "trdCount": data[8]
     }
 
-    return pmap(parsed)
+    return OhlcRecord(**parsed)
+
+
+
+
+def parse_result_data_ohlc_columnar(
+        result_content: typing.Sequence[list],
+        symbol: ntypes.SYMBOL,
+        scale: typing.Optional[Scale] = None
+    ) -> Result[NoobitColumnsOhlc, ValueError]:
+
+    # raw rows : open time, open, high, low, close, volume, close time,
+    #   quote volume, count, taker base volume, taker quote volume, ignore
+    open_time, _open, high, low, close, volume, _close_time, _quote_volume, count, *_ = transpose(result_content, 12)
+
+    try:
+        columns = NoobitColumnsOhlc(
+            symbol,
+            rawJson=result_content,
+            scale=scale,
+            utcTime=open_time,
+            open=_open,
+            high=high,
+            low=low,
+            close=close,
+            volume=volume,
+            trdCount=count
+        )
+        return Ok(columns)
+
+    except (ValueError, TypeError) as e:
+        return Err(e)
 
 
 
@@ -155,9 +190,13 @@ def _single_candle(
 def validate_raw_result_content_ohlc(
         result_content: pmap,
         symbol: ntypes.SYMBOL,
-        symbol_mapping: ntypes.SYMBOL_TO_EXCHANGE
+        symbol_mapping: ntypes.SYMBOL_TO_EXCHANGE,
+        validation: ntypes.VALIDATION = "full"
     ) -> Result[BinanceResponseOhlc, ValidationError]:
 
+    if validation != "full":
+        return Ok(construct_trusted(BinanceResponseOhlc, {"ohlc": result_content}))
+
 
     try:
         validated = BinanceResponseOhlc(
@@ -175,9 +214,13 @@ def validate_raw_result_content_ohlc(
 def validate_parsed_result_data_ohlc(
         parsed_result_ohlc: typing.Tuple[pmap],
         parsed_result_last: PositiveInt,
-        raw_json: typing.Any
+        raw_json: typing.Any,
+        validation: ntypes.VALIDATION = "full"
     ) -> Result[NoobitResponseOhlc, ValidationError]:
 
+    if validation == "none":
+        return Ok(construct_trusted(NoobitResponseOhlc, {"ohlc": parsed_result_ohlc, "rawJson": raw_json}))
+
     try:
         validated = NoobitResponseOhlc(
             ohlc=parsed_result_ohlc,
@@ -6,8 +6,8 @@ from .response import *
 
 # Base
 from noobit_markets.base import ntypes
-from noobit_markets.base.request import retry_request
 from noobit_markets.base.models.rest.response import NoobitResponseOrderBook
+from noobit_markets.base.models.trusted import validate_level
 
 # binance
 from noobit_markets.exchanges.binance import endpoints
@@ -15,7 +15,6 @@ from noobit_markets.exchanges.binance.rest.base import get_result_content_from_p
 
 
 
-@retry_request(retries=10, logger=lambda *args: print("===xxxxx>>>> : ", *args))
 async def get_orderbook_binance(
         client: ntypes.CLIENT,
         symbol: ntypes.SYMBOL,
@@ -23,9 +22,16 @@ async def get_orderbook_binance(
         depth: ntypes.DEPTH,
         base_url: pydantic.AnyHttpUrl = endpoints.BINANCE_ENDPOINTS.public.url,
         endpoint: str = endpoints.BINANCE_ENDPOINTS.public.endpoints.orderbook,
+        validation: ntypes.VALIDATION = "full",
     ) -> Result[NoobitResponseOrderBook, Exception]:
 
 
+    # output: Result[ntypes.VALIDATION, ValueError]
+    valid_level = validate_level(validation)
+    if valid_level.is_err():
+        return valid_level
+
+
     # output: Result[NoobitRequestOhlc, ValidationError]
     valid_req = validate_request_orderbook(symbol, symbol_to_exchange, depth) 
     if valid_req.is_err():
@@ -49,7 +55,7 @@ async def get_orderbook_binance(
 
 
     # input: pmap // output: Result[BinanceResponseOhlc, ValidationError]
-    valid_result_content = validate_raw_result_content_orderbook(result_content.value, symbol, symbol_to_exchange)
+    valid_result_content = validate_raw_result_content_orderbook(result_content.value, symbol, symbol_to_exchange, validation)
     if valid_result_content.is_err():
         return valid_result_content
 
@@ -59,5 +65,5 @@ async def get_orderbook_binance(
 
 
     # input: typing.Tuple[pmap] //  output: Result[NoobitResponseOhlc, ValidationError]
-    valid_parsed_response_data = validate_parsed_result_data_orderbook(parsed_result_ob, result_content.value)
+    valid_parsed_response_data = validate_parsed_result_data_orderbook(parsed_result_ob, result_content.value, validation)
     return valid_parsed_response_data
@@ -10,6 +10,7 @@ from pydantic import PositiveInt, PositiveFloat, create_model, ValidationError,
 # noobit base
 from noobit_markets.base import ntypes
 from noobit_markets.base.models.frozenbase import FrozenBaseModel
+from noobit_markets.base.models.trusted import construct_trusted
 from noobit_markets.base.models.rest.response import NoobitResponseOrderBook
 from noobit_markets.base.models.result import Ok, Err, Result
 
@@ -85,9 +86,13 @@ def parse_result_data_orderbook(
 def validate_raw_result_content_orderbook(
         result_content: pmap,
         symbol: ntypes.SYMBOL,
-        symbol_mapping: ntypes.SYMBOL_TO_EXCHANGE
+        symbol_mapping: ntypes.SYMBOL_TO_EXCHANGE,
+        validation: ntypes.VALIDATION = "full"
     ) -> Result[BinanceResponseOrderBook, ValidationError]:
 
+    if validation != "full":
+        return Ok(construct_trusted(BinanceResponseOrderBook, result_content))
+
 
     try:
         validated = BinanceResponseOrderBook(
@@ -104,9 +109,13 @@ def validate_raw_result_content_orderbook(
 
 def validate_parsed_result_data_orderbook(
         parsed_result: typing.Tuple[pmap],
-        raw_json: typing.Any
+        raw_json: typing.Any,
+        validation: ntypes.VALIDATION = "full"
     ) -> Result[NoobitResponseOrderBook, ValidationError]:
 
+    if validation == "none":
+        return Ok(construct_trusted(NoobitResponseOrderBook, {**parsed_result, "rawJson": raw_json}))
+
     try:
         validated = NoobitResponseOrderBook(
             **parsed_result,
@@ -1,3 +1,4 @@
+import typing
 import asyncio
 
 import pydantic
@@ -8,7 +9,7 @@ from .response import *
 
 # Base
 from noobit_markets.base import ntypes
-from noobit_markets.base.request import retry_request
+from noobit_markets.base.symbols import inverse
 from noobit_markets.base.models.rest.response import NoobitResponseSpread
 
 # binance
@@ -17,7 +18,6 @@ from noobit_markets.exchanges.binance.rest.base import get_result_content_from_p
 
 
 
-@retry_request(retries=10, logger=lambda *args: print("===xxxxx>>>> : ", *args))
 async def get_spread_binance(
         client: ntypes.CLIENT,
         symbol: ntypes.SYMBOL,
@@ -55,7 +55,7 @@ async def get_spread_binance(
         return valid_result_content
 
 
-    symbol_from_exchange = {v: k for k, v in symbol_to_exchange.items()}
+    symbol_from_exchange = inverse(symbol_to_exchange)
 
     # input: typing.Tuple[tuple] // output: typing.Tuple[pmap]
     parsed_result = parse_result_data_spread(valid_result_content.value, symbol, symbol_from_exchange )
@@ -64,3 +64,64 @@ async def get_spread_binance(
     # input: typing.Tuple[pmap] //  output: Result[NoobitResponseOhlc, ValidationError]
     valid_parsed_response_data = validate_parsed_result_data_spread(parsed_result, result_content.value)
     return valid_parsed_response_data
+
+
+
+
+async def get_spreads_binance(
+        client: ntypes.CLIENT,
+        symbols: typing.Iterable[ntypes.SYMBOL],
+        symbol_to_exchange: ntypes.SYMBOL_TO_EXCHANGE,
+        base_url: pydantic.AnyHttpUrl = endpoints.BINANCE_ENDPOINTS.public.url,
+        endpoint: str = endpoints.BINANCE_ENDPOINTS.public.endpoints.spread,
+    ) -> Result[typing.Mapping[ntypes.SYMBOL, NoobitResponseSpread], Exception]:
+    """Spreads of all `symbols` in a single request.
+    """
+
+
+    # output: Result[NoobitRequestSpreads, ValidationError]
+    valid_req = validate_request_spreads(symbols, symbol_to_exchange)
+    if valid_req.is_err():
+        return valid_req
+
+    symbols = valid_req.value.symbols
+
+
+    # output: pmap
+    parsed_req = parse_request_spreads(valid_req.value)
+
+
+    # output: Result[BinanceRequestSpreads, ValidationError]
+    valid_binance_req = validate_parsed_request_spreads(parsed_req)
+    if valid_binance_req.is_err():
+        return valid_binance_req
+
+
+    headers = {}
+    result_content = await get_result_content_from_public_req(client, valid_binance_req.value, headers, base_url, endpoint)
+    if result_content.is_err():
+        return result_content
+
+
+    # input: typing.Tuple[pmap] // output: Result[typing.Tuple[BinanceResponseSpread, ...], Exception]
+    valid_result_content = validate_raw_result_content_spreads(result_content.value, symbols, symbol_to_exchange)
+    if valid_result_content.is_err():
+        return valid_result_content
+
+
+    symbol_from_exchange = inverse(symbol_to_exchange)
+
+    spreads = {}
+    for raw_item, result_data in zip(result_content.value, valid_result_content.value):
+
+        symbol = symbol_from_exchange[result_data.symbol]
+        parsed_result = parse_result_data_spread(result_data, symbol, symbol_from_exchange)
+
+        # raw json of each spread is only its own item
+        valid_parsed_response_data = validate_parsed_result_data_spread(parsed_result, raw_item)
+        if valid_parsed_response_data.is_err():
+            return valid_parsed_response_data
+
+        spreads[symbol] = valid_parsed_response_data.value
+
+    return Ok(pmap(spreads))
@@ -6,7 +6,7 @@ from pydantic import ValidationError, constr
 
 from noobit_markets.base import ntypes
 from noobit_markets.base.models.frozenbase import FrozenBaseModel
-from noobit_markets.base.models.rest.request import NoobitRequestSpread
+from noobit_markets.base.models.rest.request import NoobitRequestSpread, NoobitRequestSpreads
 
 from noobit_markets.base.models.result import Ok, Err, Result
 
@@ -21,6 +21,12 @@ class BinanceRequestSpread(FrozenBaseModel):
     symbol: constr(regex=r'[A-Z]+')
 
 
+class BinanceRequestSpreads(FrozenBaseModel):
+
+    # json array of symbols, without spaces: ["BTCUSDT","ETHUSDT"]
+    symbols: constr(regex=r'^\["[A-Z0-9]+"(,"[A-Z0-9]+")*\]$')
+
+
 
 
 # ============================================================
@@ -42,6 +48,19 @@ def parse_request_spread(
     return pmap(payload)
 
 
+def parse_request_spreads(
+        valid_request: NoobitRequestSpreads
+    ) -> pmap:
+
+    exch_symbols = (valid_request.symbol_mapping[symbol] for symbol in valid_request.symbols)
+
+    payload = {
+        "symbols": "[" + ",".join(f'"{exch_symbol}"' for exch_symbol in exch_symbols) + "]",
+    }
+
+    return pmap(payload)
+
+
 
 
 # ============================================================
@@ -83,4 +102,34 @@ def validate_parsed_request_spread(
         return Err(e)
 
     except Exception as e:
-        raise e
\ No newline at end of file
+        raise e
+
+
+def validate_request_spreads(
+        symbols: typing.Iterable[ntypes.SYMBOL],
+        symbol_mapping: ntypes.SYMBOL_TO_EXCHANGE,
+    ) -> Result[NoobitRequestSpreads, ValidationError]:
+
+    try:
+        valid_req = NoobitRequestSpreads(
+            symbols=tuple(symbols),
+            symbol_mapping=symbol_mapping,
+        )
+        return Ok(valid_req)
+
+    except ValidationError as e:
+        return Err(e)
+
+
+def validate_parsed_request_spreads(
+        parsed_request: pmap
+    ) -> Result[BinanceRequestSpreads, ValidationError]:
+
+    try:
+        validated = BinanceRequestSpreads(
+            **parsed_request
+        )
+        return Ok(validated)
+
+    except ValidationError as e:
+        return Err(e)
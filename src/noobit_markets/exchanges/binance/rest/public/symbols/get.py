@@ -1,4 +1,5 @@
 import asyncio
+import functools
 
 import pydantic
 
@@ -7,16 +8,15 @@ from .response import *
 
 # Base
 from noobit_markets.base import ntypes
-from noobit_markets.base.request import retry_request
 from noobit_markets.base.models.rest.response import NoobitResponseSymbols
+from noobit_markets.base.symbols import SymbolsRegistry
 
 # binance
 from noobit_markets.exchanges.binance import endpoints
-from noobit_markets.exchanges.binance.rest.base import get_result_content_from_public_req
+from noobit_markets.exchanges.binance.rest.base import get_result_content_from_public_req, BINANCE_TRANSPORT
 
 
 
-@retry_request(retries=10, logger=lambda *args: print("===xxxxx>>>> : ", *args))
 async def get_symbols_binance(
         client: ntypes.CLIENT,
         base_url: pydantic.AnyHttpUrl = endpoints.BINANCE_ENDPOINTS.public.url,
@@ -47,3 +47,9 @@ async def get_symbols_binance(
     # input: typing.Tuple[pmap] //  output: Result[NoobitResponseOhlc, ValidationError]
     valid_parsed_response_data = validate_parsed_result_data_symbols(parsed_result, result_content.value)
     return valid_parsed_response_data
+
+
+
+
+# symbols used by endpoints called without symbol mappings (see interface)
+BINANCE_SYMBOLS = SymbolsRegistry("binance", functools.partial(get_symbols_binance, client=BINANCE_TRANSPORT))
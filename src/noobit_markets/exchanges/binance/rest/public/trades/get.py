@@ -8,8 +8,9 @@ from .response import *
 
 # Base
 from noobit_markets.base import ntypes
-from noobit_markets.base.request import retry_request
+from noobit_markets.base.fixedpoint import Scale
 from noobit_markets.base.models.rest.response import NoobitResponseTrades
+from noobit_markets.base.models.trusted import validate_level
 
 # binance
 from noobit_markets.exchanges.binance import endpoints
@@ -17,7 +18,6 @@ from noobit_markets.exchanges.binance.rest.base import get_result_content_from_p
 
 
 
-@retry_request(retries=10, logger=lambda *args: print("===xxxxx>>>> : ", *args))
 async def get_trades_binance(
         client: ntypes.CLIENT,
         symbol: ntypes.SYMBOL,
@@ -25,9 +25,18 @@ async def get_trades_binance(
         since: typing.Optional[ntypes.TIMESTAMP] = None,
         base_url: pydantic.AnyHttpUrl = endpoints.BINANCE_ENDPOINTS.public.url,
         endpoint: str = endpoints.BINANCE_ENDPOINTS.public.endpoints.trades,
+        validation: ntypes.VALIDATION = "full",
+        columnar: bool = False,
+        scale: typing.Optional[Scale] = None,
     ) -> Result[NoobitResponseTrades, Exception]:
 
 
+    # output: Result[ntypes.VALIDATION, ValueError]
+    valid_level = validate_level(validation)
+    if valid_level.is_err():
+        return valid_level
+
+
     # output: Result[NoobitRequestTrades, ValidationError]
     valid_req = validate_base_request_trades(symbol, symbol_to_exchange)
     if valid_req.is_err():
@@ -50,8 +59,12 @@ async def get_trades_binance(
         return result_content
 
 
+    # input: pmap // output: Result[NoobitColumnsTrades, ValueError]
+    if columnar:
+        return parse_result_data_trades_columnar(result_content.value, symbol, scale)
+
     # input: pmap // output: Result[BinanceResponseTrades, ValidationError]
-    valid_result_content = validate_raw_result_content_trades(result_content.value, symbol, symbol_to_exchange)
+    valid_result_content = validate_raw_result_content_trades(result_content.value, symbol, symbol_to_exchange, validation)
     if valid_result_content.is_err():
         return valid_result_content
 
@@ -61,5 +74,5 @@ async def get_trades_binance(
 
 
     # input: typing.Tuple[pmap] //  output: Result[NoobitResponseTrades, ValidationError]
-    valid_parsed_response_data = validate_parsed_result_data_trades(parsed_result_ob, result_content.value)
+    valid_parsed_response_data = validate_parsed_result_data_trades(parsed_result_ob, result_content.value, validation)
     return valid_parsed_response_data
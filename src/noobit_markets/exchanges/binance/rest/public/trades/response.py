@@ -10,7 +10,11 @@ from pydantic import PositiveInt, PositiveFloat, create_model, ValidationError,
 # noobit base
 from noobit_markets.base import ntypes
 from noobit_markets.base.models.frozenbase import FrozenBaseModel
+from noobit_markets.base.models.trusted import construct_trusted
 from noobit_markets.base.models.rest.response import NoobitResponseTrades
+from noobit_markets.base.models.rest.records import TradeRecord
+from noobit_markets.base.fixedpoint import Scale
+from noobit_markets.base.models.rest.columnar import NoobitColumnsTrades, SIDE_BUY, SIDE_SELL, ORDTYPE_MARKET
 from noobit_markets.base.models.result import Ok, Err, Result
 
 
@@ -67,7 +71,7 @@ class BinanceResponseTrades(FrozenBaseModel):
 def parse_result_data_trades(
         result_data: BinanceResponseTrades,
         symbol: ntypes.SYMBOL
-    ) -> typing.Tuple[pmap]:
+    ) -> typing.Tuple[TradeRecord, ...]:
 
     parsed_trades = [_single_trade(data, symbol) for data in result_data]
 
@@ -78,7 +82,7 @@ def parse_result_data_trades(
 def _single_trade(
         data: _SingleTrade,
         symbol: ntypes.SYMBOL
-    ):
+    ) -> TradeRecord:
     parsed = {
         "symbol": symbol,
         "orderID": None,
@@ -95,7 +99,33 @@ def _single_trade(
         "text": None
     }
 
-    return pmap(parsed)
+    return TradeRecord(**parsed)
+
+
+
+
+def parse_result_data_trades_columnar(
+        result_content: typing.Sequence[dict],
+        symbol: ntypes.SYMBOL,
+        scale: typing.Optional[Scale] = None
+    ) -> Result[NoobitColumnsTrades, ValueError]:
+
+    try:
+        columns = NoobitColumnsTrades(
+            symbol,
+            rawJson=result_content,
+            scale=scale,
+            transactTime=[trade["time"] for trade in result_content],
+            side=[SIDE_SELL if trade["isBuyerMaker"] else SIDE_BUY for trade in result_content],
+            # binance only lists market orders
+            ordType=[ORDTYPE_MARKET] * len(result_content),
+            avgPx=[trade["price"] for trade in result_content],
+            cumQty=[trade["quoteQty"] for trade in result_content]
+        )
+        return Ok(columns)
+
+    except (KeyError, ValueError, TypeError) as e:
+        return Err(e)
 
 
 
@@ -108,9 +138,13 @@ def _single_trade(
 def validate_raw_result_content_trades(
         result_content: pmap,
         symbol: ntypes.SYMBOL,
-        symbol_mapping: ntypes.SYMBOL_TO_EXCHANGE
+        symbol_mapping: ntypes.SYMBOL_TO_EXCHANGE,
+        validation: ntypes.VALIDATION = "full"
     ) -> Result[BinanceResponseTrades, ValidationError]:
 
+    if validation != "full":
+        return Ok(construct_trusted(BinanceResponseTrades, {"trades": result_content}))
+
 
     try:
         validated = BinanceResponseTrades(
@@ -127,9 +161,13 @@ def validate_raw_result_content_trades(
 
 def validate_parsed_result_data_trades(
         parsed_result: typing.Tuple[pmap],
-        raw_json: typing.Any
+        raw_json: typing.Any,
+        validation: ntypes.VALIDATION = "full"
     ) -> Result[NoobitResponseTrades, ValidationError]:
 
+    if validation == "none":
+        return Ok(construct_trusted(NoobitResponseTrades, {"trades": parsed_result, "rawJson": raw_json}))
+
     try:
         validated = NoobitResponseTrades(
             trades=parsed_result,
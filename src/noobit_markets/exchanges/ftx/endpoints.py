@@ -1,3 +1,4 @@
+from noobit_markets.base import ratelimit
 from noobit_markets.base.models.rest import endpoints
 
 
@@ -42,4 +43,13 @@ FTX_ENDPOINTS = endpoints.RESTEndpoints(**{
             "ws_token": "GetWebSocketsToken",
         }
     }
-})
\ No newline at end of file
+})
+
+
+# https://docs.ftx.com/#rate-limits
+#   30 requests per second per ip, all endpoints (url includes market name, so no cost per endpoint)
+FTX_RATE_LIMITS = ratelimit.RateLimits(
+    limits={"requests": ratelimit.RateLimit(capacity=30, rate=30)},
+    costs={},
+    default={"requests": 1},
+)
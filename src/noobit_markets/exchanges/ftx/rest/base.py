@@ -1,7 +1,5 @@
 import typing
-import inspect
 
-import httpx
 from pydantic import PositiveInt, AnyHttpUrl
 
 import stackprinter
@@ -10,58 +8,54 @@ stackprinter.set_excepthook(style="darkbg2")
 # base
 from noobit_markets.base import ntypes
 from noobit_markets.base.errors import BadRequest, BaseError
+from noobit_markets.base.request import decode_response, DecodedResponse, SingleFlight, request_key
 from noobit_markets.base.models.result import Ok, Err, Result
 from noobit_markets.base.models.frozenbase import FrozenBaseModel
+from noobit_markets.base.transport import HttpTransport
+from noobit_markets.base.ratelimit import RateLimiter
+from noobit_markets.base.retry import RetryPolicy
 
 # Ftx
 from noobit_markets.exchanges.ftx.errors import ERRORS_FROM_EXCHANGE
+from noobit_markets.exchanges.ftx import endpoints
 
 
+# pooled keep-alive client (ftx has no interface yet, pass it as the `client` of the coroutines)
+FTX_TRANSPORT = HttpTransport(endpoints.FTX_ENDPOINTS)
 
-# response_json = object as returned by httpx.AsyncClient.request
-def get_response_status_code(resp_obj: httpx.Response) -> Result[PositiveInt, str]:
-    # status_code = response_json.status_code
-    # err_msg = f"HTTP Status Error: {status_code}"
-    # return Ok(status_code) if status_code == 200 else Err(err_msg)
+# requests of all coroutines wait here until they are within the rate limits of the exchange
+FTX_RATE_LIMITER = RateLimiter(endpoints.FTX_RATE_LIMITS)
 
-    status_keys = [k for k in resp_obj.__dict__.keys() if "status" in k]
-    
-    if len(status_keys) > 1:
-        raise KeyError(f"Found multiple <status> keys in {resp_obj.__dict__.keys()}")
+# concurrent identical GET requests share the same http call
+FTX_GET_REQUESTS = SingleFlight()
 
-    status = getattr(resp_obj, status_keys[0])
-     
-    if status == 200:
-        return Ok(status)
-    else:
-        msg = f"Http Status Error: {status}"
-        return Err(BadRequest(raw_error=msg, sent_request=get_sent_request(resp_obj)))
+# retries of the rest endpoints (ftx has no interface yet, coroutines are decorated with it)
+FTX_RETRY_POLICY = RetryPolicy()
 
 
-def get_sent_request(resp_obj: httpx.Response) -> str:
-    req_keys = [k for k in resp_obj.__dict__.keys() if "request" in k]
 
-    if len(req_keys) > 1:
-        raise KeyError(f"Found multiple <request> keys in {resp_obj.__dict__.keys()}")
+# resp_obj = response decoded once by `decode_response`
+def get_response_status_code(resp_obj: DecodedResponse) -> Result[PositiveInt, str]:
 
-    return getattr(resp_obj, req_keys[0])
+    status = resp_obj.status_code
 
+    if status == 200:
+        return Ok(status)
+    else:
+        msg = f"Http Status Error: {status}"
+        return Err(BadRequest(raw_error=msg, sent_request=get_sent_request(resp_obj)))
 
-async def resp_json(resp_obj: httpx.Response):
 
-    if inspect.iscoroutinefunction(resp_obj.json):
-        return await resp_obj.json()
-    else:
-        return resp_obj.json()
+def get_sent_request(resp_obj: DecodedResponse) -> str:
+    return resp_obj.request
 
 
-async def get_error_content(resp_obj: httpx.Response) -> frozenset:
+def get_error_content(resp_obj: DecodedResponse) -> frozenset:
 
     # example of ftx error response content:
     #  {"error":"Not logged in","success":false}
 
-    # content = resp_obj.json()
-    content = await resp_json(resp_obj)
+    content = resp_obj.content
 
     if content["success"]:
         return None
@@ -70,20 +64,19 @@ async def get_error_content(resp_obj: httpx.Response) -> frozenset:
         return frozenset(error_content)
 
 
-async def get_result_content(resp_obj: httpx.Response) -> typing.Union[list, dict]:
+def get_result_content(resp_obj: DecodedResponse) -> typing.Union[list, dict]:
 
     # example of ftx orderbook response content 
     # {
     # "success": true, "result": {"asks": [[4114.25, 6.263]], "bids": [[4112.25, 49.]]}
     # }
 
-    content = await resp_json(resp_obj)
-    return content["result"]
+    return resp_obj.content["result"]
 
 
 def parse_error_content(
         error_content: frozenset,
-        sent_request: httpx.Request
+        sent_request: typing.Any
     ) -> Err[typing.Tuple[BaseError]]:
 
     tupled = tuple([ERRORS_FROM_EXCHANGE[error](error_content, sent_request) for error in error_content])
@@ -98,6 +91,27 @@ async def get_result_content_from_req(
         headers: typing.Mapping,
     ):
 
+    if method != "GET":
+        return await _get_result_content_from_req(client, method, url, valid_req, headers)
+
+    # same client, url and validated params: callers get the Result of the request in flight
+    # (signed requests have a timestamp in their headers, so they are never shared)
+    key = request_key(id(client), url, valid_req, headers)
+    return await FTX_GET_REQUESTS.call(
+        key,
+        _get_result_content_from_req,
+        client, method, url, valid_req, headers
+    )
+
+
+async def _get_result_content_from_req(
+        client: ntypes.CLIENT,
+        method: str,
+        url: AnyHttpUrl,
+        valid_req: FrozenBaseModel,
+        headers: typing.Mapping,
+    ):
+
     payload = {
         "method": method,
         "url": url,
@@ -115,22 +129,27 @@ async def get_result_content_from_req(
     else: 
         raise NotImplementedError(f"Unsupported method : {method}")
 
-    resp = await client.request(**payload)
+    await FTX_RATE_LIMITER.acquire(url, query, headers)
+
+    # works for both httpx and aiohttp clients
+    # ftx sends prices and sizes as json numbers, decoded to Decimal without going through float
+    resp = await decode_response(await client.request(**payload), decimal=True)
     
     valid_status = get_response_status_code(resp)
     if valid_status.is_err():
         return valid_status
 
-    # input: pmap // output: frozenset
-    err_content = await get_error_content(resp)
+    # input: DecodedResponse // output: frozenset
+    err_content = get_error_content(resp)
     if  err_content:
         # input: tuple // output: Err[typing.Tuple[BaseError]]
         parsed_err_content = parse_error_content(err_content, get_sent_request(resp))
+        FTX_RATE_LIMITER.on_errors(parsed_err_content.value, url, headers)
         # print("//////", parsed_err_content.value[0].accept)
         return parsed_err_content
 
-    # input: pmap // output: pmap
-    result_content = await get_result_content(resp)
+    # input: DecodedResponse // output: typing.Union[list, dict]
+    result_content = get_result_content(resp)
 
     return Ok(result_content)
         
@@ -8,18 +8,18 @@ from .response import (
 
 # Base
 from noobit_markets.base import ntypes
-from noobit_markets.base.request import retry_request
+from noobit_markets.base.retry import retrying
 from noobit_markets.base.models.rest.response import NoobitResponseBalances
 from noobit_markets.base.models.frozenbase import FrozenBaseModel
 from noobit_markets.base.models.result import Result, Ok
 
 # FTX
 from noobit_markets.exchanges.ftx import endpoints
-from noobit_markets.exchanges.ftx.rest.base import get_result_content_from_req
+from noobit_markets.exchanges.ftx.rest.base import get_result_content_from_req, FTX_RETRY_POLICY
 from noobit_markets.exchanges.ftx.rest.auth import FtxAuth
 
 
-@retry_request(retries=10, logger=lambda *args: print("===xxxxx>>>> : ", *args))
+@retrying(FTX_RETRY_POLICY)
 async def get_balances_ftx(
         client: ntypes.CLIENT,
         asset_from_exchange: ntypes.ASSET_FROM_EXCHANGE,
@@ -8,7 +8,11 @@ from pydantic import ValidationError
 # noobit base
 from noobit_markets.base import ntypes
 from noobit_markets.base.models.frozenbase import FrozenBaseModel
+from noobit_markets.base.models.trusted import construct_trusted
 from noobit_markets.base.models.rest.response import NoobitResponseOhlc
+from noobit_markets.base.models.rest.records import OhlcRecord
+from noobit_markets.base.fixedpoint import Scale
+from noobit_markets.base.models.rest.columnar import NoobitColumnsOhlc
 from noobit_markets.base.models.result import Ok, Err, Result
 
 
@@ -84,7 +88,7 @@ def get_result_data_ohlc(
 def parse_result_data_ohlc(
         result_data: typing.Tuple[FtxResponseItemOhlc, ...],
         symbol: ntypes.SYMBOL
-    ) -> typing.Tuple[pmap]:
+    ) -> typing.Tuple[OhlcRecord, ...]:
 
     parsed_ohlc = [_single_candle(data, symbol) for data in result_data]
 
@@ -94,7 +98,7 @@ def parse_result_data_ohlc(
 def _single_candle(
         data: tuple,
         symbol: ntypes.SYMBOL
-    ) -> pmap:
+    ) -> OhlcRecord:
 
     parsed = {
         "symbol": symbol,
@@ -110,7 +114,36 @@ def _single_candle(
         "trdCount": 1
     }
 
-    return pmap(parsed)
+    return OhlcRecord(**parsed)
+
+
+
+
+def parse_result_data_ohlc_columnar(
+        result_content: typing.Sequence[dict],
+        symbol: ntypes.SYMBOL,
+        scale: typing.Optional[Scale] = None
+    ) -> Result[NoobitColumnsOhlc, ValueError]:
+
+    try:
+        columns = NoobitColumnsOhlc(
+            symbol,
+            rawJson=result_content,
+            scale=scale,
+            # "time" = startTime as timestamp in ms
+            utcTime=[int(candle["time"]) for candle in result_content],
+            open=[candle["open"] for candle in result_content],
+            high=[candle["high"] for candle in result_content],
+            low=[candle["low"] for candle in result_content],
+            close=[candle["close"] for candle in result_content],
+            volume=[candle["volume"] for candle in result_content],
+            # no count of trades
+            trdCount=[1] * len(result_content)
+        )
+        return Ok(columns)
+
+    except (KeyError, ValueError, TypeError) as e:
+        return Err(e)
 
 
 
@@ -123,8 +156,12 @@ def _single_candle(
 # FIXME not entirely sure how to properly type hint
 def validate_raw_result_content_ohlc(
         result_content: pmap,
+        validation: ntypes.VALIDATION = "full"
     ) -> Result[FtxResponseOhlc, ValidationError]:
 
+    if validation != "full":
+        return Ok(construct_trusted(FtxResponseOhlc, {"ohlc": result_content}))
+
 
     try:
         validated = FtxResponseOhlc(ohlc = result_content)
@@ -139,9 +176,13 @@ def validate_raw_result_content_ohlc(
 
 def validate_parsed_result_data_ohlc(
         parsed_result_ohlc: typing.Tuple[pmap],
-        raw_json: typing.Any
+        raw_json: typing.Any,
+        validation: ntypes.VALIDATION = "full"
     ) -> Result[NoobitResponseOhlc, ValidationError]:
 
+    if validation == "none":
+        return Ok(construct_trusted(NoobitResponseOhlc, {"ohlc": parsed_result_ohlc, "rawJson": raw_json}))
+
     try:
         validated = NoobitResponseOhlc(
             ohlc=parsed_result_ohlc,
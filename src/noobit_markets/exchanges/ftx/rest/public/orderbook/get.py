@@ -15,18 +15,19 @@ from .response import (
 
 # Base
 from noobit_markets.base import ntypes
-from noobit_markets.base.request import retry_request
+from noobit_markets.base.retry import retrying
 from noobit_markets.base.models.rest.response import NoobitResponseOrderBook
+from noobit_markets.base.models.trusted import validate_level
 from noobit_markets.base.models.result import Result
 
 # Kraken
 from noobit_markets.exchanges.ftx import endpoints
-from noobit_markets.exchanges.ftx.rest.base import get_result_content_from_req
+from noobit_markets.exchanges.ftx.rest.base import get_result_content_from_req, FTX_RETRY_POLICY
 
 
 
 
-@retry_request(retries=10, logger=lambda *args: print("===xxxxx>>>> : ", *args))
+@retrying(FTX_RETRY_POLICY)
 async def get_orderbook_ftx(
         client: ntypes.CLIENT,
         symbol: ntypes.SYMBOL,
@@ -34,9 +35,16 @@ async def get_orderbook_ftx(
         depth: ntypes.DEPTH,
         base_url: pydantic.AnyHttpUrl = endpoints.FTX_ENDPOINTS.public.url,
         endpoint: str = endpoints.FTX_ENDPOINTS.public.endpoints.orderbook,
+        validation: ntypes.VALIDATION = "full",
     ) -> Result[NoobitResponseOrderBook, Exception]:
 
 
+    # output: Result[ntypes.VALIDATION, ValueError]
+    valid_level = validate_level(validation)
+    if valid_level.is_err():
+        return valid_level
+
+
     # output: Result[NoobitRequestOhlc, ValidationError]
     valid_noobit_req = validate_request_orderbook(symbol, symbol_to_exchange, depth)
     if valid_noobit_req.is_err():
@@ -65,7 +73,7 @@ async def get_orderbook_ftx(
         return result_content
 
     # input: pmap // output: Result[FtxResponseOhlc, ValidationError]
-    valid_result_content = validate_raw_result_content_orderbook(result_content.value)
+    valid_result_content = validate_raw_result_content_orderbook(result_content.value, validation)
     if valid_result_content.is_err():
         return valid_result_content
 
@@ -73,5 +81,5 @@ async def get_orderbook_ftx(
     parsed_result = parse_result_data_orderbook(valid_result_content.value, symbol)
 
     # input: typing.Tuple[pmap] //  output: Result[NoobitResponseOhlc, ValidationError]
-    valid_parsed_response_data = validate_parsed_result_data_orderbook(parsed_result, result_content.value)
+    valid_parsed_response_data = validate_parsed_result_data_orderbook(parsed_result, result_content.value, validation)
     return valid_parsed_response_data
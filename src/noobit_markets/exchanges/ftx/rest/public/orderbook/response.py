@@ -9,6 +9,7 @@ from pydantic import ValidationError
 # noobit base
 from noobit_markets.base import ntypes
 from noobit_markets.base.models.frozenbase import FrozenBaseModel
+from noobit_markets.base.models.trusted import construct_trusted
 from noobit_markets.base.models.rest.response import NoobitResponseOrderBook
 from noobit_markets.base.models.result import Ok, Err, Result
 
@@ -85,8 +86,12 @@ def parse_result_data_orderbook(
 # FIXME not entirely sure how to properly type hint
 def validate_raw_result_content_orderbook(
         result_content: pmap,
+        validation: ntypes.VALIDATION = "full"
     ) -> Result[FtxResponseOrderBook, ValidationError]:
 
+    if validation != "full":
+        return Ok(construct_trusted(FtxResponseOrderBook, result_content))
+
     try:
         validated = FtxResponseOrderBook(**result_content)
         return Ok(validated)
@@ -100,9 +105,13 @@ def validate_raw_result_content_orderbook(
 
 def validate_parsed_result_data_orderbook(
         parsed_result: typing.Tuple[pmap],
-        raw_json: typing.Any
+        raw_json: typing.Any,
+        validation: ntypes.VALIDATION = "full"
     ) -> Result[NoobitResponseOrderBook, ValidationError]:
 
+    if validation == "none":
+        return Ok(construct_trusted(NoobitResponseOrderBook, {"rawJson": raw_json, **parsed_result}))
+
     try:
         validated = NoobitResponseOrderBook(
             rawJson=raw_json,
@@ -8,19 +8,19 @@ from .response import (
 
 # Base
 from noobit_markets.base import ntypes
-from noobit_markets.base.request import retry_request
+from noobit_markets.base.retry import retrying
 from noobit_markets.base.models.rest.response import NoobitResponseSymbols
 from noobit_markets.base.models.result import Result
 from noobit_markets.base.models.frozenbase import FrozenBaseModel
 
 # Kraken
 from noobit_markets.exchanges.ftx import endpoints
-from noobit_markets.exchanges.ftx.rest.base import get_result_content_from_req
+from noobit_markets.exchanges.ftx.rest.base import get_result_content_from_req, FTX_RETRY_POLICY
 
 
 
 
-@retry_request(retries=10, logger=lambda *args: print("===xxxxx>>>> : ", *args))
+@retrying(FTX_RETRY_POLICY)
 async def get_symbols_ftx(
         client: ntypes.CLIENT,
         base_url: pydantic.AnyHttpUrl = endpoints.FTX_ENDPOINTS.public.url,
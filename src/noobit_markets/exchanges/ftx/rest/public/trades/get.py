@@ -10,23 +10,26 @@ from .request import (
 from .response import (
     validate_raw_result_content_trades,
     validate_parsed_result_data_trades,
-    parse_result_data_trades
+    parse_result_data_trades,
+    parse_result_data_trades_columnar
 )
 
 # Base
 from noobit_markets.base import ntypes
-from noobit_markets.base.request import retry_request
+from noobit_markets.base.retry import retrying
+from noobit_markets.base.fixedpoint import Scale
 from noobit_markets.base.models.rest.response import NoobitResponseTrades
-from noobit_markets.base.models.rest import Result
+from noobit_markets.base.models.trusted import validate_level
+from noobit_markets.base.models.result import Result
 
 # Kraken
 from noobit_markets.exchanges.ftx import endpoints
-from noobit_markets.exchanges.ftx.rest.base import get_result_content_from_req
+from noobit_markets.exchanges.ftx.rest.base import get_result_content_from_req, FTX_RETRY_POLICY
 
 
 
 
-@retry_request(retries=10, logger=lambda *args: print("===xxxxx>>>> : ", *args))
+@retrying(FTX_RETRY_POLICY)
 async def get_trades_ftx(
         client: ntypes.CLIENT,
         symbol: ntypes.SYMBOL,
@@ -34,9 +37,18 @@ async def get_trades_ftx(
         since: typing.Optional[ntypes.TIMESTAMP] = None,
         base_url: pydantic.AnyHttpUrl = endpoints.FTX_ENDPOINTS.public.url,
         endpoint: str = endpoints.FTX_ENDPOINTS.public.endpoints.trades,
+        validation: ntypes.VALIDATION = "full",
+        columnar: bool = False,
+        scale: typing.Optional[Scale] = None,
     ) -> Result[NoobitResponseTrades, Exception]:
 
 
+    # output: Result[ntypes.VALIDATION, ValueError]
+    valid_level = validate_level(validation)
+    if valid_level.is_err():
+        return valid_level
+
+
     # output: Result[NoobitRequestOhlc, ValidationError]
     valid_noobit_req = validate_request_trades(symbol, symbol_to_exchange, since)
     if valid_noobit_req.is_err():
@@ -64,8 +76,12 @@ async def get_trades_ftx(
     if result_content.is_err():
         return result_content
 
+    # input: pmap // output: Result[NoobitColumnsTrades, ValueError]
+    if columnar:
+        return parse_result_data_trades_columnar(result_content.value, symbol, scale)
+
     # input: pmap // output: Result[FtxResponseOhlc, ValidationError]
-    valid_result_content = validate_raw_result_content_trades(result_content.value)
+    valid_result_content = validate_raw_result_content_trades(result_content.value, validation)
     if valid_result_content.is_err():
         return valid_result_content
 
@@ -73,5 +89,5 @@ async def get_trades_ftx(
     parsed_result = parse_result_data_trades(valid_result_content.value, symbol)
 
     # input: typing.Tuple[pmap] //  output: Result[NoobitResponseOhlc, ValidationError]
-    valid_parsed_response_data = validate_parsed_result_data_trades(parsed_result, result_content.value)
+    valid_parsed_response_data = validate_parsed_result_data_trades(parsed_result, result_content.value, validation)
     return valid_parsed_response_data
\ No newline at end of file
@@ -8,7 +8,11 @@ from pydantic import PositiveInt, ValidationError
 # noobit base
 from noobit_markets.base import ntypes
 from noobit_markets.base.models.frozenbase import FrozenBaseModel
+from noobit_markets.base.models.trusted import construct_trusted
 from noobit_markets.base.models.rest.response import NoobitResponseTrades
+from noobit_markets.base.models.rest.records import TradeRecord
+from noobit_markets.base.fixedpoint import Scale
+from noobit_markets.base.models.rest.columnar import NoobitColumnsTrades, SIDE_BUY, SIDE_SELL, ORDTYPE_MARKET
 from noobit_markets.base.models.result import Ok, Err, Result
 from typing_extensions import Literal
 
@@ -78,7 +82,7 @@ def parse_result_data_trades(
 def _single_trade(
         data: FtxResponseItemTrades,
         symbol: ntypes.SYMBOL
-    ):
+    ) -> TradeRecord:
 
     parsed = {
         "symbol": symbol,
@@ -97,7 +101,33 @@ def _single_trade(
         "text": None
     }
 
-    return pmap(parsed)
+    return TradeRecord(**parsed)
+
+
+
+
+def parse_result_data_trades_columnar(
+        result_content: typing.Sequence[dict],
+        symbol: ntypes.SYMBOL,
+        scale: typing.Optional[Scale] = None
+    ) -> Result[NoobitColumnsTrades, ValueError]:
+
+    try:
+        columns = NoobitColumnsTrades(
+            symbol,
+            rawJson=result_content,
+            scale=scale,
+            # format "2019-03-20T18:16:23.397991+00:00", noobit timestamps are in ms
+            transactTime=[int(datetime.fromisoformat(trade["time"]).timestamp() * 10**3) for trade in result_content],
+            side=[SIDE_BUY if trade["side"] == "buy" else SIDE_SELL for trade in result_content],
+            ordType=[ORDTYPE_MARKET] * len(result_content),
+            avgPx=[trade["price"] for trade in result_content],
+            cumQty=[trade["size"] for trade in result_content]
+        )
+        return Ok(columns)
+
+    except (KeyError, ValueError, TypeError) as e:
+        return Err(e)
 
 
 
@@ -110,8 +140,12 @@ def _single_trade(
 # FIXME not entirely sure how to properly type hint
 def validate_raw_result_content_trades(
         result_content: pmap,
+        validation: ntypes.VALIDATION = "full"
     ) -> Result[FtxResponseTrades, ValidationError]:
 
+    if validation != "full":
+        return Ok(construct_trusted(FtxResponseTrades, {"trades": result_content}))
+
     try:
         validated = FtxResponseTrades(trades=result_content)
         return Ok(validated)
@@ -125,9 +159,13 @@ def validate_raw_result_content_trades(
 
 def validate_parsed_result_data_trades(
         parsed_result: typing.Tuple[pmap],
-        raw_json: typing.Any
+        raw_json: typing.Any,
+        validation: ntypes.VALIDATION = "full"
     ) -> Result[NoobitResponseTrades, ValidationError]:
 
+    if validation == "none":
+        return Ok(construct_trusted(NoobitResponseTrades, {"rawJson": raw_json, "trades": parsed_result}))
+
     try:
         validated = NoobitResponseTrades(
             rawJson=raw_json,
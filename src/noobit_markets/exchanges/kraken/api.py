@@ -3,6 +3,7 @@ import asyncio
 import httpx
 
 from noobit_markets.exchanges.kraken.interface import KRAKEN
+from noobit_markets.exchanges.kraken.rest.public.symbols.get import KRAKEN_SYMBOLS
 
 # look at code below for a nice example of how to merge rest and ws
 # https://github.com/asmodehn/aiokraken/blob/develop/aiokraken/ohlcv.py
@@ -30,6 +31,8 @@ class KrakenAPI:
         }
 
 
+        # if not preloaded, endpoints get the mapping from the cached symbols
+        self.symbol_to_exchange = None
         if preload:
             self._load_symbols_mapping()
 
@@ -40,20 +43,13 @@ class KrakenAPI:
         only to be used in init func, otherwise use coro
         """
 
-        symbols_mapping = self.loop.run_until_complete(
-            KRAKEN.rest.public.symbols(
-                loop=self.loop,
-                client=self.client,
-                logger_func=lambda *args: print("")
-            )
-        )
+        # cached symbols (memory, then file), only queried (with our client) if missing or expired
+        symbols_mapping = self.loop.run_until_complete(KRAKEN_SYMBOLS.symbol_to_exchange(self.client))
 
         if symbols_mapping.is_err():
             raise ValueError(f"symbols query returned err: {symbols_mapping.value}")
 
-        self.symbol_to_exchange = {
-            k: v.exchange_name for k, v in symbols_mapping.value.asset_pairs.items()
-        }
+        self.symbol_to_exchange = symbols_mapping.value
 
 
 
@@ -1,3 +1,4 @@
+from noobit_markets.base import ratelimit
 from noobit_markets.base.models.rest import endpoints
 
 
@@ -41,4 +42,36 @@ KRAKEN_ENDPOINTS = endpoints.RESTEndpoints(**{
             "ws_token": "GetWebSocketsToken",
         }
     }
-})
\ No newline at end of file
+})
+
+
+# https://support.kraken.com/hc/en-us/articles/206548367-What-are-the-API-rate-limits-
+#   public: about 1 call per second per ip
+#   private: counter per api key, +2 for ledger/trade history calls, +1 for other calls,
+#            decays by 0.33/s (starter tier, intermediate: 0.5/s, pro: 1/s), max 15 (20 for intermediate/pro)
+#            orders have their own limits (per pair, not counted here)
+_PRIVATE_COSTS = {
+    "trades_history": 2,
+    "closed_positions": 2,
+    "trades_info": 2,
+    "ledger": 2,
+    "ledger_info": 2,
+    "new_order": 0,
+    "remove_order": 0,
+}
+
+KRAKEN_RATE_LIMITS = ratelimit.RateLimits(
+    limits={
+        "public": ratelimit.RateLimit(capacity=5, rate=1),
+        "private": ratelimit.RateLimit(capacity=15, rate=0.33, per_key=True),
+    },
+    costs={
+        **{name: {"public": 1} for name in KRAKEN_ENDPOINTS.public.endpoints.dict().values()},
+        **{
+            name: {"private": _PRIVATE_COSTS.get(endpoint, 1)}
+            for endpoint, name in KRAKEN_ENDPOINTS.private.endpoints.dict().items()
+        },
+    },
+    default={"public": 1},
+    key_header="API-Key",
+)
@@ -1,4 +1,9 @@
 from noobit_markets.base.models.interface import ExchangeInterface
+from noobit_markets.base.transport import with_transport
+from noobit_markets.base.symbols import with_symbols
+from noobit_markets.base.retry import RetryPolicy, with_retry
+
+from noobit_markets.exchanges.kraken.rest.base import KRAKEN_TRANSPORT, KRAKEN_RETRY_POLICY
 
 
 # rest private endpoints
@@ -14,42 +19,52 @@ from noobit_markets.exchanges.kraken.rest.private.trading.post import post_newor
 
 # rest public endpoints
 from noobit_markets.exchanges.kraken.rest.public.ohlc.get import get_ohlc_kraken
-from noobit_markets.exchanges.kraken.rest.public.symbols.get import get_symbols
+from noobit_markets.exchanges.kraken.rest.public.symbols.get import get_symbols, KRAKEN_SYMBOLS
 from noobit_markets.exchanges.kraken.rest.public.orderbook.get import get_orderbook_kraken
 from noobit_markets.exchanges.kraken.rest.public.trades.get import get_trades_kraken
-from noobit_markets.exchanges.kraken.rest.public.instrument.get import get_instrument_kraken
-from noobit_markets.exchanges.kraken.rest.public.spread.get import get_spread_kraken
+from noobit_markets.exchanges.kraken.rest.public.instrument.get import get_instrument_kraken, get_instruments_kraken
+from noobit_markets.exchanges.kraken.rest.public.spread.get import get_spread_kraken, get_spreads_kraken
+
+# ws
+from noobit_markets.exchanges.kraken.websockets.base import KrakenWsPublic, KrakenWsPrivate
 
-# ws public
-from noobit_markets.examples.ws_class import KrakenWsApi
 
-# ws private
-from noobit_markets.examples.ws_class import KrakenWsPrivate
+def kraken_interface(retry_policy: RetryPolicy = KRAKEN_RETRY_POLICY) -> ExchangeInterface:
+    """Kraken interface, with the retry policy of its rest endpoints.
+    """
 
+    def rest(func, idempotent=True):
+        return with_symbols(with_retry(with_transport(func, KRAKEN_TRANSPORT), retry_policy, idempotent), KRAKEN_SYMBOLS)
 
-KRAKEN = ExchangeInterface(**{
-    "rest": {
-        "public": {
-            "ohlc": get_ohlc_kraken,
-            "orderbook": get_orderbook_kraken,
-            "symbols": get_symbols,
-            "trades": get_trades_kraken,
-            "instrument": get_instrument_kraken,
-            "spread": get_spread_kraken
+    return ExchangeInterface(**{
+        "rest": {
+            "public": {
+                "ohlc": rest(get_ohlc_kraken),
+                "orderbook": rest(get_orderbook_kraken),
+                "symbols": rest(get_symbols),
+                "trades": rest(get_trades_kraken),
+                "instrument": rest(get_instrument_kraken),
+                "spread": rest(get_spread_kraken),
+                "instruments": rest(get_instruments_kraken),
+                "spreads": rest(get_spreads_kraken)
+            },
+            "private": {
+                "balances": rest(get_balances_kraken),
+                "exposure": rest(get_exposure_kraken),
+                "trades": rest(get_usertrades_kraken),
+                "open_positions": rest(get_openpositions_kraken),
+                "open_orders": rest(get_openorders_kraken),
+                "closed_orders": rest(get_closedorders_kraken),
+                # only retried if the order was rejected before being processed
+                "new_order": rest(post_neworder_kraken, idempotent=False)
+            }
         },
-        "private": {
-            "balances": get_balances_kraken,
-            "exposure": get_exposure_kraken,
-            "trades": get_usertrades_kraken,
-            "open_positions": get_openpositions_kraken,
-            "open_orders": get_openorders_kraken,
-            "closed_orders": get_closedorders_kraken,
-            "new_order": post_neworder_kraken
+
+        "ws":{
+            "public": KrakenWsPublic,
+            "private": KrakenWsPrivate
         }
-    },
+    })
+
 
-    "ws":{
-        "public": KrakenWsApi,
-        "private": KrakenWsPrivate
-    }
-})
+KRAKEN = kraken_interface()
@@ -16,35 +16,55 @@ from noobit_markets.base.request import (
     make_httpx_get_request,
     send_public_request,
     make_httpx_post_request,
-    send_private_request
+    send_private_request,
+    DecodedResponse,
+    SingleFlight,
+    request_key,
 )
 from noobit_markets.base.models.result import Ok, Err, Result
 from noobit_markets.base.models.frozenbase import FrozenBaseModel
+from noobit_markets.base.transport import HttpTransport
+from noobit_markets.base.ratelimit import RateLimiter
+from noobit_markets.base.retry import RetryPolicy
 
 # kraken
 from noobit_markets.exchanges.kraken.errors import ERRORS_FROM_EXCHANGE
+from noobit_markets.exchanges.kraken import endpoints
 
 
+# pooled keep-alive client, used by default by all coroutines in `interface.py`
+KRAKEN_TRANSPORT = HttpTransport(endpoints.KRAKEN_ENDPOINTS)
 
+# requests of all coroutines wait here until they are within the rate limits of the exchange
+KRAKEN_RATE_LIMITER = RateLimiter(endpoints.KRAKEN_RATE_LIMITS)
 
-def get_response_status_code(response_json: pmap) -> Result[PositiveInt, str]:
-    status_code = response_json["status_code"]
+# concurrent identical public requests share the same http call
+KRAKEN_PUBLIC_REQUESTS = SingleFlight()
+
+# retries of the rest endpoints of `interface.py` (change attributes to tune, or pass another policy to the interface)
+KRAKEN_RETRY_POLICY = RetryPolicy()
+
+
+
+
+def get_response_status_code(response_json: DecodedResponse) -> Result[PositiveInt, str]:
+    status_code = response_json.status_code
     err_msg = f"HTTP Status Error: {status_code}"
     return Ok(status_code) if status_code == 200 else Err(err_msg)
 
 
-def get_sent_request(response_json: pmap) -> str:
-    return response_json["request"]
+def get_sent_request(response_json: DecodedResponse) -> str:
+    return response_json.request
 
 
-def get_error_content(response_json: pmap) -> frozenset:
-    error_content = json.loads(response_json["_content"])["error"]
+def get_error_content(response_json: DecodedResponse) -> frozenset:
+    error_content = response_json.content["error"]
     return frozenset(error_content)
 
 
-def get_result_content(response_json: pmap) -> pmap:
+def get_result_content(response_json: DecodedResponse) -> pmap:
 
-    result_content = json.loads(response_json["_content"])["result"]
+    result_content = response_json.content["result"]
     return pmap(result_content)
 
 
@@ -65,26 +85,47 @@ async def get_result_content_from_public_req(
         endpoint: str,
     ) -> Result[pmap, typing.Any]:
 
+    # same client, endpoint and validated params: callers get the Result of the request in flight
+    # (a client passed by the caller may have its own settings, proxies ...)
+    key = request_key(id(client), base_url, endpoint, valid_kraken_req, headers)
+    return await KRAKEN_PUBLIC_REQUESTS.call(
+        key,
+        _get_result_content_from_public_req,
+        client, valid_kraken_req, headers, base_url, endpoint
+    )
+
+
+async def _get_result_content_from_public_req(
+        client: ntypes.CLIENT,
+        valid_kraken_req: FrozenBaseModel,
+        headers: typing.Mapping,
+        base_url: AnyHttpUrl,
+        endpoint: str,
+    ) -> Result[pmap, typing.Any]:
+
     # input: valid_request_model must be FrozenBaseModel !!! not dict !! // output: pmap
     make_req = make_httpx_get_request(base_url, endpoint, headers, valid_kraken_req)
 
-    # input: pmap // output: pmap
+    await KRAKEN_RATE_LIMITER.acquire(endpoint, make_req["params"], headers)
+
+    # input: pmap // output: DecodedResponse
     resp = await send_public_request(client, make_req)
 
-    # input: pmap // output: Result[PositiveInt, str]
+    # input: DecodedResponse // output: Result[PositiveInt, str]
     valid_status = get_response_status_code(resp)
     if valid_status.is_err():
         return valid_status
 
-    # input: pmap // output: frozenset
+    # input: DecodedResponse // output: frozenset
     err_content = get_error_content(resp)
     if  err_content:
         # input: tuple // output: Err[typing.Tuple[BaseError]]
         parsed_err_content = parse_error_content(err_content, get_sent_request(resp))
+        KRAKEN_RATE_LIMITER.on_errors(parsed_err_content.value, endpoint, headers)
         # print("//////", parsed_err_content.value[0].accept)
         return parsed_err_content
 
-    # input: pmap // output: pmap
+    # input: DecodedResponse // output: pmap
     result_content = get_result_content(resp)
 
     # print(f"{__file__}", resp)
@@ -103,23 +144,26 @@ async def get_result_content_from_private_req(
     # input: valid_request_model must be FrozenBaseModel !!! not dict !! // output: pmap
     make_req = make_httpx_post_request(base_url, endpoint, headers, valid_kraken_req)
 
-    # input: pmap // output: pmap
+    await KRAKEN_RATE_LIMITER.acquire(endpoint, make_req["data"], headers)
+
+    # input: pmap // output: DecodedResponse
     resp = await send_private_request(client, make_req)
 
-    # input: pmap // output: Result[PositiveInt, str]
+    # input: DecodedResponse // output: Result[PositiveInt, str]
     valid_status = get_response_status_code(resp)
     if valid_status.is_err():
         return valid_status
 
-    # input: pmap // output: frozenset
+    # input: DecodedResponse // output: frozenset
     err_content = get_error_content(resp)
     if  err_content:
         # input: tuple // output: Err[typing.Tuple[BaseError]]
         parsed_err_content = parse_error_content(err_content, get_sent_request(resp))
+        KRAKEN_RATE_LIMITER.on_errors(parsed_err_content.value, endpoint, headers)
         # print("//////", parsed_err_content.value[0].accept)
         return parsed_err_content
 
-    # input: pmap // output: pmap
+    # input: DecodedResponse // output: pmap
     result_content = get_result_content(resp)
 
     return Ok(result_content)
@@ -20,6 +20,7 @@ from .response import *
 # Base
 from noobit_markets.base import ntypes
 from noobit_markets.base.request import retry_request
+from noobit_markets.base.symbols import SymbolsIndex
 from noobit_markets.base.models.rest.response import NoobitResponseOpenOrders, NoobitResponseClosedOrders, NoobitResponseSymbols
 
 # Kraken
@@ -75,7 +76,7 @@ async def get_closedorders_kraken(
     #   example of pmap: {"eb":"46096.0029","tb":"29020.9951","m":"0.0000","n":"0.0000","c":"0.0000","v":"0.0000","e":"29020.9951","mf":"29020.9951"}
     result_data_balances = get_result_data_closedorders(valid_result_content.value)
 
-    symbols_from_altname = {v.ws_name.replace("/", ""): k for k, v in symbols_to_exchange.asset_pairs.items()}
+    symbols_from_altname = SymbolsIndex.of(symbols_to_exchange).to_altname.inverse
     
     # step 12: parse result data ==> output: pmap
     parsed_result_data = parse_result_data_closedorders(result_data_balances, symbols_from_altname, symbol)
@@ -134,7 +135,7 @@ async def get_openorders_kraken(
     #   example of pmap: {"eb":"46096.0029","tb":"29020.9951","m":"0.0000","n":"0.0000","c":"0.0000","v":"0.0000","e":"29020.9951","mf":"29020.9951"}
     result_data_balances = get_result_data_openorders(valid_result_content.value)
 
-    symbols_from_altname = {v.ws_name.replace("/", ""): k for k, v in symbols_to_exchange.asset_pairs.items()}
+    symbols_from_altname = SymbolsIndex.of(symbols_to_exchange).to_altname.inverse
     
     # step 12: parse result data ==> output: pmap
     parsed_result_data = parse_result_data_openorders(result_data_balances, symbols_from_altname)
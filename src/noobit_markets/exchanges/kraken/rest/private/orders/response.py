@@ -15,6 +15,7 @@ from noobit_markets.base import ntypes
 from noobit_markets.base.errors import BaseError
 from noobit_markets.base.models.frozenbase import FrozenBaseModel
 from noobit_markets.base.models.rest.response import NoobitResponseClosedOrders, NoobitResponseOpenOrders
+from noobit_markets.base.models.rest.records import OrderRecord
 from noobit_markets.base.models.result import Ok, Err, Result
 
 # noobit kraken
@@ -360,7 +361,7 @@ def _single_order(
         order: SingleOpenOrder,
         # FIXME not actually symbol from exchange but symbol from altname (eg XBT-USD frm XBTUSD)
         symbol_mapping: ntypes.SYMBOL_FROM_EXCHANGE
-    ) -> pmap:
+    ) -> OrderRecord:
 
     parsed = {
 
@@ -413,7 +414,7 @@ def _single_order(
 
         }
 
-    return pmap(parsed)
+    return OrderRecord(**parsed)
 
 
 
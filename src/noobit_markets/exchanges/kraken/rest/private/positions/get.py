@@ -17,6 +17,7 @@ from .response import *
 # Base
 from noobit_markets.base import ntypes
 from noobit_markets.base.request import retry_request
+from noobit_markets.base.symbols import inverse
 from noobit_markets.base.models.rest.response import NoobitResponseOpenPositions
 
 # Kraken
@@ -74,7 +75,7 @@ async def get_openpositions_kraken(
     result_data_balances = get_result_data_openpositions(valid_result_content.value)
 
     # step 12: parse result data ==> output: pmap
-    symbols_from_exchange = {v: k for k, v in symbols_to_exchange.items()}
+    symbols_from_exchange = inverse(symbols_to_exchange)
     parsed_result_data = parse_result_data_openpositions(result_data_balances, symbols_from_exchange)
 
     # step 13: validate parsed result data ==> output: Result[NoobitResponseTradeBalance, ValidationError]
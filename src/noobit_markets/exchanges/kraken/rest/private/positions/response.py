@@ -109,10 +109,12 @@ def parse_result_data_openpositions(
 
 def _single_position(key: str, info: OpenPositionInfo, symbol_mapping: ntypes.SYMBOL_FROM_EXCHANGE) -> pmap:
 
+    symbol = symbol_mapping[info.pair]
+
     parsed = {
         "orderID": info.ordertxid,
-        "symbol": symbol_mapping[info.pair],
-        "currency": symbol_mapping[info.pair].split("-")[1],
+        "symbol": symbol,
+        "currency": symbol.partition("-")[2],
         "side": info.type,
         "ordType": info.ordertype,
 
@@ -9,6 +9,7 @@ from .response import *
 # Base
 from noobit_markets.base import ntypes
 from noobit_markets.base.request import retry_request
+from noobit_markets.base.symbols import inverse
 from noobit_markets.base.models.rest.response import NoobitResponseTrades
 
 # Kraken
@@ -64,7 +65,7 @@ async def get_usertrades_kraken(
     result_data_balances = get_result_data_usertrades(valid_result_content.value)
 
     # step 12: parse result data ==> output: pmap
-    symbols_from_exchange = {v: k for k, v in symbols_to_exchange.items()}
+    symbols_from_exchange = inverse(symbols_to_exchange)
 
     # TODO need to filter out only requested symbol
     parsed_result_data = parse_result_data_usertrades(result_data_balances, symbols_from_exchange, symbol)
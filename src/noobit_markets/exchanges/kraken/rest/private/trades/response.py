@@ -14,6 +14,7 @@ from noobit_markets.base import ntypes
 from noobit_markets.base.errors import BaseError
 from noobit_markets.base.models.frozenbase import FrozenBaseModel
 from noobit_markets.base.models.rest.response import NoobitResponseTrades
+from noobit_markets.base.models.rest.records import TradeRecord
 from noobit_markets.base.models.result import Ok, Err, Result
 
 # noobit kraken
@@ -148,7 +149,7 @@ def _single_trade(
         key: str,
         info: SingleTradeInfo,
         symbol_mapping: ntypes.SYMBOL_FROM_EXCHANGE
-    ) -> pmap:
+    ) -> TradeRecord:
 
     parsed = {
         "trdMatchID": key,
@@ -167,7 +168,7 @@ def _single_trade(
         "text": info.misc
     }
 
-    return pmap(parsed)
+    return TradeRecord(**parsed)
 
 
 
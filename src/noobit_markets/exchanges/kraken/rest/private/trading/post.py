@@ -9,7 +9,6 @@ from .response import *
 
 # Base
 from noobit_markets.base import ntypes
-from noobit_markets.base.request import retry_request
 from noobit_markets.base.models.rest.response import NoobitResponseNewOrder
 
 # Kraken
@@ -20,7 +19,6 @@ from noobit_markets.exchanges.kraken.rest.base import get_result_content_from_pr
 
 
 
-@retry_request(retries=1, logger=lambda *args: print("===xxxxx>>>> : ", *args))
 async def post_neworder_kraken(
         client: ntypes.CLIENT,
         symbol: ntypes.SYMBOL,
@@ -1,3 +1,4 @@
+import typing
 import asyncio
 
 import pydantic
@@ -8,7 +9,6 @@ from .response import *
 
 # Base
 from noobit_markets.base import ntypes
-from noobit_markets.base.request import retry_request
 from noobit_markets.base.models.rest.response import NoobitResponseInstrument
 
 # Kraken
@@ -17,7 +17,6 @@ from noobit_markets.exchanges.kraken.rest.base import get_result_content_from_pu
 
 
 
-@retry_request(retries=10, logger=lambda *args: print("===xxxxx>>>> : ", *args))
 async def get_instrument_kraken(
         client: ntypes.CLIENT,
         symbol: ntypes.SYMBOL,
@@ -72,3 +71,66 @@ async def get_instrument_kraken(
     # input: typing.Tuple[pmap] //  output: Result[NoobitResponseOhlc, ValidationError]
     valid_parsed_response_data = validate_parsed_result_data_instrument(parsed_result, result_content.value)
     return valid_parsed_response_data
+
+
+
+
+async def get_instruments_kraken(
+        client: ntypes.CLIENT,
+        symbols: typing.Iterable[ntypes.SYMBOL],
+        symbol_to_exchange: ntypes.SYMBOL_TO_EXCHANGE,
+        base_url: pydantic.AnyHttpUrl = endpoints.KRAKEN_ENDPOINTS.public.url,
+        endpoint: str = endpoints.KRAKEN_ENDPOINTS.public.endpoints.instrument,
+    ) -> Result[typing.Mapping[ntypes.SYMBOL, NoobitResponseInstrument], Exception]:
+    """Instruments of all `symbols` in a single request (Ticker accepts a list of pairs).
+    """
+
+
+    # output: Result[NoobitRequestInstruments, ValidationError]
+    valid_req = validate_base_request_instruments(symbols, symbol_to_exchange)
+    if valid_req.is_err():
+        return valid_req
+
+    symbols = valid_req.value.symbols
+
+
+    # output: pmap
+    parsed_req = parse_request_instruments(valid_req.value)
+
+
+    # output: Result[KrakenRequestInstruments, ValidationError]
+    valid_kraken_req = validate_parsed_request_instruments(parsed_req)
+    if valid_kraken_req.is_err():
+        return valid_kraken_req
+
+    headers = {}
+    result_content = await get_result_content_from_public_req(client, valid_kraken_req.value, headers, base_url, endpoint)
+    if result_content.is_err():
+        return result_content
+
+
+    # input: pmap // Result[typing.Tuple[str, ...], ValueError]
+    valid_symbols = verify_symbols_instruments(result_content.value, symbols, symbol_to_exchange)
+    if valid_symbols.is_err():
+        return valid_symbols
+
+    # input: pmap // output: Result[pmap[ntypes.SYMBOL, KrakenInstrumentData], ValidationError]
+    valid_result_content = validate_raw_result_content_instruments(result_content.value, symbols, symbol_to_exchange)
+    if valid_result_content.is_err():
+        return valid_result_content
+
+
+    instruments = {}
+    for symbol, result_data in valid_result_content.value.items():
+
+        parsed_result = parse_result_data_instrument(pmap(result_data), symbol)
+
+        # raw json of each instrument is only its own pair
+        exch_symbol = symbol_to_exchange[symbol]
+        valid_parsed_response_data = validate_parsed_result_data_instrument(parsed_result, {exch_symbol: result_content.value[exch_symbol]})
+        if valid_parsed_response_data.is_err():
+            return valid_parsed_response_data
+
+        instruments[symbol] = valid_parsed_response_data.value
+
+    return Ok(pmap(instruments))
@@ -7,7 +7,7 @@ from typing_extensions import Literal
 
 from noobit_markets.base import ntypes, mappings
 from noobit_markets.base.models.frozenbase import FrozenBaseModel
-from noobit_markets.base.models.rest.request import NoobitRequestInstrument
+from noobit_markets.base.models.rest.request import NoobitRequestInstrument, NoobitRequestInstruments
 
 from noobit_markets.base.models.result import Ok, Err, Result
 
@@ -25,6 +25,14 @@ class KrakenRequestInstrument(FrozenBaseModel):
     # pair: constr(regex=r'([A-Z]+,[A-Z]+)*[A-Z]+')
     pair: constr(regex=r'[A-Z]+')
 
+
+class KrakenRequestInstruments(FrozenBaseModel):
+    # KRAKEN PAYLOAD
+    #   pair = comma delimited list of asset pairs to get info on
+
+    # pairs are parsed separately, see response.verify_symbols_instruments
+    pair: constr(regex=r'^[A-Z0-9]+(,[A-Z0-9]+)*$')
+
 # ============================================================
 # PARSE
 # ============================================================
@@ -43,6 +51,17 @@ def parse_request_instrument(
     return pmap(payload)
 
 
+def parse_request_instruments(
+        valid_request: NoobitRequestInstruments
+    ) -> pmap:
+
+    payload = {
+        "pair": ",".join(valid_request.symbol_mapping[symbol] for symbol in valid_request.symbols),
+    }
+
+    return pmap(payload)
+
+
 # ============================================================
 # VALIDATE
 # ============================================================
@@ -82,3 +101,33 @@ def validate_parsed_request_instrument(
 
     except Exception as e:
         raise e
+
+
+def validate_base_request_instruments(
+        symbols: typing.Iterable[ntypes.SYMBOL],
+        symbol_mapping: ntypes.SYMBOL_TO_EXCHANGE,
+    ) -> Result[NoobitRequestInstruments, ValidationError]:
+
+    try:
+        valid_req = NoobitRequestInstruments(
+            symbols=tuple(symbols),
+            symbol_mapping=symbol_mapping,
+        )
+        return Ok(valid_req)
+
+    except ValidationError as e:
+        return Err(e)
+
+
+def validate_parsed_request_instruments(
+        parsed_request: pmap
+    ) -> Result[KrakenRequestInstruments, ValidationError]:
+
+    try:
+        validated = KrakenRequestInstruments(
+            **parsed_request
+        )
+        return Ok(validated)
+
+    except ValidationError as e:
+        return Err(e)
@@ -7,6 +7,7 @@ from pydantic import create_model, ValidationError
 # noobit base
 from noobit_markets.base import ntypes
 from noobit_markets.base.models.frozenbase import FrozenBaseModel
+from noobit_markets.base.models.cache import cached_model
 from noobit_markets.base.models.rest.response import NoobitResponseInstrument
 from noobit_markets.base.models.result import Ok, Err, Result
 
@@ -44,6 +45,7 @@ class KrakenInstrumentData(FrozenBaseModel):
 # validate incoming data, before any processing
 # useful to check for API changes on exchanges side
 # needs to be create dynamically since pair changes according to request
+@cached_model("kraken_instrument")
 def make_kraken_model_instrument(
         symbol: ntypes.SYMBOL,
         symbol_mapping: ntypes.SYMBOL_TO_EXCHANGE
@@ -122,6 +124,27 @@ def verify_symbol_instrument(
     return Ok(exch_symbol) if valid else Err(ValueError(err_msg))
 
 
+def verify_symbols_instruments(
+        result_content: pmap,
+        symbols: typing.Tuple[ntypes.SYMBOL, ...],
+        symbol_mapping: ntypes.SYMBOL_TO_EXCHANGE
+    ) -> Result[typing.Tuple[str, ...], ValueError]:
+    """Check that result content has exactly one key per requested symbol.
+    """
+
+    exch_symbols = tuple(symbol_mapping[symbol] for symbol in symbols)
+
+    keys = set(result_content.keys())
+    missing = set(exch_symbols) - keys
+    unexpected = keys - set(exch_symbols)
+
+    if missing or unexpected:
+        err_msg = f"Requested : {sorted(exch_symbols)}, missing : {sorted(missing)}, unexpected : {sorted(unexpected)}"
+        return Err(ValueError(err_msg))
+
+    return Ok(exch_symbols)
+
+
 
 
 #============================================================
@@ -180,6 +203,23 @@ def validate_raw_result_content_instrument(
         raise e
 
 
+def validate_raw_result_content_instruments(
+        result_content: pmap,
+        symbols: typing.Tuple[ntypes.SYMBOL, ...],
+        symbol_mapping: ntypes.SYMBOL_TO_EXCHANGE
+    ) -> Result[typing.Mapping[ntypes.SYMBOL, KrakenInstrumentData], ValidationError]:
+
+    try:
+        validated = {
+            symbol: KrakenInstrumentData(**result_content[symbol_mapping[symbol]])
+            for symbol in symbols
+        }
+        return Ok(pmap(validated))
+
+    except ValidationError as e:
+        return Err(e)
+
+
 def validate_parsed_result_data_instrument(
         parsed_result_data: typing.Tuple[pmap],
         raw_json: typing.Any
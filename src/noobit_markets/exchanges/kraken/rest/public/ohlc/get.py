@@ -1,3 +1,4 @@
+import typing
 import asyncio
 
 import pydantic
@@ -7,9 +8,11 @@ from .response import *
 
 
 # Base
-from noobit_markets.base import ntypes
-from noobit_markets.base.request import retry_request
+from noobit_markets.base import ntypes, mappings
+from noobit_markets.base.fixedpoint import Scale
+from noobit_markets.base.history import History
 from noobit_markets.base.models.rest.response import NoobitResponseOhlc
+from noobit_markets.base.models.trusted import validate_level
 
 # Kraken
 from noobit_markets.exchanges.kraken import endpoints
@@ -17,7 +20,6 @@ from noobit_markets.exchanges.kraken.rest.base import get_result_content_from_pu
 
 
 
-@retry_request(retries=10, logger=lambda *args: print("===xxxxx>>>> : ", *args))
 async def get_ohlc_kraken(
         client: ntypes.CLIENT,
         symbol: ntypes.SYMBOL,
@@ -26,9 +28,18 @@ async def get_ohlc_kraken(
         since: ntypes.TIMESTAMP,
         base_url: pydantic.AnyHttpUrl = endpoints.KRAKEN_ENDPOINTS.public.url,
         endpoint: str = endpoints.KRAKEN_ENDPOINTS.public.endpoints.ohlc,
+        validation: ntypes.VALIDATION = "full",
+        columnar: bool = False,
+        scale: typing.Optional[Scale] = None,
     ) -> Result[NoobitResponseOhlc, Exception]:
 
 
+    # output: Result[ntypes.VALIDATION, ValueError]
+    valid_level = validate_level(validation)
+    if valid_level.is_err():
+        return valid_level
+
+
     # output: Result[NoobitRequestOhlc, ValidationError]
     valid_req = validate_request_ohlc(symbol, symbol_to_exchange, timeframe, since)
     if valid_req.is_err():
@@ -55,8 +66,12 @@ async def get_ohlc_kraken(
     if valid_symbol.is_err():
         return valid_symbol
 
+    # input: pmap // output: Result[NoobitColumnsOhlc, ValueError]
+    if columnar:
+        return parse_result_data_ohlc_columnar(result_content.value, symbol, symbol_to_exchange, scale)
+
     # input: pmap // output: Result[KrakenResponseOhlc, ValidationError]
-    valid_result_content = validate_raw_result_content_ohlc(result_content.value, symbol, symbol_to_exchange)
+    valid_result_content = validate_raw_result_content_ohlc(result_content.value, symbol, symbol_to_exchange, validation)
     if valid_result_content.is_err():
         return valid_result_content
 
@@ -71,5 +86,42 @@ async def get_ohlc_kraken(
     parsed_result_last = parse_result_data_last(result_data_last)
 
     # input: typing.Tuple[pmap] //  output: Result[NoobitResponseOhlc, ValidationError]
-    valid_parsed_response_data = validate_parsed_result_data_ohlc(parsed_result_ohlc, result_content.value)
+    valid_parsed_response_data = validate_parsed_result_data_ohlc(parsed_result_ohlc, result_content.value, validation)
     return valid_parsed_response_data
+
+
+
+
+def iter_ohlc_kraken(
+        client: ntypes.CLIENT,
+        symbol: ntypes.SYMBOL,
+        symbol_to_exchange: ntypes.SYMBOL_TO_EXCHANGE,
+        timeframe: ntypes.TIMEFRAME,
+        start: ntypes.TIMESTAMP,
+        end: typing.Optional[ntypes.TIMESTAMP] = None,
+        base_url: pydantic.AnyHttpUrl = endpoints.KRAKEN_ENDPOINTS.public.url,
+        endpoint: str = endpoints.KRAKEN_ENDPOINTS.public.endpoints.ohlc,
+        validation: ntypes.VALIDATION = "full",
+        min_interval: float = 1.,
+    ) -> History:
+    """Candles of [start, end).
+
+    Kraken only ever returns the last 720 candles of a timeframe: history starts at
+    the oldest of them if `start` is older.
+    """
+
+    # ms
+    step = mappings.TIMEFRAME[timeframe] * 60 * 10**3
+
+    async def fetch_page(since: ntypes.TIMESTAMP) -> Result[NoobitResponseOhlc, Exception]:
+        # one candle earlier, whether kraken includes the candle at `since` or not
+        return await get_ohlc_kraken(
+            client, symbol, symbol_to_exchange, timeframe, max(int(since) - step, 1),
+            base_url=base_url, endpoint=endpoint, validation=validation
+        )
+
+    # the last candle is still open: it is held back until a later page has it closed
+    return History(
+        fetch_page, start, end, "ohlc", "utcTime", min_interval,
+        key=lambda candle: candle.utcTime, hold_last=True
+    )
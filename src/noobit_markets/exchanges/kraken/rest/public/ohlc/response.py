@@ -9,7 +9,12 @@ from pydantic import PositiveInt, PositiveFloat, create_model, ValidationError,
 # noobit base
 from noobit_markets.base import ntypes
 from noobit_markets.base.models.frozenbase import FrozenBaseModel
+from noobit_markets.base.models.cache import cached_model
+from noobit_markets.base.models.trusted import construct_trusted
 from noobit_markets.base.models.rest.response import NoobitResponseOhlc
+from noobit_markets.base.models.rest.records import OhlcRecord
+from noobit_markets.base.fixedpoint import Scale
+from noobit_markets.base.models.rest.columnar import NoobitColumnsOhlc, transpose
 from noobit_markets.base.models.result import Ok, Err, Result
 
 
@@ -38,6 +43,7 @@ class FrozenBaseOhlc(FrozenBaseModel):
 # validate incoming data, before any processing
 # useful to check for API changes on exchanges side
 # needs to be create dynamically since pair changes according to request
+@cached_model("kraken_ohlc")
 def make_kraken_model_ohlc(
         symbol: ntypes.SYMBOL,
         symbol_mapping: ntypes.SYMBOL_TO_EXCHANGE
@@ -139,7 +145,7 @@ def verify_symbol_ohlc(
 def parse_result_data_ohlc(
         result_data: typing.Tuple[tuple],
         symbol: ntypes.SYMBOL
-    ) -> typing.Tuple[pmap]:
+    ) -> typing.Tuple[OhlcRecord, ...]:
 
     parsed_ohlc = [_single_candle(data, symbol) for data in result_data]
 
@@ -149,7 +155,7 @@ def parse_result_data_ohlc(
 def _single_candle(
         data: tuple,
         symbol: ntypes.SYMBOL
-    ) -> pmap:
+    ) -> OhlcRecord:
 
     parsed = {
         "symbol": symbol,
@@ -162,7 +168,7 @@ def _single_candle(
         "trdCount": data[7]
     }
 
-    return pmap(parsed)
+    return OhlcRecord(**parsed)
 
 def parse_result_data_last(
         result_data: typing.Union[PositiveInt, PositiveFloat]
@@ -174,6 +180,40 @@ def parse_result_data_last(
 
 
 
+def parse_result_data_ohlc_columnar(
+        result_content: pmap,
+        symbol: ntypes.SYMBOL,
+        symbol_mapping: ntypes.SYMBOL_TO_EXCHANGE,
+        scale: typing.Optional[Scale] = None
+    ) -> Result[NoobitColumnsOhlc, ValueError]:
+
+    try:
+        # raw rows : timestamp, open, high, low, close, vwap, volume, count
+        rows = result_content[symbol_mapping[symbol]]
+        timestamp, _open, high, low, close, _vwap, volume, count = transpose(rows, 8)
+
+        columns = NoobitColumnsOhlc(
+            symbol,
+            rawJson=result_content,
+            scale=scale,
+            # noobit timestamps are in ms
+            utcTime=(ts * 10**3 for ts in timestamp),
+            open=_open,
+            high=high,
+            low=low,
+            close=close,
+            volume=volume,
+            trdCount=count
+        )
+        return Ok(columns)
+
+    # missing pair, rows of the wrong length, values that are not numbers
+    except (KeyError, ValueError, TypeError, ArithmeticError) as e:
+        return Err(e)
+
+
+
+
 # ============================================================
 # VALIDATE
 # ============================================================
@@ -183,16 +223,22 @@ def parse_result_data_last(
 def validate_raw_result_content_ohlc(
         result_content: pmap,
         symbol: ntypes.SYMBOL,
-        symbol_mapping: ntypes.SYMBOL_TO_EXCHANGE
+        symbol_mapping: ntypes.SYMBOL_TO_EXCHANGE,
+        validation: ntypes.VALIDATION = "full"
     ) -> Result[make_kraken_model_ohlc, ValidationError]:
 
     KrakenResponseOhlc = make_kraken_model_ohlc(symbol, symbol_mapping)
 
+    raw_content = {
+        symbol_mapping[symbol]: result_content[symbol_mapping[symbol]],
+        "last": result_content["last"]
+    }
+
+    if validation != "full":
+        return Ok(construct_trusted(KrakenResponseOhlc, raw_content))
+
     try:
-        validated = KrakenResponseOhlc(**{
-            symbol_mapping[symbol]: result_content[symbol_mapping[symbol]],
-            "last": result_content["last"]
-        })
+        validated = KrakenResponseOhlc(**raw_content)
         return Ok(validated)
 
     except ValidationError as e:
@@ -204,9 +250,13 @@ def validate_raw_result_content_ohlc(
 
 def validate_parsed_result_data_ohlc(
         parsed_result_ohlc: typing.Tuple[pmap],
-        raw_json
+        raw_json,
+        validation: ntypes.VALIDATION = "full"
     ) -> Result[NoobitResponseOhlc, ValidationError]:
 
+    if validation == "none":
+        return Ok(construct_trusted(NoobitResponseOhlc, {"ohlc": parsed_result_ohlc, "rawJson": raw_json}))
+
     try:
         validated = NoobitResponseOhlc(
             ohlc=parsed_result_ohlc,
@@ -8,6 +8,7 @@ from pyrsistent import pmap
 
 
 # Noobit Models
+from noobit_markets.base.request import DecodedResponse
 from noobit_markets.base.models.result import Ok, Err, Result
 from noobit_markets.base.models.rest.response import NoobitResponseOhlc
 
@@ -31,35 +32,18 @@ symbol_to_exchange = {"XBT-USD": "XXBTZUSD"}
 
 
 def mock_response_json(response_content: dict):
-    response_json = {
-        'status_code': 200,
-        'http_version': 'HTTP/1.1',
-        'headers': httpx.Headers([
-            ('date', 'Thu, 13 Aug 2020 18:50:17 GMT'),
-            ('content-type', 'application/json; charset=utf-8'),
-            ('transfer-encoding', 'chunked'),
-            ('connection', 'keep-alive'),
-            ('cache-control', 'public, max-age=0'),
-            ('content-encoding', 'gzip'),
-            ('vary', 'Accept-Encoding'),
-            ('server', 'cloudflare'),
-            ('cf-ray', '5c249ef1be8017d7-DXB')
-        ]),
-        'request': httpx.Request('GET', 'https://api.kraken.com/0/public/Ticker?pair=XXBTZUSD'),
-        'call_next': None,
-        'history': [],
-        'is_closed': True,
-        'is_stream_consumed': True,
-        '_raw_stream': "httpcore._async.connection_pool.ResponseByteStream object at 0x7ccacc230850",
-        '_decoder': "httpx._decoders.GZipDecoder object at 0x7ccacb3c5610",
-        '_elapsed': datetime.timedelta(microseconds=242178),
-        '_content': json.dumps({"error":[], "result": response_content})
-    }
+    raw = json.dumps({"error":[], "result": response_content})
+    response_json = DecodedResponse(
+        status_code=200,
+        request=httpx.Request('GET', 'https://api.kraken.com/0/public/Ticker?pair=XXBTZUSD'),
+        content=json.loads(raw),
+        raw=raw.encode()
+    )
 
     return response_json
 
 
-# raw result data from response["_content"]["result"]["XXBTZUSD"]
+# raw result data from response.content["result"]["XXBTZUSD"]
 ohlc_result_data = [
         [1597406520, '11754.3', '11754.3', '11750.5', '11750.6', '11751.2', '0.33496956', 7],
         [1597406520, '11754.3', '11754.3', '11750.5', '11750.6', '11751.2', '0.33496956', 7],
@@ -70,7 +54,7 @@ ohlc_result_data = [
 ]
 
 
-# raw result data from response["_content"]["result"]
+# raw result data from response.content["result"]
 ohlc_result_content = {
     'XXBTZUSD': ohlc_result_data,
     'last': 1597406520
@@ -7,8 +7,8 @@ from .response import *
 
 # Base
 from noobit_markets.base import ntypes
-from noobit_markets.base.request import retry_request
 from noobit_markets.base.models.rest.response import NoobitResponseOrderBook
+from noobit_markets.base.models.trusted import validate_level
 
 # Kraken
 from noobit_markets.exchanges.kraken import endpoints
@@ -17,7 +17,6 @@ from noobit_markets.exchanges.kraken.rest.base import get_result_content_from_pu
 
 
 
-@retry_request(retries=10, logger=lambda *args: print("===xxxxx>>>> : ", *args))
 async def get_orderbook_kraken(
         client: ntypes.CLIENT,
         symbol: ntypes.SYMBOL,
@@ -25,9 +24,16 @@ async def get_orderbook_kraken(
         depth: ntypes.DEPTH,
         base_url: pydantic.AnyHttpUrl = endpoints.KRAKEN_ENDPOINTS.public.url,
         endpoint: str = endpoints.KRAKEN_ENDPOINTS.public.endpoints.orderbook,
+        validation: ntypes.VALIDATION = "full",
     ) -> Result[NoobitResponseOrderBook, Exception]:
 
 
+    # output: Result[ntypes.VALIDATION, ValueError]
+    valid_level = validate_level(validation)
+    if valid_level.is_err():
+        return valid_level
+
+
     # output: Result[NoobitRequestOhlc, ValidationError]
     valid_req = validate_base_request_orderbook(symbol, symbol_to_exchange, depth)
     #  logger_func("valid raw req // ", valid_req)
@@ -60,7 +66,7 @@ async def get_orderbook_kraken(
 
 
     # input: pmap // output: Result[KrakenResponseOhlc, ValidationError]
-    valid_result_content = validate_raw_result_content_orderbook(result_content.value, symbol, symbol_to_exchange)
+    valid_result_content = validate_raw_result_content_orderbook(result_content.value, symbol, symbol_to_exchange, validation)
     # logger_func("validated resp result content", valid_result_content)
     if valid_result_content.is_err():
         return valid_result_content
@@ -75,7 +81,7 @@ async def get_orderbook_kraken(
 
 
     # input: typing.Tuple[pmap] //  output: Result[NoobitResponseOhlc, ValidationError]
-    valid_parsed_response_data = validate_parsed_result_data_orderbook(parsed_result, result_content.value)
+    valid_parsed_response_data = validate_parsed_result_data_orderbook(parsed_result, result_content.value, validation)
     return valid_parsed_response_data
 
 
@@ -9,6 +9,8 @@ from pydantic import create_model, ValidationError
 # noobit base
 from noobit_markets.base import ntypes
 from noobit_markets.base.models.frozenbase import FrozenBaseModel
+from noobit_markets.base.models.cache import cached_model
+from noobit_markets.base.models.trusted import construct_trusted
 from noobit_markets.base.models.rest.response import NoobitResponseOrderBook
 from noobit_markets.base.models.result import Ok, Err, Result
 
@@ -28,6 +30,7 @@ class KrakenBook(FrozenBaseModel):
     bids: typing.Tuple[typing.Tuple[Decimal, Decimal, Decimal], ...]
 
 
+@cached_model("kraken_orderbook")
 def make_kraken_model_orderbook(
         symbol: ntypes.SYMBOL,
         symbol_mapping: ntypes.SYMBOL_TO_EXCHANGE
@@ -124,11 +127,15 @@ def parse_result_data_orderbook(
 def validate_raw_result_content_orderbook(
         result_content: pmap,
         symbol: ntypes.SYMBOL,
-        symbol_mapping: ntypes.SYMBOL_TO_EXCHANGE
+        symbol_mapping: ntypes.SYMBOL_TO_EXCHANGE,
+        validation: ntypes.VALIDATION = "full"
     ) -> Result[make_kraken_model_orderbook, ValidationError]:
 
     KrakenResponseOrderBook = make_kraken_model_orderbook(symbol, symbol_mapping)
 
+    if validation != "full":
+        return Ok(construct_trusted(KrakenResponseOrderBook, result_content))
+
     try:
 
         validated = KrakenResponseOrderBook(**result_content)
@@ -143,9 +150,13 @@ def validate_raw_result_content_orderbook(
 
 def validate_parsed_result_data_orderbook(
         parsed_result_book: pmap,
-        raw_json: typing.Any
+        raw_json: typing.Any,
+        validation: ntypes.VALIDATION = "full"
     ) -> Result[NoobitResponseOrderBook, ValidationError]:
 
+    if validation == "none":
+        return Ok(construct_trusted(NoobitResponseOrderBook, {**parsed_result_book, "rawJson": raw_json}))
+
     try:
         validated = NoobitResponseOrderBook(
             **parsed_result_book,
@@ -1,3 +1,5 @@
+import time
+import typing
 import asyncio
 
 import pydantic
@@ -8,7 +10,6 @@ from .response import *
 
 # Base
 from noobit_markets.base import ntypes
-from noobit_markets.base.request import retry_request
 from noobit_markets.base.models.rest.response import NoobitResponseSpread
 
 # Kraken
@@ -17,7 +18,6 @@ from noobit_markets.exchanges.kraken.rest.base import get_result_content_from_pu
 
 
 
-@retry_request(retries=10, logger=lambda *args: print("===xxxxx>>>> : ", *args))
 async def get_spread_kraken(
         client: ntypes.CLIENT,
         symbol: ntypes.SYMBOL,
@@ -80,3 +80,72 @@ async def get_spread_kraken(
     # input: typing.Tuple[pmap] //  output: Result[NoobitResponseOhlc, ValidationError]
     valid_parsed_response_data = validate_parsed_result_data_spread(parsed_result_spread, result_content.value)
     return valid_parsed_response_data
+
+
+
+
+async def get_spreads_kraken(
+        client: ntypes.CLIENT,
+        symbols: typing.Iterable[ntypes.SYMBOL],
+        symbol_to_exchange: ntypes.SYMBOL_TO_EXCHANGE,
+        base_url: pydantic.AnyHttpUrl = endpoints.KRAKEN_ENDPOINTS.public.url,
+        endpoint: str = endpoints.KRAKEN_ENDPOINTS.public.endpoints.instrument,
+    ) -> Result[typing.Mapping[ntypes.SYMBOL, NoobitResponseSpread], Exception]:
+    """Current spread of all `symbols` in a single request.
+
+    Spread endpoint only takes one pair, so best bid and ask are read from Ticker.
+    """
+
+
+    # output: Result[NoobitRequestSpreads, ValidationError]
+    valid_req = validate_request_spreads(symbols, symbol_to_exchange)
+    if valid_req.is_err():
+        return valid_req
+
+    symbols = valid_req.value.symbols
+
+
+    # output: pmap
+    parsed_req = parse_request_spreads(valid_req.value)
+
+
+    # output: Result[KrakenRequestSpreads, ValidationError]
+    valid_kraken_req = validate_parsed_request_spreads(parsed_req)
+    if valid_kraken_req.is_err():
+        return valid_kraken_req
+
+    headers = {}
+    result_content = await get_result_content_from_public_req(client, valid_kraken_req.value, headers, base_url, endpoint)
+    if result_content.is_err():
+        return result_content
+
+    # noobit timestamps are in ms
+    utc_time = time.time() * 10**3
+
+
+    # input: pmap // Result[typing.Tuple[str, ...], ValueError]
+    valid_symbols = verify_symbols_spreads(result_content.value, symbols, symbol_to_exchange)
+    if valid_symbols.is_err():
+        return valid_symbols
+
+    # input: pmap // output: Result[pmap[ntypes.SYMBOL, KrakenTickerSpreadData], ValidationError]
+    valid_result_content = validate_raw_result_content_spreads(result_content.value, symbols, symbol_to_exchange)
+    if valid_result_content.is_err():
+        return valid_result_content
+
+    # input: pmap[ntypes.SYMBOL, KrakenTickerSpreadData] // output: pmap[ntypes.SYMBOL, typing.Tuple[SpreadRecord]]
+    parsed_result_spreads = parse_result_data_spreads(valid_result_content.value, utc_time)
+
+
+    spreads = {}
+    for symbol, parsed_result_spread in parsed_result_spreads.items():
+
+        # raw json of each spread is only its own pair
+        exch_symbol = symbol_to_exchange[symbol]
+        valid_parsed_response_data = validate_parsed_result_data_spread(parsed_result_spread, {exch_symbol: result_content.value[exch_symbol]})
+        if valid_parsed_response_data.is_err():
+            return valid_parsed_response_data
+
+        spreads[symbol] = valid_parsed_response_data.value
+
+    return Ok(pmap(spreads))
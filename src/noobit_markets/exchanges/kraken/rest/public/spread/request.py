@@ -7,7 +7,7 @@ from pydantic import ValidationError, constr, conint, validator
 
 from noobit_markets.base import ntypes
 from noobit_markets.base.models.frozenbase import FrozenBaseModel
-from noobit_markets.base.models.rest.request import NoobitRequestSpread
+from noobit_markets.base.models.rest.request import NoobitRequestSpread, NoobitRequestSpreads
 
 from noobit_markets.base.models.result import Ok, Err, Result
 
@@ -42,6 +42,13 @@ class KrakenRequestSpread(FrozenBaseModel):
         return v
 
 
+class KrakenRequestSpreads(FrozenBaseModel):
+    # KRAKEN PAYLOAD (Ticker endpoint, Spread only takes one pair)
+    #   pair = comma delimited list of asset pairs
+
+    pair: constr(regex=r'^[A-Z0-9]+(,[A-Z0-9]+)*$')
+
+
 
 
 # ============================================================
@@ -63,6 +70,17 @@ def parse_request_spread(
     return pmap(payload)
 
 
+def parse_request_spreads(
+        valid_request: NoobitRequestSpreads
+    ) -> pmap:
+
+    payload = {
+        "pair": ",".join(valid_request.symbol_mapping[symbol] for symbol in valid_request.symbols),
+    }
+
+    return pmap(payload)
+
+
 
 
 # ============================================================
@@ -106,3 +124,33 @@ def validate_parsed_request_spread(
 
     except Exception as e:
         raise e
+
+
+def validate_request_spreads(
+        symbols: typing.Iterable[ntypes.SYMBOL],
+        symbol_mapping: ntypes.SYMBOL_TO_EXCHANGE,
+    ) -> Result[NoobitRequestSpreads, ValidationError]:
+
+    try:
+        valid_req = NoobitRequestSpreads(
+            symbols=tuple(symbols),
+            symbol_mapping=symbol_mapping,
+        )
+        return Ok(valid_req)
+
+    except ValidationError as e:
+        return Err(e)
+
+
+def validate_parsed_request_spreads(
+        parsed_request: pmap
+    ) -> Result[KrakenRequestSpreads, ValidationError]:
+
+    try:
+        validated = KrakenRequestSpreads(
+            **parsed_request
+        )
+        return Ok(validated)
+
+    except ValidationError as e:
+        return Err(e)
@@ -9,7 +9,9 @@ from pydantic import PositiveInt, PositiveFloat, create_model, ValidationError,
 # noobit base
 from noobit_markets.base import ntypes
 from noobit_markets.base.models.frozenbase import FrozenBaseModel
+from noobit_markets.base.models.cache import cached_model
 from noobit_markets.base.models.rest.response import NoobitResponseSpread
+from noobit_markets.base.models.rest.records import SpreadRecord
 from noobit_markets.base.models.result import Ok, Err, Result
 
 
@@ -47,9 +49,19 @@ class FrozenBaseSpread(FrozenBaseModel):
         return v
 
 
+# multiple pairs are queried from Ticker, which only has the current best bid and ask
+#     a = ask array(<price>, <whole lot volume>, <lot volume>),
+#     b = bid array(<price>, <whole lot volume>, <lot volume>),
+class KrakenTickerSpreadData(FrozenBaseModel):
+
+    a: typing.Tuple[Decimal, Decimal, Decimal]
+    b: typing.Tuple[Decimal, Decimal, Decimal]
+
+
 # validate incoming data, before any processing
 # useful to check for API changes on exchanges side
 # needs to be create dynamically since pair changes according to request
+@cached_model("kraken_spread")
 def make_kraken_model_spread(
         symbol: ntypes.SYMBOL,
         symbol_mapping: ntypes.SYMBOL_TO_EXCHANGE
@@ -133,6 +145,27 @@ def verify_symbol_spread(
     return Ok(exch_symbol) if valid else Err(ValueError(err_msg))
 
 
+def verify_symbols_spreads(
+        result_content: pmap,
+        symbols: typing.Tuple[ntypes.SYMBOL, ...],
+        symbol_mapping: ntypes.SYMBOL_TO_EXCHANGE
+    ) -> Result[typing.Tuple[str, ...], ValueError]:
+    """Check that result content has exactly one key per requested symbol.
+    """
+
+    exch_symbols = tuple(symbol_mapping[symbol] for symbol in symbols)
+
+    keys = set(result_content.keys())
+    missing = set(exch_symbols) - keys
+    unexpected = keys - set(exch_symbols)
+
+    if missing or unexpected:
+        err_msg = f"Requested : {sorted(exch_symbols)}, missing : {sorted(missing)}, unexpected : {sorted(unexpected)}"
+        return Err(ValueError(err_msg))
+
+    return Ok(exch_symbols)
+
+
 
 
 #============================================================
@@ -152,7 +185,7 @@ def parse_result_data_spread(
 def _single(
         data: tuple,
         symbol: ntypes.SYMBOL
-    ) -> pmap:
+    ) -> SpreadRecord:
     parsed = {
         "symbol": symbol,
         # noobit timestamps are in ms
@@ -160,6 +193,23 @@ def _single(
         "bestBidPrice": data[1],
         "bestAskPrice": data[2]
     }
+    return SpreadRecord(**parsed)
+
+
+def parse_result_data_spreads(
+        result_data: typing.Mapping[ntypes.SYMBOL, KrakenTickerSpreadData],
+        utc_time: float
+    ) -> typing.Mapping[ntypes.SYMBOL, typing.Tuple[SpreadRecord]]:
+
+    parsed = {
+        symbol: (SpreadRecord(
+            symbol=symbol,
+            utcTime=utc_time,
+            bestBidPrice=data.b[0],
+            bestAskPrice=data.a[0]
+        ), )
+        for symbol, data in result_data.items()
+    }
     return pmap(parsed)
 
 
@@ -199,6 +249,23 @@ def validate_raw_result_content_spread(
         raise e
 
 
+def validate_raw_result_content_spreads(
+        result_content: pmap,
+        symbols: typing.Tuple[ntypes.SYMBOL, ...],
+        symbol_mapping: ntypes.SYMBOL_TO_EXCHANGE
+    ) -> Result[typing.Mapping[ntypes.SYMBOL, KrakenTickerSpreadData], ValidationError]:
+
+    try:
+        validated = {
+            symbol: KrakenTickerSpreadData(**result_content[symbol_mapping[symbol]])
+            for symbol in symbols
+        }
+        return Ok(pmap(validated))
+
+    except ValidationError as e:
+        return Err(e)
+
+
 def validate_parsed_result_data_spread(
         parsed_result_spread: typing.Tuple[pmap],
         raw_json: typing.Any
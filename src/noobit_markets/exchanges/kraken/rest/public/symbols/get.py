@@ -1,5 +1,6 @@
 import typing
 import asyncio
+import functools
 
 # import httpx
 import pydantic
@@ -8,12 +9,12 @@ from .response import *
 
 # Base
 from noobit_markets.base import ntypes
-from noobit_markets.base.request import retry_request
 from noobit_markets.base.models.result import Ok, Err, Result
 from noobit_markets.base.models.frozenbase import FrozenBaseModel
+from noobit_markets.base.symbols import SymbolsRegistry
 
 # Kraken
-from noobit_markets.exchanges.kraken.rest.base import get_result_content_from_public_req
+from noobit_markets.exchanges.kraken.rest.base import get_result_content_from_public_req, KRAKEN_TRANSPORT
 from noobit_markets.exchanges.kraken import endpoints
 
 
@@ -32,7 +33,8 @@ async def get_symbols(
 
     headers = {}
     result_content = await get_result_content_from_public_req(client, valid_kraken_req.value, headers, base_url, endpoint)
-
+    if result_content.is_err():
+        return result_content
 
     # input: pmap// output: pmap
     filtered_result_content = filter_result_content_symbols(result_content.value)
@@ -64,3 +66,8 @@ async def get_symbols(
     # logger_func("valid result data assets // ", valid_parsed_result_data.value.assets)
     return valid_parsed_result_data
 
+
+
+
+# symbols used by endpoints called without symbol mappings (see interface)
+KRAKEN_SYMBOLS = SymbolsRegistry("kraken", functools.partial(get_symbols, client=KRAKEN_TRANSPORT))
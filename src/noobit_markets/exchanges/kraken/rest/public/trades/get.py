@@ -1,3 +1,4 @@
+import typing
 import asyncio
 
 import pydantic
@@ -8,8 +9,10 @@ from .response import *
 
 # Base
 from noobit_markets.base import ntypes
-from noobit_markets.base.request import retry_request
+from noobit_markets.base.fixedpoint import Scale
+from noobit_markets.base.history import History
 from noobit_markets.base.models.rest.response import NoobitResponseTrades
+from noobit_markets.base.models.trusted import validate_level
 
 # Kraken
 from noobit_markets.exchanges.kraken import endpoints
@@ -17,7 +20,6 @@ from noobit_markets.exchanges.kraken.rest.base import get_result_content_from_pu
 
 
 
-@retry_request(retries=10, logger=lambda *args: print("===xxxxx>>>> : ", *args))
 async def get_trades_kraken(
         client: ntypes.CLIENT,
         symbol: ntypes.SYMBOL,
@@ -25,9 +27,18 @@ async def get_trades_kraken(
         since: typing.Optional[ntypes.TIMESTAMP] = None,
         base_url: pydantic.AnyHttpUrl = endpoints.KRAKEN_ENDPOINTS.public.url,
         endpoint: str = endpoints.KRAKEN_ENDPOINTS.public.endpoints.trades,
+        validation: ntypes.VALIDATION = "full",
+        columnar: bool = False,
+        scale: typing.Optional[Scale] = None,
     ) -> Result[NoobitResponseTrades, Exception]:
 
 
+    # output: Result[ntypes.VALIDATION, ValueError]
+    valid_level = validate_level(validation)
+    if valid_level.is_err():
+        return valid_level
+
+
     # output: Result[NoobitRequestOhlc, ValidationError]
     valid_req = validate_base_request_trades(symbol, symbol_to_exchange, since)
     # logger_func("valid raw req // ", valid_req)
@@ -58,8 +69,12 @@ async def get_trades_kraken(
     if valid_symbol.is_err():
         return valid_symbol
 
+    # input: pmap // output: Result[NoobitColumnsTrades, ValueError]
+    if columnar:
+        return parse_result_data_trades_columnar(result_content.value, symbol, symbol_to_exchange, scale)
+
     # input: pmap // output: Result[KrakenResponseOhlc, ValidationError]
-    valid_result_content = validate_raw_result_content_trades(result_content.value, symbol, symbol_to_exchange)
+    valid_result_content = validate_raw_result_content_trades(result_content.value, symbol, symbol_to_exchange, validation)
     # logger_func("validated resp result content", valid_result_content)
     if valid_result_content.is_err():
         return valid_result_content
@@ -77,5 +92,39 @@ async def get_trades_kraken(
     parsed_result_last = parse_result_data_last(result_data_last)
 
     # input: typing.Tuple[pmap] //  output: Result[NoobitResponseOhlc, ValidationError]
-    valid_parsed_response_data = validate_parsed_result_data_trades(parsed_result_trades, result_content.value)
+    valid_parsed_response_data = validate_parsed_result_data_trades(parsed_result_trades, result_content.value, validation)
     return valid_parsed_response_data
+
+
+
+
+def iter_trades_kraken(
+        client: ntypes.CLIENT,
+        symbol: ntypes.SYMBOL,
+        symbol_to_exchange: ntypes.SYMBOL_TO_EXCHANGE,
+        start: ntypes.TIMESTAMP,
+        end: typing.Optional[ntypes.TIMESTAMP] = None,
+        base_url: pydantic.AnyHttpUrl = endpoints.KRAKEN_ENDPOINTS.public.url,
+        endpoint: str = endpoints.KRAKEN_ENDPOINTS.public.endpoints.trades,
+        validation: ntypes.VALIDATION = "full",
+        min_interval: float = 1.,
+    ) -> History:
+    """Trades of [start, end), by pages of 1000 trades.
+
+    Usage: `async for page in iter_trades_kraken(...)`, each page is a Result[NoobitResponseTrades].
+    """
+
+    async def fetch_page(since: ntypes.TIMESTAMP) -> Result[NoobitResponseTrades, Exception]:
+        return await get_trades_kraken(
+            client, symbol, symbol_to_exchange, int(since),
+            base_url=base_url, endpoint=endpoint, validation=validation
+        )
+
+    def cursor(response: NoobitResponseTrades) -> typing.Optional[ntypes.TIMESTAMP]:
+        # `last` of kraken (ns), floored to ms: trades of that ms come back and are dropped
+        try:
+            return int(response.rawJson["last"]) // 10**6
+        except (TypeError, KeyError, ValueError):
+            return None
+
+    return History(fetch_page, start, end, "trades", "transactTime", min_interval, cursor=cursor)
@@ -11,7 +11,12 @@ from typing_extensions import Literal
 # noobit base
 from noobit_markets.base import ntypes
 from noobit_markets.base.models.frozenbase import FrozenBaseModel
+from noobit_markets.base.models.cache import cached_model
+from noobit_markets.base.models.trusted import construct_trusted
 from noobit_markets.base.models.rest.response import NoobitResponseTrades
+from noobit_markets.base.models.rest.records import TradeRecord
+from noobit_markets.base.fixedpoint import Scale
+from noobit_markets.base.models.rest.columnar import NoobitColumnsTrades, transpose, SIDE_BUY, SIDE_SELL, ORDTYPE_MARKET, ORDTYPE_LIMIT
 from noobit_markets.base.models.result import Ok, Err, Result
 
 
@@ -54,6 +59,7 @@ class FrozenBaseTrades(FrozenBaseModel):
 # validate incoming data, before any processing
 # useful to check for API changes on exchanges side
 # needs to be create dynamically since pair changes according to request
+@cached_model("kraken_trades")
 def make_kraken_model_trades(
         symbol: ntypes.SYMBOL,
         symbol_mapping: ntypes.SYMBOL_TO_EXCHANGE
@@ -159,7 +165,7 @@ def verify_symbol_trades(
 def parse_result_data_trades(
         result_data: typing.Tuple[tuple],
         symbol: ntypes.SYMBOL
-    ) -> typing.Tuple[pmap]:
+    ) -> typing.Tuple[TradeRecord, ...]:
 
     parsed_trades = [_single_trade(data, symbol) for data in result_data]
 
@@ -169,7 +175,7 @@ def parse_result_data_trades(
 def _single_trade(
         data: tuple,
         symbol: ntypes.SYMBOL
-    ) -> pmap:
+    ) -> TradeRecord:
 
     parsed = {
         "symbol": symbol,
@@ -185,7 +191,7 @@ def _single_trade(
         "text": data[5]
     }
 
-    return pmap(parsed)
+    return TradeRecord(**parsed)
 
 
 def parse_result_data_last(
@@ -196,6 +202,38 @@ def parse_result_data_last(
     return result_data * 10**-6
 
 
+def parse_result_data_trades_columnar(
+        result_content: pmap,
+        symbol: ntypes.SYMBOL,
+        symbol_mapping: ntypes.SYMBOL_TO_EXCHANGE,
+        scale: typing.Optional[Scale] = None
+    ) -> Result[NoobitColumnsTrades, ValueError]:
+
+    try:
+        # raw rows : price, volume, time, buy/sell, market/limit, misc
+        rows = result_content[symbol_mapping[symbol]]
+        price, volume, time, side, ord_type, _misc = transpose(rows, 6)
+
+        columns = NoobitColumnsTrades(
+            symbol,
+            rawJson=result_content,
+            scale=scale,
+            # timestamp in s, noobit timestamps are in ms
+            transactTime=(int(float(t) * 10**3) for t in time),
+            side=(SIDE_BUY if s == "b" else SIDE_SELL for s in side),
+            ordType=(ORDTYPE_MARKET if o == "m" else ORDTYPE_LIMIT for o in ord_type),
+            avgPx=price,
+            cumQty=volume
+        )
+        return Ok(columns)
+
+    # missing pair, rows of the wrong length, values that are not numbers
+    except (KeyError, ValueError, TypeError, ArithmeticError) as e:
+        return Err(e)
+
+
+
+
 # ============================================================
 # VALIDATE
 # ============================================================
@@ -205,11 +243,15 @@ def parse_result_data_last(
 def validate_raw_result_content_trades(
         result_content: pmap,
         symbol: ntypes.SYMBOL,
-        symbol_mapping: ntypes.SYMBOL_TO_EXCHANGE
+        symbol_mapping: ntypes.SYMBOL_TO_EXCHANGE,
+        validation: ntypes.VALIDATION = "full"
     ) -> Result[make_kraken_model_trades, ValidationError]:
 
     KrakenResponseTrades = make_kraken_model_trades(symbol, symbol_mapping)
 
+    if validation != "full":
+        return Ok(construct_trusted(KrakenResponseTrades, result_content))
+
     try:
         validated = KrakenResponseTrades(**result_content)
         return Ok(validated)
@@ -223,9 +265,13 @@ def validate_raw_result_content_trades(
 
 def validate_parsed_result_data_trades(
         parsed_result_trades: typing.Tuple[pmap],
-        raw_json: typing.Any
+        raw_json: typing.Any,
+        validation: ntypes.VALIDATION = "full"
     ) -> Result[NoobitResponseTrades, ValidationError]:
 
+    if validation == "none":
+        return Ok(construct_trusted(NoobitResponseTrades, {"trades": parsed_result_trades, "rawJson": raw_json}))
+
     try:
         validated = NoobitResponseTrades(
             trades=parsed_result_trades,
@@ -1,16 +1,30 @@
 import asyncio
-import inspect
+import random
+import typing
 import functools
-from collections import deque
+from decimal import Decimal
+from collections import Counter
 
 import websockets
 
 # base
+from noobit_markets.base import ntypes
 from noobit_markets.base.models.result import Result, Ok, Err
-from noobit_markets.base.websockets import subscribe 
+from noobit_markets.base.models.rest.response import NoobitResponseTrades
+from noobit_markets.base.models.lazy import model_type
+from noobit_markets.base.websockets import subscribe, resubscribe
+from noobit_markets.base.orderbook import OrderBook
+from noobit_markets.base.fixedpoint import Scale
+from noobit_markets.base.queues import FeedQueue, QueueStats
+from noobit_markets.base.broadcast import Broadcast, Subscriber
+from noobit_markets.base.router import WsRouter, RouteStats
+from noobit_markets.base.scheduler import Scheduler, TaskStats
 
 # rest
+from noobit_markets.exchanges.kraken.rest.base import KRAKEN_TRANSPORT
 from noobit_markets.exchanges.kraken.rest.private.ws_auth.get import get_wstoken_kraken
+from noobit_markets.exchanges.kraken.rest.public.trades.get import iter_trades_kraken
+from noobit_markets.exchanges.kraken.rest.public.symbols.get import KRAKEN_SYMBOLS
 
 # public ws
 from noobit_markets.exchanges.kraken.websockets.public import trades, spread, orderbook
@@ -29,84 +43,220 @@ from noobit_markets.exchanges.kraken.websockets.private.routing import msg_handl
 # ============================================================
 
 
+def backoff_delay(attempt: int, base: float, cap: float) -> float:
+    """Exponential backoff with full jitter, so that many connections dropped
+    at the same time (exchange maintenance) do not reconnect in lockstep.
+    """
+
+    return random.uniform(0, min(cap, base * 2 ** attempt))
+
+
 class BaseWsApi:
 
+    # used to reconnect when the connection drops
+    ws_url: str
+
+    reconnect_base_delay: float = 0.5
+    reconnect_max_delay: float = 30.
+
 
     def __init__(
             self, 
             client: websockets.WebSocketClientProtocol, 
-            msg_handler: asyncio.coroutine ,
+            msg_handler: typing.Callable[..., typing.Awaitable],
             loop: asyncio.BaseEventLoop,
+            queues: typing.Optional[typing.Mapping[str, FeedQueue]] = None,
+            connect: typing.Optional[typing.Callable[[], typing.Awaitable[websockets.WebSocketClientProtocol]]] = None,
         ):
 
         self.loop = loop
 
+        # coroutine function returning a new connection, defaults to connecting to `ws_url`
+        self._connect = connect or functools.partial(websockets.connect, self.ws_url)
+
         self.client = client
 
         if not self.client.open:
             raise websockets.ConnectionClosed
 
-        self.msg_handler = msg_handler
-
-        # self.install_signal_handlers()
+        # routers keep per connection state (channel ids, counters)
+        self.msg_handler = msg_handler.copy() if isinstance(msg_handler, WsRouter) else msg_handler
+
+        # all state is per instance, so that we can run many connections in the same loop
+        # queues override default bounds/policies of some data queues, for ex:
+        #   {"trade": FeedQueue(100_000, "drop_oldest")}
+        self._data_queues: typing.Dict[str, FeedQueue] = {**self._make_data_queues(), **(queues or {})}
+        self._status_queues: typing.Dict[str, FeedQueue] = {
+            "connection": FeedQueue(),
+            "subscription": FeedQueue(),
+            "heartbeat": FeedQueue(10, "drop_oldest")
+        }
+        self._subd_feeds: typing.Dict[str, typing.Any] = self._make_subd_feeds()
+
+        # long running tasks of the connection (dispatch, watchers, book builder)
+        self._running_tasks: typing.Dict[str, asyncio.Future] = dict()
+        # coroutines passed to `schedule`
+        self._scheduler = Scheduler()
+
+        # (feed, pair) => sub model, replayed after reconnecting
+        self._sub_models: typing.Dict[typing.Tuple[str, typing.Optional[str]], typing.Any] = dict()
+
+        self._count: int = 0
+        self._reconnects: int = 0
+        self._connection: bool = False
+        self._terminate: bool = False
 
-        # self._pending_tasks.add(self.dispatch)
         self._running_tasks["dispatch"] = asyncio.ensure_future(self._dispatch())
-        self._running_tasks["watcher"] = asyncio.ensure_future(self._watcher())
-
-
-    async def _watcher(self):
-        while True:
-            try:
-                # print("Running :", self._running_tasks)
-                if self._terminate: break
-
-                elem = self._pending_tasks.popleft()
-                if inspect.iscoroutine(elem):
-                    task = asyncio.ensure_future(elem)
-                if isinstance(elem, tuple):
-                    coro, kwargs = elem
-                    task = asyncio.ensure_future(coro, **kwargs)
-
-            # no item in dq
-            except IndexError:
-                await asyncio.sleep(0.5)
 
 
     async def _dispatch(self):
-        _retries = 0
-        _delay = 1
 
-        while _retries < 10:
+        while not self._terminate:
             try: 
 
                 async for msg in self.client:
                     if self._terminate: break
-                    await self.msg_handler(msg, self._data_queues, self._status_queues)
+                    valid_msg = await self.msg_handler(msg, self._data_queues, self._status_queues)
+                    if valid_msg is not None:
+                        self._on_data(valid_msg)
                     await asyncio.sleep(0)
 
                     self._count += 1
 
-            except Exception as e:
-                raise 
-        
-            
+            except (websockets.ConnectionClosed, OSError):
+                pass
+
+            if self._terminate: break
+
+            # connection dropped: consumers keep waiting on the queues
+            # and resume once we are reconnected
+            self._connection = False
+            await self._reconnect()
+
+
+    async def _reconnect(self):
+
+        attempt = 0
+        while not self._terminate:
+            await asyncio.sleep(backoff_delay(attempt, self.reconnect_base_delay, self.reconnect_max_delay))
+            try:
+                self.client = await self._connect()
+                break
+            except (websockets.InvalidHandshake, OSError, asyncio.TimeoutError):
+                attempt += 1
+
+        # shut down while reconnecting: do not resubscribe
+        if self._terminate:
+            return
+
+        self._reconnects += 1
+
+        # channel ids are only valid for one connection
+        if isinstance(self.msg_handler, WsRouter):
+            self.msg_handler = self.msg_handler.copy()
+
+        await self._on_reconnect()
+
+
+    async def _subscribe(self, feed: str, key: typing.Optional[str], sub_model) -> Result:
+
+        self._sub_models[(feed, key)] = sub_model
+        return await subscribe(self.client, sub_model)
+
+
+    async def _on_reconnect(self):
+        """Replay subscriptions, subclasses can also recover data missed while disconnected.
+        """
+
+        for sub_model in self._sub_models.values():
+            await subscribe(self.client, sub_model)
+
+
+    def _on_data(self, valid_msg: Result):
+        """Called with each valid data message (after it was put in its queue).
+        """
+        pass
+
+
     def _ensure_dispatch(self):
         if not self._running_tasks.get("dispatch", None):
-           self._running_tasks["dispatch"] = asyncio.ensure_future(self.dispatch())
+           self._running_tasks["dispatch"] = asyncio.ensure_future(self._dispatch())
     
 
-    async def iterq(self, queue, feed):
+    def _reader(self, queues, feed) -> typing.AsyncIterator:
+        """Broadcast feeds give each reader its own subscription, other queues are shared.
+        """
+
+        queue = queues[feed]
+        if isinstance(queue, Broadcast):
+            return queue.subscribe()
+        return self._iter_queue(queue)
+
+
+    async def _iter_queue(self, queue):
         while True:
-            if self._terminate: break
-            try:
-                yield await queue[feed].get()
-            except Exception as e:
-                raise e
+            yield await queue.get()
+
+
+    async def iterq(self, queue, feed):
+
+        reader = self._reader(queue, feed)
+        try:
+            while True:
+                if self._terminate: break
+                yield await reader.__anext__()
+        finally:
+            if isinstance(reader, Subscriber):
+                reader.close()
 
     
-    def schedule(self, coro):
-        self._pending_tasks.append(coro)
+    def _make_data_queues(self) -> typing.Dict[str, FeedQueue]:
+        raise NotImplementedError
+
+
+    def _make_subd_feeds(self) -> typing.Dict[str, typing.Any]:
+        raise NotImplementedError
+
+
+    def schedule(self, coro: typing.Awaitable, name: typing.Optional[str] = None) -> asyncio.Future:
+        """Run `coro` right away as a task of this connection (cancelled on shutdown).
+        """
+
+        return self._scheduler.schedule(coro, name)
+
+
+    def task_stats(self) -> TaskStats:
+        return self._scheduler.stats()
+
+
+    def route_stats(self) -> typing.Dict[str, RouteStats]:
+        """Message count and parse/validate latency of each route.
+        """
+
+        if isinstance(self.msg_handler, WsRouter):
+            return self.msg_handler.stats()
+        return {}
+
+
+    def shutdown(self):
+        """Stop iterating queues and cancel the tasks of this connection.
+        """
+
+        self._terminate = True
+
+        for task in self._running_tasks.values():
+            task.cancel()
+        self._scheduler.cancel_all()
+
+
+    def queue_stats(self) -> typing.Dict[str, QueueStats]:
+        """Depth, high water mark and drop counts of each queue.
+        """
+
+        return {
+            feed: queue.stats()
+            for feed, queue in {**self._data_queues, **self._status_queues}.items()
+        }
 
 
     async def _watch_conn(self, queues):
@@ -143,14 +293,15 @@ class BaseWsApi:
     async def feed_aiog(self, module, queues, feed, **kwargs) -> Result:
 
         if not self._running_tasks.get("dispatch", None):
-            self._running_tasks["dispatch"] = asyncio.ensure_future(self.dispatch())
+            self._running_tasks["dispatch"] = asyncio.ensure_future(self._dispatch())
 
         func = getattr(module, "validate_sub")
         valid_sub_model = func(**kwargs)
         if valid_sub_model.is_err():
             yield valid_sub_model
 
-        sub_result = await subscribe(self.client, valid_sub_model.value)
+        key = kwargs["symbol_mapping"][kwargs["symbol"]] if "symbol_mapping" in kwargs else None
+        sub_result = await self._subscribe(feed, key, valid_sub_model.value)
         if sub_result.is_err():
             yield sub_result
 
@@ -174,54 +325,139 @@ class BaseWsApi:
 
 
 
-#? should we put the class attributes in the baseclass so the 2 child classes share all queues ??
 class KrakenWsPublic(BaseWsApi):
 
+    ws_url = "wss://ws.kraken.com"
 
-    _data_queues = {
-        "trade": asyncio.Queue(),
-        "spread": asyncio.Queue(),
-        #? test out, maybe better to just make a copy on each messag ? idk
-        "spread_copy": asyncio.Queue(),
-        "orderbook": asyncio.Queue(),
-    }
-
-    _status_queues = {
-        "connection": asyncio.Queue(),
-        "subscription": asyncio.Queue(),
-        "heartbeat": asyncio.Queue(maxsize=10)
-    }
-
-    _subd_feeds = {
-        "trade": set(),
-        "spread": set(),
-        "orderbook": set()
-    }
 
-    _pending_tasks = deque()
-    _running_tasks = dict()
+    def __init__(
+            self, 
+            client: websockets.WebSocketClientProtocol, 
+            msg_handler: typing.Callable[..., typing.Awaitable],
+            loop: asyncio.BaseEventLoop,
+            queues: typing.Optional[typing.Mapping[str, FeedQueue]] = None,
+            connect: typing.Optional[typing.Callable[[], typing.Awaitable[websockets.WebSocketClientProtocol]]] = None,
+            rest_symbol_mapping: typing.Optional[ntypes.SYMBOL_TO_EXCHANGE] = None,
+            logger_func: typing.Optional[typing.Callable[..., typing.Any]] = None,
+        ):
 
-    _count: int = 0
+        super().__init__(client, msg_handler, loop, queues, connect)
 
-    _connection: bool = False
+        # needed to fetch trades missed while disconnected (rest and ws pair names differ)
+        self.rest_symbol_mapping = rest_symbol_mapping
+        # errors of the rest requests made on reconnect
+        self.logger_func = logger_func
 
-    _terminate: bool = False
+        # symbol => time of the last trade received
+        self._last_trades: typing.Dict[ntypes.SYMBOL, ntypes.TIMESTAMP] = dict()
 
-    _full_books: dict = dict()
+        self._full_books: typing.Dict[str, OrderBook] = dict()
 
+        # pair => depth and scale of the full book to maintain
+        self._book_depths: typing.Dict[str, int] = dict()
+        self._book_scales: typing.Dict[str, typing.Optional[Scale]] = dict()
 
-    def __init__(
-            self, 
-            client: websockets.WebSocketClientProtocol, 
-            msg_handler: asyncio.coroutine ,
-            loop: asyncio.BaseEventLoop,
-        ):
+        # pair => number of book checksum mismatches (each one triggers a resubscribe)
+        self._checksum_mismatches: typing.Dict[str, int] = Counter()
 
-        super().__init__(client, msg_handler, loop)
         self._running_tasks["subscription"] = asyncio.ensure_future(self.subscription())
         self._running_tasks["connection"] = asyncio.ensure_future(self.connection())
 
 
+    def _make_data_queues(self):
+
+        # all feeds can be read by any number of consumers
+        # book and spread messages are conflated per pair for consumers lagging behind
+        return {
+            "trade": Broadcast(10_000, "block"),
+            "spread": Broadcast(1_000, "conflate", key=spread.conflation_key),
+            "orderbook": Broadcast(1_000, "conflate", key=orderbook.conflation_key, merge=orderbook.merge_msgs),
+            # full books maintained by `_build_books` (the same OrderBook object is published for a pair)
+            "full_book": Broadcast(1_000, "conflate", key=lambda book: book.symbol),
+        }
+
+
+    def _make_subd_feeds(self):
+
+        return {
+            "trade": set(),
+            "spread": set(),
+            "orderbook": set()
+        }
+
+
+    def checksum_stats(self) -> typing.Dict[ntypes.SYMBOL, int]:
+        """Book checksum mismatches of each pair (each one triggered a resubscribe).
+        """
+
+        return dict(self._checksum_mismatches)
+
+
+    def _on_data(self, valid_msg):
+
+        if not issubclass(model_type(valid_msg.value), NoobitResponseTrades):
+            return
+
+        # read from the frame, so that views are not decoded here
+        # [channelID, [[price, volume, time, side, orderType, misc], ...], "trade", pair]
+        frame = valid_msg.value.rawJson
+        try:
+            symbol = KRAKEN_SYMBOLS.symbol_from_ws(frame[3])
+            last_time = int(Decimal(frame[1][-1][2]) * 10**3)
+        except (TypeError, IndexError, ArithmeticError):
+            return
+
+        self._last_trades[symbol] = max(last_time, self._last_trades.get(symbol, 0))
+
+
+    async def _on_reconnect(self):
+
+        # books will be rebuilt from the snapshot kraken sends after we resubscribe
+        self._full_books.clear()
+
+        # rest trades are fetched before resubscribing so we do not get the same trade twice,
+        # only trades in the time it takes to resubscribe can be missed
+        await self._fill_trades_gap()
+
+        await super()._on_reconnect()
+
+
+    async def _fill_trades_gap(self):
+
+        if not self._last_trades:
+            return
+
+        # without a mapping passed at init, use the cached symbols
+        symbol_mapping = self.rest_symbol_mapping
+        if not symbol_mapping:
+            symbols = await KRAKEN_SYMBOLS.symbol_to_exchange()
+            if symbols.is_err():
+                self._log("Can not fetch missed trades, no symbols:", symbols.value)
+                return
+            symbol_mapping = symbols.value
+
+        for symbol, last_time in list(self._last_trades.items()):
+            if symbol not in symbol_mapping:
+                continue
+
+            # page until caught up, requests are paced by the kraken rate limiter
+            history = iter_trades_kraken(KRAKEN_TRANSPORT, symbol, symbol_mapping, start=last_time, min_interval=0.)
+            async for page in history:
+                if page.is_err():
+                    self._log(f"Can not fetch missed {symbol} trades since {last_time}:", page.value)
+                    break
+
+                missed = [trade for trade in page.value.trades if trade.transactTime > self._last_trades[symbol]]
+                if missed:
+                    await self._data_queues["trade"].put(Ok(page.value.copy(update={"trades": missed})))
+                    self._last_trades[symbol] = missed[-1].transactTime
+
+
+    def _log(self, *args):
+        if self.logger_func is not None:
+            self.logger_func(*args)
+
+
     async def subscription(self):
         
         await super()._watch_sub(
@@ -246,7 +482,7 @@ class KrakenWsPublic(BaseWsApi):
         if valid_sub_model.is_err():
             yield valid_sub_model
 
-        sub_result = await subscribe(self.client, valid_sub_model.value)
+        sub_result = await self._subscribe("spread", symbol_mapping[symbol], valid_sub_model.value)
         if sub_result.is_err():
             yield sub_result
 
@@ -265,7 +501,7 @@ class KrakenWsPublic(BaseWsApi):
         if valid_sub_model.is_err():
             yield valid_sub_model
 
-        sub_result = await subscribe(self.client, valid_sub_model.value)
+        sub_result = await self._subscribe("trade", symbol_mapping[symbol], valid_sub_model.value)
         if sub_result.is_err():
             yield sub_result
 
@@ -277,14 +513,26 @@ class KrakenWsPublic(BaseWsApi):
             yield msg
 
 
-    async def orderbook(self, symbol_mapping, symbol, depth, aggregate: bool=False):
+    async def orderbook(self, symbol_mapping, symbol, depth, aggregate: bool=False, scale: typing.Optional[Scale]=None):
+        """Stream book updates, or full books if `aggregate`.
+
+        Full books keep their levels as scaled ints if `scale` is given (see fixedpoint.scales_from_symbols).
+        """
         super()._ensure_dispatch()
 
         valid_sub_model = orderbook.validate_sub(symbol_mapping, symbol, depth)
         if valid_sub_model.is_err():
             yield valid_sub_model
 
-        sub_result = await subscribe(self.client, valid_sub_model.value)
+        if aggregate:
+            self._book_depths[symbol] = depth
+            self._book_scales[symbol] = scale
+            # reader is opened now so that the builder does not miss the snapshot
+            if "books" not in self._running_tasks:
+                reader = self._reader(self._data_queues, "orderbook")
+                self._running_tasks["books"] = asyncio.ensure_future(self._build_books(reader))
+
+        sub_result = await self._subscribe("orderbook", symbol_mapping[symbol], valid_sub_model.value)
         if sub_result.is_err():
             yield sub_result
 
@@ -298,89 +546,127 @@ class KrakenWsPublic(BaseWsApi):
                 yield msg
         
         else:
-            # reconstruct orderbook
-            _count = 0
-            async for msg in self.iterq(self._data_queues, "orderbook"):
-                spreads = await self._data_queues["spread_copy"].get()
-                
-                pair = msg.value.symbol
-                if _count == 0:
-                    # snapshot
-                    print("orderbook snapshot")
-                    self._full_books[pair] = dict()
-                    self._full_books[pair]["asks"] = msg.value.asks
-                    self._full_books[pair]["bids"] = msg.value.bids
+            # stream full books of our pair (only the latest state if we lag behind)
+            async for book in self.iterq(self._data_queues, "full_book"):
+                if self._terminate: break
+                if book.symbol == symbol:
+                    yield book
+
+
+    async def _build_books(self, reader: typing.AsyncIterator):
+        """Maintain full books incrementally, one task per connection whatever the number of consumers.
+        """
+
+        async for msg in reader:
+            if self._terminate: break
+
+            book = msg.value
+            pair = book.symbol
+
+            if pair not in self._book_depths:
+                continue
+
+            try:
+                if orderbook.is_snapshot(book.rawJson):
+                    self._full_books[pair] = orderbook.KrakenOrderBook(pair, self._book_depths[pair], self._book_scales.get(pair))
+                    self._full_books[pair].apply_snapshot(book.asks, book.bids, book.utcTime)
+
+                elif pair in self._full_books:
+                    self._full_books[pair].apply_update(book.asks, book.bids, book.utcTime)
+
+                    if not self._full_books[pair].verify(orderbook.get_checksum(book.rawJson)):
+                        self._checksum_mismatches[pair] += 1
+                        await self._reset_book(pair, book.rawJson[-1])
+                        continue
+
                 else:
-                    print("orderbook update")
-                    # update
-                    self._full_books[pair]["asks"].update(msg.value.asks)
-                    self._full_books[pair]["bids"].update(msg.value.bids)
-
-                    # filter out 0 values and bids/asks outside of spread
-                    self._full_books[pair]["asks"] = {
-                        k: v for k, v in self._full_books[pair]["asks"].items()
-                        if v > 0 and k >= spreads.value.spread[0].bestAskPrice
-                    }
-                    self._full_books[pair]["bids"] = {
-                        k: v for k, v in self._full_books[pair]["bids"].items()
-                        if v > 0 and k <= spreads.value.spread[0].bestBidPrice
-                    }
-                
-                _count += 1
-                yield self._full_books[pair]
+                    # updates received before (re)snapshot can not be applied
+                    continue
 
+            except ValueError:
+                # more decimals than the book scale: fall back to Decimal levels
+                self._book_scales[pair] = None
+                await self._reset_book(pair, book.rawJson[-1])
+                continue
 
+            await self._data_queues["full_book"].put(self._full_books[pair])
 
 
-#============================================================
-# PRIVATE WS API
-#============================================================
+    async def _reset_book(self, pair: ntypes.SYMBOL, ws_pair: str):
+        """Book is corrupted: drop it and resubscribe to get a fresh snapshot.
+        """
 
+        self._full_books.pop(pair, None)
 
-class KrakenWsPrivate(BaseWsApi):
+        resub_model = orderbook.validate_sub({pair: ws_pair}, pair, self._book_depths[pair])
+        await resubscribe(self.client, resub_model.value)
 
-    _data_queues = {
-        "user_trades": asyncio.Queue(),
-        "user_orders": asyncio.Queue(),
-    }
 
-    _status_queues = {
-        "connection": asyncio.Queue(), 
-        "subscription": asyncio.Queue(),
-        "heartbeat": asyncio.Queue()
-    }
 
-    _subd_feeds = {
-        "user_trades": False,
-        "user_orders": False,
-        "user_new": False,
-        "user_cancel": False
-    }
 
-    _pending_tasks = deque()
-    _running_tasks = dict()
+#============================================================
+# PRIVATE WS API
+#============================================================
 
-    _count: int = 0
 
-    _connection: bool = False
+class KrakenWsPrivate(BaseWsApi):
 
-    _terminate: bool = False
+    ws_url = "wss://ws-auth.kraken.com"
 
 
     def __init__(
             self, 
             client: websockets.WebSocketClientProtocol, 
-            msg_handler: asyncio.coroutine ,
+            msg_handler: typing.Callable[..., typing.Awaitable],
             loop: asyncio.BaseEventLoop,
-            auth_token: str
+            auth_token: str,
+            queues: typing.Optional[typing.Mapping[str, FeedQueue]] = None,
+            connect: typing.Optional[typing.Callable[[], typing.Awaitable[websockets.WebSocketClientProtocol]]] = None,
         ):
 
-        super().__init__(client, msg_handler, loop)
+        super().__init__(client, msg_handler, loop, queues, connect)
         self.auth_token = auth_token
         self._running_tasks["subscription"] = asyncio.ensure_future(self.subscription())
         self._running_tasks["connection"] = asyncio.ensure_future(self.connection())
+
+
+    def _make_data_queues(self):
+
+        return {
+            "user_trades": FeedQueue(10_000, "block"),
+            "user_orders": FeedQueue(10_000, "block"),
+        }
+
+
+    def _make_subd_feeds(self):
+
+        return {
+            "user_trades": False,
+            "user_orders": False,
+            "user_new": False,
+            "user_cancel": False
+        }
     
     
+    async def _on_reconnect(self):
+
+        # token is only valid to open a connection within 15 minutes of its creation
+        result = await get_wstoken_kraken(KRAKEN_TRANSPORT)
+        if result.is_ok():
+            self.auth_token = result.value["token"]
+
+        sub_models = {
+            ("user_trades", None): user_trades.validate_sub,
+            ("user_orders", None): user_orders.validate_sub,
+        }
+        for key in self._sub_models:
+            valid_sub_model = sub_models[key](self.auth_token)
+            if valid_sub_model.is_ok():
+                self._sub_models[key] = valid_sub_model.value
+
+        await super()._on_reconnect()
+
+
     async def subscription(self):
         
         await super()._watch_sub(
@@ -406,7 +692,7 @@ class KrakenWsPrivate(BaseWsApi):
             print(valid_sub_model)
             yield valid_sub_model
 
-        sub_result = await subscribe(self.client, valid_sub_model.value)
+        sub_result = await self._subscribe("user_trades", None, valid_sub_model.value)
         if sub_result.is_err():
             yield sub_result
 
@@ -424,7 +710,7 @@ class KrakenWsPrivate(BaseWsApi):
             print(valid_sub_model)
             yield valid_sub_model
 
-        sub_result = await subscribe(self.client, valid_sub_model.value)
+        sub_result = await self._subscribe("user_orders", None, valid_sub_model.value)
         if sub_result.is_err():
             yield sub_result
 
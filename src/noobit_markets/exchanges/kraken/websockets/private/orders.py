@@ -13,6 +13,8 @@ from noobit_markets.base.websockets import KrakenSubModel
 from noobit_markets.base.models.rest.response import NoobitResponseOpenOrders
 from noobit_markets.base.models.result import Result, Ok, Err
 
+from noobit_markets.exchanges.kraken.rest.public.symbols.get import KRAKEN_SYMBOLS
+
 
 # TODO should be used also for validation of sub
 def _util_validate(model, kwargs: dict):
@@ -71,7 +73,7 @@ def _parse_single(key, info):
         parsed_info = {
 
             "orderID": key,
-            "symbol": info["descr"]["pair"].replace("/", "-"),
+            "symbol": KRAKEN_SYMBOLS.symbol_from_ws(info["descr"]["pair"]),
             "currency": info["descr"]["pair"].split("/")[1],
             "side": info["descr"]["type"],
             "ordType": info["descr"]["ordertype"],
@@ -1,56 +1,50 @@
-import json
-import asyncio
 import time
 
+from noobit_markets.base.router import WsRouter
 from . import trades, orders
 
 
 
-async def msg_handler(msg, data_queues, status_queues):
+
+# ============================================================
+# PRIVATE ROUTER
+# ============================================================
+
+
+class KrakenPrivateRouter(WsRouter):
     """
-    forward to appropriate parser ==> redis channel
+    data frames: [payload, channelName, {"sequence": int}]
+    private channels have no id, they are routed by name
     """
 
-    if "systemStatus" in msg:
-        # route = "connection_status"
-        await status_queues["connection"].put(json.loads(msg))
-    
-    
-    elif "subscriptionStatus" in msg:
-        # route = "subscription_status"
+    routes = {
+        "ownTrades": (trades, "user_trades"),
+        "openOrders": (orders, "user_orders"),
+    }
+
+
+    def channel_id(self, frame):
+        return frame[1]
 
-        # parsed_msg = status.parse_sub(msg)
-        # valid_parsed_msg = status.validate_parsed_sub(msg, parsed_msg)
-        # if valid_parsed_msg.is_ok():
-        #   await feed_queues["subscription"]
 
-        await status_queues["subscription"].put(json.loads(msg))
+    def channel_name(self, frame):
+        return frame[1]
 
 
-    elif "heartbeat" in msg:
-        
-        # messages will normally not be consumed
-        if status_queues["heartbeat"].full():
-            await status_queues["heartbeat"].get()
+    async def on_event(self, event, status_queues):
 
-        # message is just {"event": "heartbeat"}
-        # put timestamp instead
-        await status_queues["heartbeat"].put(time.time() * 10**3)        
+        name = event.get("event")
 
+        if name == "heartbeat":
+            # messages will normally not be consumed (queue drops oldest)
+            await status_queues["heartbeat"].put(time.time() * 10**3)
 
-    else:
-        msg = json.loads(msg)
-        feed = msg[-1]
+        elif name == "subscriptionStatus":
+            await status_queues["subscription"].put(event)
 
-        if feed == "ownTrades":
-            parsed_msg = trades.parse_msg(msg)
-            valid_parsed_msg = trades.validate_parsed(msg, parsed_msg)
-            if valid_parsed_msg.is_ok():
-                await data_queues["user_trades"].put(valid_parsed_msg)
+        elif name == "systemStatus":
+            await status_queues["connection"].put(event)
 
-        if feed == "openOrders":
-            parsed_msg = orders.parse_msg(msg)
-            valid_parsed_msg = orders.validate_parsed(msg, parsed_msg)
-            if valid_parsed_msg.is_ok():
-                await data_queues["user_orders"].put(valid_parsed_msg)
 
+# each ws api instance uses its own copy
+msg_handler = KrakenPrivateRouter()
@@ -13,6 +13,8 @@ from noobit_markets.base.websockets import KrakenSubModel
 from noobit_markets.base.models.rest.response import NoobitResponseTrades
 from noobit_markets.base.models.result import Result, Ok, Err
 
+from noobit_markets.exchanges.kraken.rest.public.symbols.get import KRAKEN_SYMBOLS
+
 
 
 def _util_validate_parsing(model, kwargs: dict):
@@ -73,7 +75,7 @@ def _parse_single(key, info):
         parsed_trade = {
             "trdMatchID": key,
             "orderID": info["postxid"],
-            "symbol": info["pair"].replace("/", "-"),
+            "symbol": KRAKEN_SYMBOLS.symbol_from_ws(info["pair"]),
             "side": info["type"],
             "ordType": info["ordertype"],
             "avgPx": info["price"],
@@ -1,4 +1,8 @@
 import time
+import typing
+import zlib
+from itertools import islice
+from decimal import Decimal
 
 from pydantic import ValidationError
 
@@ -6,6 +10,10 @@ from noobit_markets.base.ntypes import SYMBOL_TO_EXCHANGE, SYMBOL, DEPTH
 from noobit_markets.base.websockets import KrakenSubModel 
 from noobit_markets.base.models.result import Result, Ok, Err
 from noobit_markets.base.models.rest.response import NoobitResponseOrderBook
+from noobit_markets.base.orderbook import OrderBook
+from noobit_markets.base.models.lazy import WsView
+
+from noobit_markets.exchanges.kraken.rest.public.symbols.get import KRAKEN_SYMBOLS
 
 
 def validate_sub(symbol_mapping: SYMBOL_TO_EXCHANGE, symbol: SYMBOL, depth: DEPTH) -> KrakenSubModel:
@@ -47,21 +55,60 @@ def validate_parsed(msg, parsed_msg):
 
 
 
-def parse_msg(message):
+def conflation_key(valid_msg) -> str:
+    return valid_msg.value.symbol
+
+
+def merge_msgs(pending, new):
+    """Conflate two validated book messages of the same pair.
+
+    Levels are absolute volumes, so later levels override earlier ones.
+    Merged message is a snapshot if `pending` is one (and `new` is an update),
+    it keeps the rawJson of the message determining its type and checksum.
+    """
+
+    if is_snapshot(new.value.rawJson):
+        return new
+
+    raw_json = pending.value.rawJson if is_snapshot(pending.value.rawJson) else new.value.rawJson
+
+    merged = pending.value.copy(update={
+        "asks": {**pending.value.asks, **new.value.asks},
+        "bids": {**pending.value.bids, **new.value.bids},
+        "utcTime": new.value.utcTime,
+        "rawJson": raw_json
+    })
+    return Ok(merged)
+
 
+def get_checksum(message) -> typing.Optional[int]:
+    """Checksum sent with book updates (None for snapshots).
+    """
+
+    for info in message[1:-2]:
+        if "c" in info:
+            return int(info["c"])
+    return None
+
+
+def is_snapshot(message) -> bool:
     info = message[1]
-    pair = message[3].replace("/", "-")
+    return "as" in info or "bs" in info
+
+
+def parse_msg(message):
+
+    # updates for both sides may come in 2 separate dicts:
+    #   [channelID, {"a": [...]}, {"b": [...]}, "book-10", "XBT/USD"]
+    pair = KRAKEN_SYMBOLS.symbol_from_ws(message[-1])
+
+    if is_snapshot(message):
+        return parse_snapshot(message[1], pair)
 
-    #! we could possibly be a lot more efficient if we count the messages we have received from each channel
-    #! so we dont need to do an if check every time
-    if "as" in info or "bs" in info:
-        # message is snaptshot
-        # return ("snapshot", parse_snapshot(info, pair))
-        return parse_snapshot(info, pair)
-    else:
-        # message is update
-        # return ("update", parse_update(info, pair))
-        return parse_update(info, pair)
+    info = {}
+    for side in message[1:-2]:
+        info.update(side)
+    return parse_update(info, pair)
 
 
 def parse_snapshot(info, pair):
@@ -102,4 +149,134 @@ def parse_update(info, pair):
     except Exception as e:
         raise e
 
-    return parsed_update
\ No newline at end of file
+    return parsed_update
+
+
+
+
+# ============================================================
+# CHECKSUM
+# ============================================================
+
+
+# see https://docs.kraken.com/websockets/#book-checksum
+CHECKSUM_DEPTH = 10
+
+
+def _checksum_token(value: Decimal) -> str:
+    # kraken strings, with "." removed and leading zeros stripped
+    return format(value, "f").replace(".", "").lstrip("0")
+
+
+class KrakenOrderBook(OrderBook):
+    """OrderBook that can verify kraken's CRC32 book checksum.
+
+    The checksum string of each level (price + volume) is computed once when the level
+    is set and cached, so computing the checksum only joins the top 10 cached tokens of
+    each side instead of reformatting the whole top of book on every message.
+    Relies on prices and volumes keeping kraken's string precision (Decimal does).
+    """
+
+    __slots__ = ("_ask_tokens", "_bid_tokens")
+
+
+    def __init__(self, symbol, depth=None, scale=None):
+
+        # keyed like the book sides (scaled ints if the book has a scale)
+        self._ask_tokens: typing.Dict[typing.Union[Decimal, int], str] = {}
+        self._bid_tokens: typing.Dict[typing.Union[Decimal, int], str] = {}
+        super().__init__(symbol, depth, scale)
+
+
+    def apply_snapshot(self, asks, bids, utc_time=None):
+
+        self._ask_tokens.clear()
+        self._bid_tokens.clear()
+        super().apply_snapshot(asks, bids, utc_time)
+        self._set_tokens(asks, self.asks, self._ask_tokens)
+        self._set_tokens(bids, self.bids, self._bid_tokens)
+
+
+    def apply_update(self, asks, bids, utc_time=None):
+
+        super().apply_update(asks, bids, utc_time)
+        self._set_tokens(asks, self.asks, self._ask_tokens)
+        self._set_tokens(bids, self.bids, self._bid_tokens)
+
+
+    def _set_tokens(self, levels, side, tokens: typing.Dict[typing.Union[Decimal, int], str]):
+
+        # tokens are always computed from kraken's values: their precision
+        # may differ from the scale (for ex 5 decimals for XBT/USD prices, while pair_decimals is 1)
+        to_key = self.scale.price if self.scale is not None else None
+
+        # levels removed (volume 0) or already truncated out of the book are dropped
+        for price, volume in levels.items():
+            key = to_key(price) if to_key else price
+            if key in side:
+                tokens[key] = _checksum_token(price) + _checksum_token(volume)
+            else:
+                tokens.pop(key, None)
+
+
+    def _truncate(self):
+
+        if self.depth:
+            for price in self.asks.truncate(self.depth):
+                self._ask_tokens.pop(price, None)
+            for price in self.bids.truncate(self.depth):
+                self._bid_tokens.pop(price, None)
+
+
+    def checksum(self) -> int:
+
+        asks = [self._ask_tokens[price] for price in islice(self.asks, CHECKSUM_DEPTH)]
+        bids = [self._bid_tokens[price] for price in islice(self.bids, CHECKSUM_DEPTH)]
+        return zlib.crc32("".join(asks + bids).encode())
+
+
+    def verify(self, checksum: typing.Optional[int]) -> bool:
+
+        if checksum is None:
+            return True
+        return self.checksum() == checksum
+
+
+# ============================================================
+# LAZY VIEW
+# ============================================================
+
+
+class KrakenOrderBookView(WsView):
+    """NoobitResponseOrderBook fields, decoded on access.
+
+    utcTime is the time the frame was received.
+    """
+
+    model = NoobitResponseOrderBook
+
+    __slots__ = ()
+
+    def _levels(self, snapshot_key: str, update_key: str) -> typing.Dict[Decimal, Decimal]:
+        key = snapshot_key if is_snapshot(self.rawJson) else update_key
+        return {
+            Decimal(level[0]): Decimal(level[1])
+            for info in self.rawJson[1:-2] if key in info
+            for level in info[key]
+        }
+
+    def _decode_symbol(self):
+        return KRAKEN_SYMBOLS.symbol_from_ws(self.rawJson[-1])
+
+    def _decode_utcTime(self):
+        return self.received
+
+    def _decode_asks(self):
+        return self._levels("as", "a")
+
+    def _decode_bids(self):
+        return self._levels("bs", "b")
+
+
+# used by the router instead of parse_msg + validate_parsed
+View = KrakenOrderBookView
@@ -1,83 +1,64 @@
-import json
-import asyncio
 import time
 
+from noobit_markets.base.router import WsRouter
 from . import trades, spread, orderbook
 
 
-FULL_OB = dict()
 
-# TODO separate data_queues and status_queues ????
-async def msg_handler(msg, data_queues, status_queues):
-    """
-    forward to appropriate parser ==> redis channel
-    """
-
-    if "systemStatus" in msg:
-        # route = "connection_status"
-        await status_queues["connection"].put(json.loads(msg))
-    
-    elif "subscriptionStatus" in msg:
-        # route = "subscription_status"
 
-        # parsed_msg = status.parse_sub(msg)
-        # valid_parsed_msg = status.validate_parsed_sub(msg, parsed_msg)
-        # if valid_parsed_msg.is_ok():
-        #   await feed_queues["subscription"]
+# ============================================================
+# PUBLIC ROUTER
+# ============================================================
 
-        await status_queues["subscription"].put(json.loads(msg))
 
+class KrakenPublicRouter(WsRouter):
+    """
+    data frames: [channelID, payload, ..., channelName, pair]
 
-    elif "heartbeat" in msg:
-        
-        # messages will normally not be consumed
-        if status_queues["heartbeat"].full():
-            await status_queues["heartbeat"].get()
+    Lazy by default: trade, spread and book frames are published as views
+    (call `view.validate()` for the full model), pass `lazy=False` to get validated models.
+    """
 
-        # message is just {"event": "heartbeat"}
-        # put timestamp instead
-        await status_queues["heartbeat"].put(time.time() * 10**3)        
+    routes = {
+        "trade": (trades, "trade"),
+        "spread": (spread, "spread"),
+        "book": (orderbook, "orderbook"),
+        # no parsers yet
+        "ticker": None,
+        "ohlc": None,
+    }
 
 
+    def __init__(self, lazy: bool = True):
+        super().__init__(lazy)
 
-    else:
-        msg = json.loads(msg)
-        feed = msg[-2]
 
-        if feed == "ticker":
-            return
+    def channel_id(self, frame):
+        return frame[0]
 
-        if feed.startswith("ohlc"):
-            return
 
-        #! needs to send message to be read by orderbook q
-        #! so we can determine the top bid/ask
+    def channel_name(self, frame):
+        return frame[-2]
 
-        #? should we create a specific queue for topbid/ask that would be read here, in if book statement ??
-        #? we essentially want to consume the same msg in queue, twice (spread async for and book)
 
-        if feed == "spread":
-            parsed_msg = spread.parse_msg(msg)
-            valid_parsed_msg = spread.validate_parsed(msg, parsed_msg)
-            if valid_parsed_msg.is_ok():
-                await data_queues["spread"].put(valid_parsed_msg)
+    async def on_event(self, event, status_queues):
 
-                await data_queues["spread_copy"].put(valid_parsed_msg)
+        name = event.get("event")
 
-            #TODO else we should log the message ?
+        if name == "heartbeat":
+            # messages will normally not be consumed (queue drops oldest)
+            # message is just {"event": "heartbeat"}
+            # put timestamp instead
+            await status_queues["heartbeat"].put(time.time() * 10**3)
 
-        if feed.startswith("book"):
-            parsed_msg = orderbook.parse_msg(msg)
-            valid_parsed_msg = orderbook.validate_parsed(msg, parsed_msg)
-            if valid_parsed_msg.is_ok():
-                
-                # top_spreads = await data_queues["spread_copy"].get()
-                await data_queues["orderbook"].put(valid_parsed_msg)
+        elif name == "subscriptionStatus":
+            if "channelID" in event and "channelName" in event:
+                self.learn(event["channelID"], event["channelName"])
+            await status_queues["subscription"].put(event)
 
-        if feed == "trade":
-            parsed_msg = trades.parse_msg(msg)
-            valid_parsed_msg = trades.validate_parsed(msg, parsed_msg)
-            if valid_parsed_msg.is_ok():
-                await data_queues["trade"].put(valid_parsed_msg)
+        elif name == "systemStatus":
+            await status_queues["connection"].put(event)
 
 
+# each ws api instance uses its own copy (channel ids are per connection)
+msg_handler = KrakenPublicRouter()
@@ -13,7 +13,11 @@ from noobit_markets.base.ntypes import SYMBOL_TO_EXCHANGE, SYMBOL, DEPTH
 from noobit_markets.base.websockets import consume_feed, KrakenSubModel
 
 from noobit_markets.base.models.rest.response import NoobitResponseSpread
+from noobit_markets.base.models.rest.records import SpreadRecord
 from noobit_markets.base.models.result import Result, Ok, Err
+from noobit_markets.base.models.lazy import WsView
+
+from noobit_markets.exchanges.kraken.rest.public.symbols.get import KRAKEN_SYMBOLS
 
 
 
@@ -54,15 +58,19 @@ def validate_parsed(msg, parsed_msg):
         return Err(e)
 
 
+def conflation_key(valid_msg) -> str:
+    return valid_msg.value.spread[0].symbol
+
+
 def parse_msg(message):
 
     try:
-        parsed_spread = {
-            "symbol": message[-1].replace("/", "-"),
-            "bestBidPrice": message[1][0],
-            "bestAskPrice": message[1][1],
-            "utcTime": Decimal(message[1][2]) * 10**3
-        }
+        parsed_spread = SpreadRecord(
+            symbol=KRAKEN_SYMBOLS.symbol_from_ws(message[-1]),
+            bestBidPrice=message[1][0],
+            bestAskPrice=message[1][1],
+            utcTime=Decimal(message[1][2]) * 10**3
+        )
         return parsed_spread
 
     except Exception as e:
@@ -72,6 +80,27 @@ def parse_msg(message):
 # consume = functools.partial(consume_feed, msg_handler=msg_handler)
 
 
+# ============================================================
+# LAZY VIEW
+# ============================================================
+
+
+class KrakenSpreadView(WsView):
+    """NoobitResponseSpread fields, decoded on access.
+    """
+
+    model = NoobitResponseSpread
+
+    __slots__ = ()
+
+    def _decode_spread(self):
+        return (parse_msg(self.rawJson), )
+
+
+# used by the router instead of parse_msg + validate_parsed
+View = KrakenSpreadView
+
+
 if __name__ == "__main__":
 
     async def main():
@@ -12,7 +12,11 @@ from noobit_markets.base.ntypes import SYMBOL_TO_EXCHANGE, SYMBOL
 from noobit_markets.base.websockets import consume_feed, KrakenSubModel
 
 from noobit_markets.base.models.rest.response import NoobitResponseTrades
+from noobit_markets.base.models.rest.records import TradeRecord
 from noobit_markets.base.models.result import Result, Ok, Err
+from noobit_markets.base.models.lazy import WsView
+
+from noobit_markets.exchanges.kraken.rest.public.symbols.get import KRAKEN_SYMBOLS
 
 
 
@@ -56,11 +60,12 @@ def validate_parsed(msg, parsed_msg):
 
 def parse_msg(message):
 
-    pair = message[3]
+    # looked up once per frame, not per trade
+    symbol = KRAKEN_SYMBOLS.symbol_from_ws(message[3])
 
     try:
         parsed_trades = [
-            _parse_single(info, pair) for info in message[1]
+            _parse_single(info, symbol) for info in message[1]
         ]
 
     except Exception as e:
@@ -69,21 +74,22 @@ def parse_msg(message):
     return parsed_trades
 
 
-def _parse_single(info, pair):
+def _parse_single(info, symbol):
 
     # if message is None: return
 
-    parsed_trade = {
-            "trdMatchID": None,
-            "orderID": None,
-            "symbol": pair.replace("/", "-"),
-            "side": "buy" if (info[3] == "b") else "sell",
-            "ordType": "market" if (info[4] == "m") else "limit",
-            "avgPx": info[0],
-            "cumQty": info[1],
-            "grossTradeAmt": Decimal(info[0]) * Decimal(info[1]),
-            "transactTime": Decimal(info[2])*10**9,
-        }
+    parsed_trade = TradeRecord(
+            trdMatchID=None,
+            orderID=None,
+            symbol=symbol,
+            side="buy" if (info[3] == "b") else "sell",
+            ordType="market" if (info[4] == "m") else "limit",
+            avgPx=info[0],
+            cumQty=info[1],
+            grossTradeAmt=Decimal(info[0]) * Decimal(info[1]),
+            # noobit timestamp = ms
+            transactTime=Decimal(info[2])*10**3,
+        )
 
     return parsed_trade
 
@@ -92,6 +98,27 @@ def _parse_single(info, pair):
 # consume = functools.partial(consume_feed, msg_handler=msg_handler)
 
 
+# ============================================================
+# LAZY VIEW
+# ============================================================
+
+
+class KrakenTradesView(WsView):
+    """NoobitResponseTrades fields, decoded on access.
+    """
+
+    model = NoobitResponseTrades
+
+    __slots__ = ()
+
+    def _decode_trades(self):
+        return tuple(parse_msg(self.rawJson))
+
+
+# used by the router instead of parse_msg + validate_parsed
+View = KrakenTradesView
+
+
 if __name__ == "__main__":
 
     async def main():
@@ -0,0 +1,279 @@
+import json
+from decimal import Decimal
+
+import pytest
+
+from noobit_markets.base.backfill import Backfill, BackfillJob, Checkpoint, exchange_limiters
+from noobit_markets.base.errors import DDoSProtection, BaseError
+from noobit_markets.base.history import History
+from noobit_markets.base.models.result import Ok, Err
+from noobit_markets.base.models.rest.response import NoobitResponseTrades
+from noobit_markets.base.models.rest.records import TradeRecord
+
+
+START = 1_600_000_000_000
+STEP = 10
+# 30 trades, pages of 10
+END = START + 30 * STEP
+
+
+def _trade(i):
+    return TradeRecord(
+        trdMatchID=str(i),
+        orderID=None,
+        symbol="XBT-USD",
+        side="buy",
+        ordType="market",
+        avgPx=Decimal(1),
+        cumQty=Decimal(1),
+        grossTradeAmt=Decimal(1),
+        transactTime=START + i * STEP
+    )
+
+
+TRADES = [_trade(i) for i in range(30)]
+
+
+class FakeLimiter:
+
+    def __init__(self):
+        self.pauses = []
+        self.acquired = []
+
+    async def acquire(self, endpoint, params=None, headers=None):
+        self.acquired.append(endpoint)
+
+    def pause(self, seconds, endpoint=None, headers=None):
+        self.pauses.append((seconds, endpoint))
+
+
+def _job(key, calls, priority=0, errors=None, endpoint=None):
+    """Job over TRADES, `errors` maps the number of a request to the error it returns.
+    """
+
+    errors = errors or {}
+
+    def history(start, end):
+
+        async def fetch_page(since):
+            calls.append((key, since))
+            if len(calls) in errors:
+                return Err(errors[len(calls)])
+            page = [t for t in TRADES if t.transactTime >= since][:10]
+            return Ok(NoobitResponseTrades.construct(trades=tuple(page), rawJson=None, exchange=None))
+
+        return History(fetch_page, start, end)
+
+    return BackfillJob(key, "kraken", history, START, END, priority=priority, endpoint=endpoint)
+
+
+def _backfill(on_page=None, **kwargs):
+
+    async def collect(job, page):
+        pass
+
+    limiter = FakeLimiter()
+    backfill = Backfill(on_page or collect, limiters={"kraken": limiter}, **kwargs)
+    return backfill, limiter
+
+
+
+
+@pytest.mark.asyncio
+async def test_priority_order():
+
+    calls = []
+    backfill, _ = _backfill(max_concurrency=1)
+
+    backfill.add(_job("low", calls, priority=2))
+    backfill.add(_job("high", calls, priority=0))
+    backfill.add(_job("mid", calls, priority=1))
+    backfill.add(_job("high-2", calls, priority=0))
+
+    await backfill.run()
+
+    order = []
+    for key, _ in calls:
+        if key not in order:
+            order.append(key)
+    # same priority: in the order they were added
+    assert order == ["high", "high-2", "mid", "low"]
+
+
+def test_add_errors():
+
+    backfill, _ = _backfill()
+    backfill.add(_job("a", []))
+
+    with pytest.raises(ValueError):
+        backfill.add(_job("a", []))
+    with pytest.raises(ValueError):
+        backfill.add(_job("b", [])._replace(exchange="unknown"))
+
+
+@pytest.mark.asyncio
+async def test_progress():
+
+    calls = []
+    seen = []
+
+    async def on_page(job, page):
+        seen.append(backfill.progress()[job.key])
+
+    backfill, _ = _backfill(on_page)
+    backfill.add(_job("a", calls))
+
+    assert backfill.progress()["a"].state == "pending"
+
+    stats = await backfill.run()
+
+    assert [p.state for p in seen] == ["running"] * len(seen)
+    ratios = [p.done_ratio for p in seen]
+    assert ratios == sorted(ratios) and 0 < ratios[0] < 1
+
+    progress = backfill.progress()["a"]
+    assert progress.state == "done"
+    assert progress.done_ratio == 1.
+    assert progress.items == 30
+    assert progress.pages == len(seen)
+    assert progress.attempts == 1
+
+    assert stats.jobs == 1 and stats.done == 1 and stats.failed == 0
+    assert stats.items == 30
+    assert stats.requests == len(calls)
+    assert stats.backoffs == 0
+
+
+@pytest.mark.asyncio
+async def test_caller_limiters_pace_pages():
+
+    calls = []
+    backfill, limiter = _backfill()
+
+    backfill.add(_job("a", calls, endpoint="Trades"))
+    await backfill.run()
+
+    # acquired before each request of the job
+    assert limiter.acquired == ["Trades"] * len(calls)
+
+
+def test_exchange_limiters_not_acquired_twice():
+
+    async def collect(job, page):
+        pass
+
+    # exchange limiters already pace the rest requests
+    assert Backfill(collect)._page_limiters == {}
+    assert Backfill(collect, limiters=exchange_limiters())._page_limiters == {}
+
+
+@pytest.mark.asyncio
+async def test_backoff_on_ddos():
+
+    calls = []
+    error = DDoSProtection("", None)
+    backfill, limiter = _backfill(max_backoff=10.)
+
+    # second request is rate limited
+    backfill.add(_job("a", calls, errors={2: (error, )}, endpoint="Trades"))
+    stats = await backfill.run()
+
+    # paused the exchange limiter, then resumed from the cursor
+    assert limiter.pauses == [(min(error.sleep, 10.), "Trades")]
+    assert calls[1] == calls[2]
+
+    progress = backfill.progress()["a"]
+    assert progress.state == "done"
+    assert progress.attempts == 2
+    # the item at the cursor time is delivered again
+    assert progress.items == 31
+    assert stats.backoffs == 1
+
+
+@pytest.mark.asyncio
+async def test_fail_not_retryable():
+
+    calls = []
+    backfill, limiter = _backfill()
+
+    backfill.add(_job("a", calls, errors={2: BaseError("", None)}))
+    stats = await backfill.run()
+
+    assert backfill.progress()["a"].state == "failed"
+    assert limiter.pauses == []
+    assert stats.failed == 1
+
+
+@pytest.mark.asyncio
+async def test_fail_max_attempts():
+
+    calls = []
+    backfill, limiter = _backfill(max_attempts=3)
+
+    errors = {n: DDoSProtection("", None) for n in range(1, 10)}
+    backfill.add(_job("a", calls, errors=errors))
+    await backfill.run()
+
+    assert backfill.progress()["a"].state == "failed"
+    assert backfill.progress()["a"].attempts == 3
+    assert len(limiter.pauses) == 2
+
+
+@pytest.mark.asyncio
+async def test_resume_from_checkpoint(tmp_path):
+
+    path = str(tmp_path / "checkpoint.json")
+
+    # crashes on its 3rd request
+    calls = []
+    backfill, _ = _backfill(checkpoint=path)
+    backfill.add(_job("a", calls, errors={3: BaseError("", None)}))
+    backfill.add(_job("b", []))
+    await backfill.run()
+
+    cursor = backfill.progress()["a"].cursor
+    assert backfill.progress()["a"].state == "failed"
+
+    with open(path) as f:
+        saved = json.load(f)
+    assert saved["a"] == {"cursor": cursor, "done": False}
+    assert saved["b"]["done"] is True
+
+    checkpoint = Checkpoint(path)
+    assert checkpoint.cursor("a") == cursor
+    assert isinstance(checkpoint.cursor("a"), int)
+
+    # restart: "a" starts at its cursor, "b" is not run again
+    calls = []
+    items = []
+
+    async def on_page(job, page):
+        items.extend(page.value.trades)
+
+    backfill, _ = _backfill(on_page, checkpoint=path)
+    backfill.add(_job("a", calls))
+    backfill.add(_job("b", calls))
+
+    assert backfill.progress()["b"].state == "done"
+    assert backfill.progress()["a"].cursor == cursor
+
+    await backfill.run()
+
+    assert calls[0] == ("a", cursor)
+    assert all(key == "a" for key, _ in calls)
+    assert backfill.progress()["a"].state == "done"
+    # items at the cursor time are delivered again
+    assert items[0].transactTime == cursor
+    assert items[-1].transactTime == TRADES[-1].transactTime
+
+
+def test_checkpoint_corrupted(tmp_path):
+
+    path = tmp_path / "checkpoint.json"
+    path.write_text("{not json")
+
+    checkpoint = Checkpoint(str(path))
+    assert checkpoint.cursor("a") is None
+
+    checkpoint.update("a", START)
+    assert Checkpoint(str(path)).cursor("a") == START
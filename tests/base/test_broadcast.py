@@ -0,0 +1,167 @@
+import asyncio
+
+import pytest
+
+from noobit_markets.base.broadcast import Broadcast
+
+
+
+
+async def _read(sub, n):
+    return [await asyncio.wait_for(sub.get(), 1) for _ in range(n)]
+
+
+
+
+@pytest.mark.asyncio
+async def test_all_subscribers_get_all_messages():
+
+    bc = Broadcast(8, "block")
+    fast, slow = bc.subscribe(), bc.subscribe()
+
+    for i in range(5):
+        await bc.put(i)
+
+    assert await _read(fast, 5) == list(range(5))
+    assert fast.lag == 0
+    assert slow.lag == 5
+    assert await _read(slow, 5) == list(range(5))
+
+
+@pytest.mark.asyncio
+async def test_subscribe_after_publish():
+
+    bc = Broadcast(8, "block")
+    await bc.put("before")
+
+    sub = bc.subscribe()
+    await bc.put("after")
+    assert await _read(sub, 1) == ["after"]
+
+
+@pytest.mark.asyncio
+async def test_block_waits_for_slowest():
+
+    bc = Broadcast(2, "block")
+    fast, slow = bc.subscribe(), bc.subscribe()
+
+    await bc.put(1)
+    await bc.put(2)
+    await _read(fast, 2)
+
+    # slow subscriber is `capacity` behind: producer waits
+    put = asyncio.ensure_future(bc.put(3))
+    await asyncio.sleep(0)
+    assert not put.done()
+
+    assert await _read(slow, 1) == [1]
+    await asyncio.wait_for(put, 1)
+
+    assert await _read(slow, 2) == [2, 3]
+    assert await _read(fast, 1) == [3]
+    assert bc.stats().drops == 0
+
+
+@pytest.mark.asyncio
+async def test_block_closed_subscriber_releases_producer():
+
+    bc = Broadcast(1, "block")
+    sub = bc.subscribe()
+    await bc.put(1)
+
+    put = asyncio.ensure_future(bc.put(2))
+    await asyncio.sleep(0)
+    assert not put.done()
+
+    sub.close()
+    await asyncio.wait_for(put, 1)
+
+
+@pytest.mark.asyncio
+async def test_drop_oldest_overrun():
+
+    bc = Broadcast(4, "drop_oldest")
+    fast, slow = bc.subscribe(), bc.subscribe()
+
+    for i in range(10):
+        await bc.put(i)
+        assert await _read(fast, 1) == [i]
+
+    # slow is 10 behind a buffer of 4: skips the 6 overwritten messages
+    assert slow.lag == 10
+    assert await _read(slow, 4) == [6, 7, 8, 9]
+    assert slow.drops == 6
+    assert fast.drops == 0
+
+    stats = bc.stats()
+    assert stats.puts == 10
+    assert stats.drops == 6
+    assert stats.high_water == 4
+
+
+@pytest.mark.asyncio
+async def test_conflate_lagging_subscriber():
+
+    bc = Broadcast(8, "conflate", key=lambda msg: msg[0])
+    fast, slow = bc.subscribe(), bc.subscribe()
+
+    msgs = [("XBT", 1), ("ETH", 1), ("XBT", 2), ("XBT", 3)]
+    for msg in msgs:
+        await bc.put(msg)
+        # up to date subscriber reads every message
+        assert await _read(fast, 1) == [msg]
+
+    # lagging subscriber reads the latest message of each key
+    assert slow.lag == 4
+    assert await _read(slow, 2) == [("XBT", 3), ("ETH", 1)]
+    assert slow.conflated == 2
+    assert slow.lag == 0
+    assert fast.conflated == 0
+    assert bc.stats().conflated == 2
+
+
+@pytest.mark.asyncio
+async def test_conflate_merge():
+
+    def merge(pending, new):
+        return (new[0], pending[1] + new[1])
+
+    bc = Broadcast(8, "conflate", key=lambda msg: msg[0], merge=merge)
+    sub = bc.subscribe()
+
+    for msg in [("XBT", 1), ("XBT", 2), ("ETH", 5)]:
+        await bc.put(msg)
+
+    assert await _read(sub, 2) == [("XBT", 3), ("ETH", 5)]
+
+
+@pytest.mark.asyncio
+async def test_waiting_subscribers():
+
+    bc = Broadcast(4, "block")
+    subs = [bc.subscribe() for _ in range(3)]
+
+    reads = [asyncio.ensure_future(sub.get()) for sub in subs]
+    await asyncio.sleep(0)
+
+    # cancelled reader does not affect the others
+    reads[0].cancel()
+    await bc.put("msg")
+
+    assert await asyncio.gather(*reads[1:]) == ["msg", "msg"]
+    assert await _read(subs[0], 1) == ["msg"]
+
+
+@pytest.mark.asyncio
+async def test_released_messages():
+
+    bc = Broadcast(4, "drop_oldest")
+    sub = bc.subscribe()
+
+    await bc.put("a")
+    await bc.put("b")
+    await _read(sub, 2)
+    await bc.put("c")
+
+    # read by all subscribers: references dropped
+    assert bc._buffer.count(None) == 3
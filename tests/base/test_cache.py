@@ -0,0 +1,102 @@
+import pytest
+
+from noobit_markets.base.models.cache import ModelCache, CacheInfo, cached_model, MODEL_CACHE
+from noobit_markets.exchanges.kraken.rest.public.ohlc.response import make_kraken_model_ohlc
+
+
+
+
+class Factory:
+    """Model factory counting its calls, returns a new object on each call.
+    """
+
+    def __init__(self):
+        self.calls = 0
+
+    def __call__(self, *args):
+        self.calls += 1
+        return object()
+
+
+
+
+def test_model_cache_hits_misses():
+
+    cache = ModelCache(maxsize=4)
+    factory = Factory()
+
+    first = cache.get(("XXBTZUSD", "ohlc"), factory)
+    assert cache.get(("XXBTZUSD", "ohlc"), factory) is first
+    assert cache.get(("XXBTZUSD", "ohlc"), factory) is first
+    assert factory.calls == 1
+
+    assert cache.info() == CacheInfo(hits=2, misses=1, maxsize=4, currsize=1)
+    assert cache.info().hit_rate == pytest.approx(2 / 3)
+
+    cache.clear()
+    assert cache.info() == CacheInfo(hits=0, misses=0, maxsize=4, currsize=0)
+    assert cache.info().hit_rate == 0.
+
+    # cleared: created again
+    assert cache.get(("XXBTZUSD", "ohlc"), factory) is not first
+    assert factory.calls == 2
+
+
+def test_model_cache_lru_eviction():
+
+    cache = ModelCache(maxsize=2)
+    factory = Factory()
+
+    a = cache.get(("A", "ohlc"), factory)
+    cache.get(("B", "ohlc"), factory)
+
+    # A is now the most recently used, B is evicted by C
+    cache.get(("A", "ohlc"), factory)
+    cache.get(("C", "ohlc"), factory)
+    assert cache.info().currsize == 2
+    assert factory.calls == 3
+
+    assert cache.get(("A", "ohlc"), factory) is a
+    assert factory.calls == 3
+
+    cache.get(("B", "ohlc"), factory)
+    assert factory.calls == 4
+    assert cache.info().currsize == 2
+
+
+def test_cached_model_key():
+
+    cache = ModelCache()
+    factory = Factory()
+    make_ohlc = cached_model("ohlc", cache)(factory)
+    make_trades = cached_model("trades", cache)(factory)
+
+    mapping = {"XBT-USD": "XXBTZUSD", "ETH-USD": "XETHZUSD"}
+
+    model = make_ohlc("XBT-USD", mapping)
+    assert make_ohlc("XBT-USD", mapping) is model
+    assert factory.calls == 1
+
+    # keyed on exchange symbol: other noobit symbol (or other mapping) for the same pair share the model
+    assert make_ohlc("BTC-USD", {"BTC-USD": "XXBTZUSD"}) is model
+    assert factory.calls == 1
+
+    # other pair, other kind
+    assert make_ohlc("ETH-USD", mapping) is not model
+    assert make_trades("XBT-USD", mapping) is not model
+    assert factory.calls == 3
+
+    assert cache.info() == CacheInfo(hits=2, misses=3, maxsize=1024, currsize=3)
+
+
+def test_cached_model_kraken():
+
+    mapping = {"XBT-USD": "XXBTZUSD"}
+
+    model = make_kraken_model_ohlc("XBT-USD", mapping)
+    hits = MODEL_CACHE.info().hits
+
+    assert make_kraken_model_ohlc("XBT-USD", mapping) is model
+    assert MODEL_CACHE.info().hits == hits + 1
+    assert "XXBTZUSD" in model.__fields__
+
@@ -0,0 +1,128 @@
+import importlib
+from decimal import Decimal
+
+import pytest
+import pydantic
+import httpx
+
+from noobit_markets.base import codec
+from noobit_markets.base.request import decode_response
+
+
+REQUEST = httpx.Request("GET", "https://ftx.com/api/markets/BTC-PERP/orderbook")
+
+
+
+
+@pytest.fixture
+def reload_codec(monkeypatch):
+    """Reload the codec with NOOBIT_JSON_CODEC set, then restore the default backend.
+    """
+
+    def reload(backend):
+        if backend is None:
+            monkeypatch.delenv("NOOBIT_JSON_CODEC", raising=False)
+        else:
+            monkeypatch.setenv("NOOBIT_JSON_CODEC", backend)
+        return importlib.reload(codec)
+
+    yield reload
+
+    monkeypatch.undo()
+    importlib.reload(codec)
+
+
+def _available(name):
+    try:
+        __import__(name)
+        return True
+    except ImportError:
+        return False
+
+
+
+
+def test_select_backend():
+
+    assert codec._select_backend("json") == "json"
+    # unknown backend: best available
+    assert codec._select_backend("unknown") == codec._select_backend(None)
+
+    if _available("orjson"):
+        assert codec._select_backend(None) == "orjson"
+
+
+def test_select_backend_fallback(monkeypatch):
+
+    real_import = __import__
+
+    def no_orjson(name, *args, **kwargs):
+        if name == "orjson":
+            raise ImportError(name)
+        return real_import(name, *args, **kwargs)
+
+    monkeypatch.setattr("builtins.__import__", no_orjson)
+    assert codec._select_backend("orjson") == ("ujson" if _available("ujson") else "json")
+
+
+@pytest.mark.parametrize("backend", ["orjson", "ujson", "json"])
+def test_backend_from_env(reload_codec, backend):
+
+    if not _available(backend):
+        pytest.skip(f"{backend} not installed")
+
+    module = reload_codec(backend)
+    assert module.JSON_CODEC == backend
+
+    payload = {"pair": "XBT/USD", "price": "5541.2", "volume": 0.15, "count": 3, "levels": [[1, "a"]], "c": None}
+    dumped = module.dumps(payload)
+    assert isinstance(dumped, str)
+    assert module.loads(dumped) == payload
+    assert module.loads(dumped.encode()) == payload
+
+
+def test_default_backend(reload_codec):
+
+    module = reload_codec(None)
+    assert module.JSON_CODEC == module._select_backend(None)
+
+
+def test_floats_to_decimal():
+
+    class Model(pydantic.BaseModel):
+        price: Decimal
+
+    # numbers keep the digits of the payload once validated
+    content = codec.loads(b'{"price": 9123.34567}')
+    assert Model(**content).price == Decimal("9123.34567")
+
+
+def test_decimal_precision():
+
+    class Model(pydantic.BaseModel):
+        price: Decimal
+        count: int
+
+    # more digits than a float can hold
+    raw = b'{"price": 0.12345678901234567890123, "count": 3}'
+
+    content = codec.loads(raw, decimal=True)
+    assert content["price"] == Decimal("0.12345678901234567890123")
+    # integers are left as is
+    assert content["count"] == 3 and isinstance(content["count"], int)
+    assert Model(**content).price == Decimal("0.12345678901234567890123")
+
+    # through a float, digits are lost
+    assert Model(**codec.loads(raw)).price != Decimal("0.12345678901234567890123")
+
+
+@pytest.mark.asyncio
+async def test_decode_response_decimal():
+
+    response = httpx.Response(200, content=b'{"result": {"bids": [[9123.123456789012345678, 1.5]]}}', request=REQUEST)
+
+    decoded = await decode_response(response, decimal=True)
+    assert decoded.content["result"]["bids"] == [[Decimal("9123.123456789012345678"), Decimal("1.5")]]
+
+    decoded = await decode_response(response)
+    assert isinstance(decoded.content["result"]["bids"][0][0], float)
@@ -0,0 +1,174 @@
+from decimal import Decimal
+
+import pytest
+
+from noobit_markets.base.history import History
+from noobit_markets.base.models.result import Ok, Err
+from noobit_markets.base.models.rest.response import (
+    NoobitResponseOhlc,
+    NoobitResponseItemOhlc,
+    NoobitResponseTrades,
+)
+from noobit_markets.base.models.rest.records import TradeRecord
+
+
+STEP = 1000
+
+
+def _candle(utc_time, close="1"):
+    return NoobitResponseItemOhlc.construct(
+        symbol="XBT-USD",
+        utcTime=utc_time,
+        open=Decimal(1),
+        high=Decimal(1),
+        low=Decimal(1),
+        close=Decimal(close),
+        volume=Decimal(1),
+        trdCount=1
+    )
+
+
+def _exchange(closed, page_size=3, overlap=0):
+    """Candles every STEP ms, the last one still open (its close changes on every request).
+
+    Pages start `overlap` candles before `since`.
+    """
+
+    calls = []
+
+    async def fetch_page(since):
+        calls.append(since)
+        candles = [_candle(t) for t in range(STEP, (closed + 1) * STEP, STEP)]
+        candles.append(_candle((closed + 1) * STEP, close=str(len(calls))))
+        page = [c for c in candles if c.utcTime >= since - overlap * STEP][:page_size]
+        return Ok(NoobitResponseOhlc.construct(ohlc=tuple(page), rawJson=None, exchange=None))
+
+    return fetch_page, calls
+
+
+def _history(fetch_page, start=STEP, end=None):
+    return History(
+        fetch_page, start, end, "ohlc", "utcTime",
+        key=lambda candle: candle.utcTime, hold_last=True
+    )
+
+
+async def _collect(history):
+    pages = []
+    async for page in history:
+        assert page.is_ok()
+        pages.append(page.value)
+    return [c.utcTime for page in pages for c in page.ohlc]
+
+
+@pytest.mark.asyncio
+async def test_history_stops_on_open_candle():
+
+    fetch_page, calls = _exchange(closed=7)
+    history = _history(fetch_page)
+
+    times = await _collect(history)
+
+    # all closed candles once, the open one never
+    assert times == list(range(STEP, 8 * STEP, STEP))
+    assert history.cursor == 8 * STEP
+    assert len(calls) < 10
+
+
+@pytest.mark.asyncio
+async def test_history_only_open_candle():
+
+    fetch_page, calls = _exchange(closed=0)
+
+    assert await _collect(_history(fetch_page)) == []
+    assert len(calls) == 1
+
+
+@pytest.mark.asyncio
+async def test_history_overlap_deduplicated():
+
+    fetch_page, _ = _exchange(closed=10, page_size=4, overlap=2)
+    history = _history(fetch_page)
+
+    assert await _collect(history) == list(range(STEP, 11 * STEP, STEP))
+
+    # without holding back, each page starts at the last candle of the previous one
+    history = History(fetch_page, STEP, 11 * STEP, "ohlc", "utcTime", key=lambda candle: candle.utcTime)
+
+    assert await _collect(history) == list(range(STEP, 11 * STEP, STEP))
+    assert history.duplicates > 0
+
+
+@pytest.mark.asyncio
+async def test_history_end_in_the_past():
+
+    fetch_page, _ = _exchange(closed=10)
+
+    # last candle before `end` is closed: not held back
+    assert await _collect(_history(fetch_page, end=5 * STEP)) == [STEP, 2 * STEP, 3 * STEP, 4 * STEP]
+
+
+@pytest.mark.asyncio
+async def test_history_err_stops():
+
+    async def fetch_page(since):
+        return Err(ValueError("down"))
+
+    pages = [page async for page in _history(fetch_page)]
+    assert len(pages) == 1 and pages[0].is_err()
+
+
+@pytest.mark.asyncio
+async def test_history_exchange_cursor():
+
+    # trades at 1..9 ms, exchange cursor (kraken `last`) ahead of the last trade of each page
+    trades = [
+        TradeRecord(
+            trdMatchID=str(t), orderID=None, symbol="XBT-USD", side="buy", ordType="market",
+            avgPx=Decimal(1), cumQty=Decimal(1), grossTradeAmt=Decimal(1), transactTime=t
+        )
+        for t in range(1, 10)
+    ]
+    calls = []
+
+    async def fetch_page(since):
+        calls.append(since)
+        page = [t for t in trades if t.transactTime >= since][:3]
+        last = page[-1].transactTime + 1 if page else since
+        return Ok(NoobitResponseTrades.construct(trades=tuple(page), rawJson={"last": last}, exchange=None))
+
+    history = History(fetch_page, 1, None, cursor=lambda response: response.rawJson["last"])
+    pages = [page async for page in history]
+
+    assert [t.transactTime for page in pages for t in page.value.trades] == list(range(1, 10))
+    assert calls == [1, 4, 7, 10]
+    assert history.duplicates == 0
+
+
+@pytest.mark.asyncio
+async def test_history_identical_trades():
+
+    # kraken trades have no id: identical fills in the same millisecond are distinct trades
+    def trade(t):
+        return TradeRecord(
+            trdMatchID=None, orderID=None, symbol="XBT-USD", side="buy", ordType="market",
+            avgPx=Decimal(1), cumQty=Decimal(1), grossTradeAmt=Decimal(1), transactTime=t
+        )
+
+    trades = [trade(1), trade(1), trade(2), trade(2), trade(2), trade(3), trade(3), trade(4)]
+    calls = []
+
+    async def fetch_page(since):
+        calls.append(since)
+        page = [t for t in trades if t.transactTime >= since][:4]
+        return Ok(NoobitResponseTrades.construct(trades=tuple(page), rawJson=None, exchange=None))
+
+    history = History(fetch_page, 1, None)
+    pages = [page async for page in history]
+
+    assert [t.transactTime for page in pages for t in page.value.trades] == [1, 1, 2, 2, 2, 3, 3, 4]
+    assert history.items == len(trades)
+    # each page starts again at the last trade time of the previous one: only those are dropped
+    assert calls == [1, 2, 3, 4]
+    assert history.duplicates == 2 + 1 + 1
+
@@ -0,0 +1,108 @@
+import asyncio
+
+import pytest
+
+from noobit_markets.base.queues import FeedQueue
+
+
+
+
+def _drain(queue):
+    items = []
+    while not queue.empty():
+        items.append(queue.get_nowait())
+    return items
+
+
+
+
+@pytest.mark.asyncio
+async def test_block():
+
+    queue = FeedQueue(2, "block")
+    await queue.put(1)
+    await queue.put(2)
+
+    # full: producer waits for the consumer
+    put = asyncio.ensure_future(queue.put(3))
+    await asyncio.sleep(0)
+    assert not put.done()
+
+    assert await queue.get() == 1
+    await asyncio.wait_for(put, 1)
+
+    assert _drain(queue) == [2, 3]
+
+    stats = queue.stats()
+    assert stats.puts == 3 and stats.drops == 0 and stats.high_water == 2
+
+
+@pytest.mark.asyncio
+async def test_drop_oldest():
+
+    queue = FeedQueue(3, "drop_oldest")
+    for i in range(5):
+        await queue.put(i)
+
+    assert _drain(queue) == [2, 3, 4]
+
+    stats = queue.stats()
+    assert stats.puts == 5
+    assert stats.drops == 2
+    assert stats.high_water == 3
+    assert stats.depth == 0
+
+
+@pytest.mark.asyncio
+async def test_conflate():
+
+    queue = FeedQueue(10, "conflate", key=lambda msg: msg[0])
+    for msg in [("XBT", 1), ("ETH", 1), ("XBT", 2), ("XBT", 3)]:
+        await queue.put(msg)
+
+    # latest message per key, in the order keys were first queued
+    assert _drain(queue) == [("XBT", 3), ("ETH", 1)]
+    assert queue.stats().conflated == 2
+    assert queue.stats().drops == 0
+
+
+@pytest.mark.asyncio
+async def test_conflate_merge():
+
+    def merge(pending, new):
+        return (new[0], pending[1] + new[1])
+
+    queue = FeedQueue(10, "conflate", key=lambda msg: msg[0], merge=merge)
+    for msg in [("XBT", 1), ("XBT", 2), ("ETH", 5), ("XBT", 3)]:
+        await queue.put(msg)
+
+    assert _drain(queue) == [("XBT", 6), ("ETH", 5)]
+
+
+@pytest.mark.asyncio
+async def test_conflate_full_drops_oldest():
+
+    queue = FeedQueue(2, "conflate", key=lambda msg: msg[0])
+    for msg in [("XBT", 1), ("ETH", 1), ("LTC", 1), ("ETH", 2)]:
+        await queue.put(msg)
+
+    assert _drain(queue) == [("ETH", 2), ("LTC", 1)]
+    assert queue.stats().drops == 1
+    assert queue.stats().conflated == 1
+
+
+def test_conflate_requires_key():
+
+    with pytest.raises(ValueError):
+        FeedQueue(10, "conflate")
+
+
+@pytest.mark.asyncio
+async def test_unbounded():
+
+    queue = FeedQueue(0, "drop_oldest")
+    for i in range(100):
+        await queue.put(i)
+
+    assert queue.qsize() == 100
+    assert queue.stats().drops == 0
@@ -0,0 +1,218 @@
+import asyncio
+
+import pytest
+
+from noobit_markets.base import ratelimit
+from noobit_markets.base.ratelimit import TokenBucket, RateLimit, RateLimits, RateLimiter
+from noobit_markets.base.errors import DDoSProtection, BaseError
+from noobit_markets.exchanges.binance import endpoints as binance_endpoints
+
+
+
+
+class FakeClock:
+
+    def __init__(self):
+        self.now = 0.
+
+    def monotonic(self):
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = FakeClock()
+    monkeypatch.setattr(ratelimit.time, "monotonic", clock.monotonic)
+    return clock
+
+
+LIMITS = RateLimits(
+    limits={
+        "ip": RateLimit(capacity=2, rate=1),
+        "account": RateLimit(capacity=1, rate=.5, per_key=True),
+    },
+    costs={
+        "public": {"ip": 1},
+        "private": {"ip": 1, "account": 1},
+        "heavy": {"ip": lambda params: params.get("n", 1)},
+    },
+    default={"ip": 1},
+    key_header="API-Key",
+)
+
+
+
+
+def test_reserve_order(clock):
+
+    bucket = TokenBucket(capacity=2, rate=1)
+
+    # burst of capacity, then each request waits for the one before
+    assert [bucket.reserve(1) for _ in range(5)] == [0., 0., 1., 2., 3.]
+
+    clock.now += 3.
+    assert bucket.tokens == 0.
+    assert bucket.reserve(1) == 1.
+
+
+def test_refill_capped(clock):
+
+    bucket = TokenBucket(capacity=2, rate=1)
+    bucket.reserve(2)
+
+    clock.now += 10.
+    assert bucket.tokens == 2.
+
+
+def test_pause(clock):
+
+    bucket = TokenBucket(capacity=2, rate=1)
+    bucket.pause(5.)
+    assert bucket.reserve(1) == 6.
+
+    # pauses do not add up
+    bucket = TokenBucket(capacity=2, rate=1)
+    bucket.pause(5.)
+    bucket.pause(5.)
+    assert bucket.reserve(1) == 6.
+
+    clock.now += 6.
+    assert bucket.tokens == 0.
+
+
+@pytest.mark.asyncio
+async def test_acquire_waits_in_order():
+
+    bucket = TokenBucket(capacity=1, rate=50)
+    done = []
+
+    async def request(i):
+        await bucket.acquire()
+        done.append(i)
+
+    await asyncio.gather(*(request(i) for i in range(5)))
+    assert done == list(range(5))
+
+
+@pytest.mark.asyncio
+async def test_refund_on_cancel():
+
+    bucket = TokenBucket(capacity=1, rate=1)
+    await bucket.acquire()
+
+    task = asyncio.ensure_future(bucket.acquire(1))
+    await asyncio.sleep(0)
+    assert bucket.tokens < 0
+
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+
+    # cancelled request gave its token back
+    assert bucket.tokens >= 0
+
+
+@pytest.mark.asyncio
+async def test_limiter_refund_on_cancel():
+
+    limiter = RateLimiter(LIMITS)
+    headers = {"API-Key": "key"}
+
+    await limiter.acquire("private", headers=headers)
+
+    task = asyncio.ensure_future(limiter.acquire("private", headers=headers))
+    await asyncio.sleep(0)
+    assert limiter.waits == 1
+
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+
+    assert limiter.bucket("ip").tokens >= 1
+    assert limiter.bucket("account", "key").tokens >= 0
+
+
+def test_per_key_buckets(clock):
+
+    limiter = RateLimiter(LIMITS)
+
+    # ip limit shared by all keys
+    assert limiter.bucket("ip", "a") is limiter.bucket("ip", "b")
+    assert limiter.bucket("ip", "a") is limiter.bucket("ip")
+    # account limit per key
+    assert limiter.bucket("account", "a") is not limiter.bucket("account", "b")
+    assert limiter.bucket("account", "a") is limiter.bucket("account", "a")
+
+    assert limiter._key({"API-Key": "a"}) == "a"
+    assert limiter._key({"Other": "a"}) is None
+    assert limiter._key(None) is None
+
+
+@pytest.mark.asyncio
+async def test_acquire_per_key(clock):
+
+    limiter = RateLimiter(LIMITS)
+
+    await limiter.acquire("private", headers={"API-Key": "a"})
+    await limiter.acquire("private", headers={"API-Key": "b"})
+
+    assert limiter.bucket("account", "a").tokens == 0
+    assert limiter.bucket("account", "b").tokens == 0
+    assert limiter.bucket("ip").tokens == 0
+    assert limiter.waits == 0
+
+    # pause only the limits of the endpoint, for the key of the headers
+    limiter.pause(10., "private", {"API-Key": "a"})
+    assert limiter.bucket("account", "a").tokens == -5.
+    assert limiter.bucket("account", "b").tokens == 0
+    assert limiter.bucket("ip").tokens == -10.
+
+
+def test_costs():
+
+    limiter = RateLimiter(LIMITS)
+
+    assert limiter.costs("private") == {"ip": 1, "account": 1}
+    assert limiter.costs("heavy", {"n": 7}) == {"ip": 7}
+    assert limiter.costs("heavy") == {"ip": 1}
+    assert limiter.costs("unknown") == {"ip": 1}
+
+
+def test_binance_weights():
+
+    limiter = RateLimiter(binance_endpoints.BINANCE_RATE_LIMITS)
+
+    assert limiter.costs("depth", {"limit": 100}) == {"weight": 1}
+    assert limiter.costs("depth", {"limit": 500}) == {"weight": 5}
+    assert limiter.costs("depth", {"limit": 1000}) == {"weight": 10}
+    assert limiter.costs("depth", {"limit": 5000}) == {"weight": 50}
+    assert limiter.costs("depth", {}) == {"weight": 1}
+
+    assert limiter.costs("ticker/24hr", {"symbol": "XBTUSDT"}) == {"weight": 1}
+    assert limiter.costs("ticker/24hr", {"symbols": '["XBTUSDT","ETHUSDT"]'}) == {"weight": 2}
+    assert limiter.costs("ticker/24hr", {}) == {"weight": 40}
+    assert limiter.costs("ticker/bookTicker", {}) == {"weight": 2}
+
+    assert limiter.costs("api/v3/order", {}) == {"weight": 2, "orders": 1}
+    assert limiter.costs("api/v3/openOrders", {}) == {"weight": 40}
+
+
+def test_set_limit(clock):
+
+    limiter = RateLimiter(LIMITS)
+    limiter.bucket("account", "a").reserve(1)
+
+    limiter.set_limit("account", RateLimit(capacity=3, rate=1, per_key=True))
+    assert limiter.bucket("account", "a").tokens == 3
+    assert limiter.bucket("account", "a").capacity == 3
+
+
+def test_on_errors(clock):
+
+    limiter = RateLimiter(LIMITS)
+
+    limiter.on_errors([BaseError("", None)], "public")
+    assert limiter.bucket("ip").tokens == 2
+
+    limiter.on_errors([DDoSProtection("", None)], "public")
+    assert limiter.bucket("ip").tokens == -DDoSProtection.sleep * 1
@@ -0,0 +1,153 @@
+import asyncio
+
+import pytest
+
+from noobit_markets.base.request import SingleFlight, request_key
+from noobit_markets.base.models.result import Ok
+from noobit_markets.exchanges.kraken.rest import base as kraken_base
+
+
+
+
+class Stub:
+    """Coroutine blocked until `release`, counting its calls.
+    """
+
+    def __init__(self):
+        self.calls = 0
+        self.event = asyncio.Event()
+
+    async def __call__(self, value):
+        self.calls += 1
+        await self.event.wait()
+        return Ok(value)
+
+    def release(self):
+        self.event.set()
+
+
+
+
+@pytest.mark.asyncio
+async def test_concurrent_calls_share_one_call():
+
+    flight = SingleFlight()
+    stub = Stub()
+
+    tasks = [asyncio.ensure_future(flight.call("key", stub, "value")) for _ in range(10)]
+    await asyncio.sleep(0)
+    assert len(flight) == 1
+
+    stub.release()
+    results = await asyncio.gather(*tasks)
+
+    assert stub.calls == 1
+    assert all(result.value == "value" for result in results)
+    assert flight.calls == 1 and flight.shared == 9
+    assert len(flight) == 0
+
+    # not in flight anymore: new call
+    await flight.call("key", stub, "value")
+    assert stub.calls == 2
+
+
+@pytest.mark.asyncio
+async def test_different_keys_not_shared():
+
+    flight = SingleFlight()
+    stub = Stub()
+    stub.release()
+
+    await asyncio.gather(flight.call("a", stub, 1), flight.call("b", stub, 2))
+    assert stub.calls == 2
+
+
+@pytest.mark.asyncio
+async def test_cancelled_caller_does_not_cancel_call():
+
+    flight = SingleFlight()
+    stub = Stub()
+
+    first = asyncio.ensure_future(flight.call("key", stub, "value"))
+    second = asyncio.ensure_future(flight.call("key", stub, "value"))
+    await asyncio.sleep(0)
+
+    first.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await first
+
+    stub.release()
+    result = await second
+
+    assert result.value == "value"
+    assert stub.calls == 1
+
+
+@pytest.mark.asyncio
+async def test_all_callers_cancelled():
+
+    flight = SingleFlight()
+    stub = Stub()
+
+    caller = asyncio.ensure_future(flight.call("key", stub, "value"))
+    await asyncio.sleep(0)
+    caller.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await caller
+
+    # call still runs to completion, then leaves the table
+    assert len(flight) == 1
+    stub.release()
+    await asyncio.sleep(0)
+    await asyncio.sleep(0)
+    assert len(flight) == 0
+
+
+@pytest.mark.asyncio
+async def test_unhashable_key_falls_through():
+
+    key = request_key("https://api.kraken.com", {"pair": ["XBTUSD"]})
+    assert key is None
+
+    flight = SingleFlight()
+    stub = Stub()
+
+    tasks = [asyncio.ensure_future(flight.call(key, stub, "value")) for _ in range(3)]
+    await asyncio.sleep(0)
+    assert len(flight) == 0
+
+    stub.release()
+    await asyncio.gather(*tasks)
+    assert stub.calls == 3
+    assert flight.calls == 0
+
+
+def test_request_key():
+
+    assert request_key("url", {"a": 1, "b": 2}) == request_key("url", {"b": 2, "a": 1})
+    assert request_key("url", {"a": 1}) != request_key("url", {"a": 2})
+    assert request_key(1, "url") != request_key(2, "url")
+
+
+@pytest.mark.asyncio
+async def test_kraken_key_includes_client(monkeypatch):
+
+    stub = Stub()
+
+    async def request(client, valid_req, headers, base_url, endpoint):
+        return await stub(client)
+
+    monkeypatch.setattr(kraken_base, "_get_result_content_from_public_req", request)
+
+    clients = [object(), object()]
+    tasks = [
+        asyncio.ensure_future(kraken_base.get_result_content_from_public_req(client, None, {}, "https://api.kraken.com", "Time"))
+        for client in clients + clients
+    ]
+    await asyncio.sleep(0)
+    stub.release()
+    results = await asyncio.gather(*tasks)
+
+    # one call per client
+    assert stub.calls == 2
+    assert [result.value for result in results] == clients + clients
@@ -0,0 +1,229 @@
+import asyncio
+
+import httpx
+import pytest
+
+from noobit_markets.base import retry
+from noobit_markets.base.retry import RetryBudget, RetryPolicy, with_retry
+from noobit_markets.base.errors import (
+    BaseError,
+    DDoSProtection,
+    InvalidNonce,
+    OnMaintenance,
+    RateLimitExceeded,
+    RequestTimeout,
+)
+from noobit_markets.base.models.result import Ok, Err
+
+
+REQUEST = httpx.Request("GET", "https://api.kraken.com/0/public/Time")
+
+
+
+
+class FakeClock:
+
+    def __init__(self):
+        self.now = 0.
+        self.sleeps = []
+
+    def monotonic(self):
+        return self.now
+
+    async def sleep(self, delay):
+        self.sleeps.append(delay)
+        self.now += delay
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = FakeClock()
+    monkeypatch.setattr(retry.time, "monotonic", clock.monotonic)
+    monkeypatch.setattr(retry.asyncio, "sleep", clock.sleep)
+    # upper bound of the jitter range, so delays are deterministic
+    monkeypatch.setattr(retry.random, "uniform", lambda low, high: high)
+    return clock
+
+
+def stub(*results):
+    """Coroutine returning (or raising) `results` one after the other.
+    """
+
+    calls = []
+
+    async def request(*args, **kwargs):
+        calls.append((args, kwargs))
+        result = results[min(len(calls), len(results)) - 1]
+        if isinstance(result, Exception):
+            raise result
+        return result
+
+    request.calls = calls
+    return request
+
+
+def policy(**kwargs):
+    return RetryPolicy(budget=RetryBudget(), **kwargs)
+
+
+
+
+def test_delay_bounds(clock):
+
+    p = policy(base_delay=.5, max_delay=3.)
+    assert [p.delay(n) for n in range(1, 6)] == [.5, 1., 2., 3., 3.]
+
+
+def test_delay_jitter_range():
+
+    p = policy(base_delay=.5, max_delay=3.)
+    for attempt in range(1, 10):
+        for _ in range(20):
+            assert 0 <= p.delay(attempt) <= min(3., .5 * 2 ** (attempt - 1))
+
+
+def test_decisions_mro():
+
+    p = policy()
+
+    # subclass of NetworkError
+    assert p.should_retry(RateLimitExceeded("", None))
+    assert p.should_retry(RequestTimeout("", None))
+    # closer in the mro than NetworkError
+    assert not p.should_retry(OnMaintenance("", None))
+    assert not p.should_retry(BaseError("", None))
+    assert not p.should_retry(ValueError())
+
+    # all errors of a kraken response must be retryable
+    assert p.should_retry((RateLimitExceeded("", None), RequestTimeout("", None)))
+    assert not p.should_retry((RateLimitExceeded("", None), BaseError("", None)))
+    assert not p.should_retry(())
+
+    p = policy(decisions={RateLimitExceeded: False, OnMaintenance: True})
+    assert not p.should_retry(RateLimitExceeded("", None))
+    assert p.should_retry(DDoSProtection("", None))
+    assert p.should_retry(OnMaintenance("", None))
+
+
+def test_not_idempotent():
+
+    p = policy()
+
+    # not processed by the exchange
+    assert p.should_retry(DDoSProtection("", None), idempotent=False)
+    assert p.should_retry(RateLimitExceeded("", None), idempotent=False)
+    assert p.should_retry(InvalidNonce("", None), idempotent=False)
+    assert p.should_retry(httpx.ConnectError("", request=REQUEST), idempotent=False)
+    assert p.should_retry(httpx.ConnectTimeout("", request=REQUEST), idempotent=False)
+
+    # may have been processed
+    assert not p.should_retry(RequestTimeout("", None), idempotent=False)
+    assert not p.should_retry(httpx.ReadTimeout("", request=REQUEST), idempotent=False)
+    assert p.should_retry(httpx.ReadTimeout("", request=REQUEST), idempotent=True)
+
+
+@pytest.mark.asyncio
+async def test_call_retries_until_ok(clock):
+
+    request = stub(Err(RequestTimeout("", None)), Err(RequestTimeout("", None)), Ok("value"))
+    p = policy(base_delay=1., max_delay=10.)
+
+    result = await with_retry(request, p)("symbol", timeout=1)
+
+    assert result.is_ok() and result.value == "value"
+    assert len(request.calls) == 3
+    assert request.calls[0] == (("symbol", ), {"timeout": 1})
+    assert clock.sleeps == [1., 2.]
+    assert p.retries == 2
+
+
+@pytest.mark.asyncio
+async def test_call_max_attempts(clock):
+
+    request = stub(Err(RequestTimeout("", None)))
+    p = policy(max_attempts=3)
+
+    result = await p.call(request)
+
+    assert result.is_err() and isinstance(result.value, RequestTimeout)
+    assert len(request.calls) == 3
+    assert len(clock.sleeps) == 2
+
+
+@pytest.mark.asyncio
+async def test_call_not_retryable(clock):
+
+    request = stub(Err(BaseError("", None)), Ok("value"))
+    result = await policy().call(request)
+
+    assert result.is_err()
+    assert len(request.calls) == 1
+    assert clock.sleeps == []
+
+
+@pytest.mark.asyncio
+async def test_call_not_idempotent(clock):
+
+    request = stub(Err(RequestTimeout("", None)), Ok("value"))
+    result = await policy().call(request, idempotent=False)
+    assert result.is_err() and len(request.calls) == 1
+
+    request = stub(Err(InvalidNonce("", None)), Ok("value"))
+    result = await policy().call(request, idempotent=False)
+    assert result.is_ok() and len(request.calls) == 2
+
+    request = stub(httpx.ConnectError("", request=REQUEST), Ok("value"))
+    result = await policy().call(request, idempotent=False)
+    assert result.is_ok() and len(request.calls) == 2
+
+
+@pytest.mark.asyncio
+async def test_call_http_error_to_err(clock):
+
+    error = httpx.ReadTimeout("", request=REQUEST)
+    request = stub(error)
+
+    result = await policy(max_attempts=2).call(request)
+
+    assert result.is_err() and result.value is error
+    assert len(request.calls) == 2
+
+
+@pytest.mark.asyncio
+async def test_budget_exhausted(clock):
+
+    budget = RetryBudget(ratio=0, min_retries=3, window=10.)
+    p = RetryPolicy(max_attempts=10, base_delay=0., budget=budget)
+
+    request = stub(Err(RequestTimeout("", None)))
+    result = await p.call(request)
+
+    assert result.is_err()
+    # first attempt + the 3 retries of the budget
+    assert len(request.calls) == 4
+    assert budget.rejected == 1
+
+    # budget is still spent: no retry at all
+    request = stub(Err(RequestTimeout("", None)))
+    await p.call(request)
+    assert len(request.calls) == 1
+    assert budget.rejected == 2
+
+    # retries fall out of the window
+    clock.now += 11.
+    request = stub(Err(RequestTimeout("", None)), Ok("value"))
+    result = await p.call(request)
+    assert result.is_ok() and len(request.calls) == 2
+
+
+def test_budget_ratio(clock):
+
+    budget = RetryBudget(ratio=.5, min_retries=0, window=10.)
+
+    for _ in range(4):
+        budget.on_request()
+
+    assert budget.try_retry()
+    assert budget.try_retry()
+    assert not budget.try_retry()
+    assert budget.rejected == 1
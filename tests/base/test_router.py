@@ -0,0 +1,77 @@
+import types
+
+import pytest
+
+from noobit_markets.base.router import WsRouter
+from noobit_markets.base.models.result import Ok, Err
+
+
+
+
+def _parse_msg(frame):
+    return {"value": int(frame[1])}
+
+
+def _validate_parsed(frame, parsed):
+    if parsed["value"] < 0:
+        return Err(ValueError("negative"))
+    return Ok(parsed)
+
+
+parser = types.SimpleNamespace(parse_msg=_parse_msg, validate_parsed=_validate_parsed)
+
+
+class Router(WsRouter):
+
+    routes = {"value": (parser, "value"), "ignored": None}
+
+    def channel_id(self, frame):
+        return frame[0]
+
+    def channel_name(self, frame):
+        return frame[2]
+
+
+class Queue:
+
+    def __init__(self):
+        self.items = []
+
+    async def put(self, item):
+        self.items.append(item)
+
+
+
+
+@pytest.mark.asyncio
+async def test_invalid_frames_counted():
+
+    router = Router()
+    queues = {"value": Queue()}
+
+    assert (await router('[1, "5", "value"]', queues, {})).value == {"value": 5}
+    # fails validation
+    assert await router('[1, "-1", "value"]', queues, {}) is None
+    # parser raises
+    assert await router('[1, "not a number", "value"]', queues, {}) is None
+    # known channel without parser
+    assert await router('[2, "5", "ignored"]', queues, {}) is None
+
+    assert [msg.value for msg in queues["value"].items] == [{"value": 5}]
+
+    stats = router.stats()
+    assert list(stats) == ["value"]
+    assert stats["value"].count == 3
+    assert stats["value"].errors == 2
+
+
+def test_copy():
+
+    router = Router()
+    router.learn(1, "value")
+    router._counters["value"] = None
+
+    new = router.copy()
+    assert new._channels == {} and new.stats() == {}
+    assert new.routes is router.routes
+    assert not new.lazy
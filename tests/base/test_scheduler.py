@@ -0,0 +1,142 @@
+import asyncio
+
+import pytest
+
+from noobit_markets.base.scheduler import Scheduler
+from noobit_markets.exchanges.kraken.websockets import base as ws_base
+
+
+
+
+async def _sleep(seconds, result=None):
+    await asyncio.sleep(seconds)
+    return result
+
+
+async def _fail():
+    raise ValueError("failed")
+
+
+
+
+@pytest.mark.asyncio
+async def test_join_results():
+
+    scheduler = Scheduler()
+    scheduler.schedule(_sleep(0, "a"))
+    scheduler.schedule(_sleep(0.01, "b"))
+    scheduler.schedule(_fail(), name="failing")
+    assert len(scheduler) == 3
+
+    results = await scheduler.join()
+
+    assert sorted(r for r in results if isinstance(r, str)) == ["a", "b"]
+    assert len(scheduler) == 0
+
+    stats = scheduler.stats()
+    assert stats.scheduled == 3 and stats.running == 0
+    assert stats.done == 2 and stats.failed == 1 and stats.cancelled == 0
+    assert stats.max_run_ms >= 10
+
+    name, error = scheduler.failures[0]
+    assert name == "failing" and isinstance(error, ValueError)
+
+
+@pytest.mark.asyncio
+async def test_join_empty():
+
+    assert await Scheduler().join() == []
+
+
+@pytest.mark.asyncio
+async def test_cancel_task():
+
+    scheduler = Scheduler()
+    task = scheduler.schedule(_sleep(10))
+    other = scheduler.schedule(_sleep(0, "other"))
+
+    await asyncio.sleep(0)
+    task.cancel()
+    await scheduler.join()
+
+    assert other.result() == "other"
+    stats = scheduler.stats()
+    assert stats.cancelled == 1 and stats.done == 1 and stats.running == 0
+
+
+@pytest.mark.asyncio
+async def test_cancel_all():
+
+    cleaned = []
+
+    async def long_running(i):
+        try:
+            await asyncio.sleep(10)
+        finally:
+            cleaned.append(i)
+
+    scheduler = Scheduler()
+    for i in range(5):
+        scheduler.schedule(long_running(i))
+    await asyncio.sleep(0)
+
+    scheduler.cancel_all()
+    results = await asyncio.wait_for(scheduler.join(), 1)
+
+    assert all(isinstance(r, asyncio.CancelledError) for r in results)
+    assert sorted(cleaned) == list(range(5))
+    assert len(scheduler) == 0
+
+    stats = scheduler.stats()
+    assert stats.cancelled == 5 and stats.done == 0 and stats.failed == 0
+
+
+@pytest.mark.asyncio
+async def test_cancel_before_start():
+
+    scheduler = Scheduler()
+    started = []
+
+    async def coro():
+        started.append(True)
+
+    scheduler.schedule(coro())
+    scheduler.cancel_all()
+    await scheduler.join()
+
+    assert started == []
+    assert scheduler.stats().cancelled == 1
+
+
+@pytest.mark.asyncio
+async def test_max_failures():
+
+    scheduler = Scheduler(max_failures=2)
+    for i in range(4):
+        scheduler.schedule(_fail(), name=str(i))
+    await scheduler.join()
+
+    assert scheduler.failed == 4
+    assert [name for name, _ in scheduler.failures] == ["2", "3"]
+
+
+@pytest.mark.asyncio
+async def test_ws_shutdown_cancels_tasks():
+
+    api = ws_base.KrakenWsPublic.__new__(ws_base.KrakenWsPublic)
+    api._terminate = False
+    api._scheduler = Scheduler()
+    api._running_tasks = {"connection": asyncio.ensure_future(_sleep(10))}
+
+    task = api.schedule(_sleep(10), name="user task")
+    await asyncio.sleep(0)
+
+    api.shutdown()
+    await asyncio.wait_for(api._scheduler.join(), 1)
+    await asyncio.gather(*api._running_tasks.values(), return_exceptions=True)
+
+    assert api._terminate
+    assert task.cancelled()
+    assert api._running_tasks["connection"].cancelled()
+    assert api.task_stats().cancelled == 1
+    assert api.task_stats().running == 0
@@ -0,0 +1,67 @@
+import asyncio
+
+import pytest
+
+from noobit_markets.base.symbols import SymbolsRegistry
+from noobit_markets.base.models.result import Ok
+
+
+
+
+class Fetch:
+    """Symbols endpoint blocked until `release`, counting its calls.
+    """
+
+    def __init__(self):
+        self.calls = 0
+        self.event = asyncio.Event()
+
+    async def __call__(self, client=None):
+        self.calls += 1
+        await self.event.wait()
+        return Ok(None)
+
+    def release(self):
+        self.event.set()
+
+
+
+
+@pytest.mark.asyncio
+async def test_refresh_shared():
+
+    fetch = Fetch()
+    registry = SymbolsRegistry("test", fetch, persist=False)
+
+    refreshes = [asyncio.ensure_future(registry.refresh()) for _ in range(3)]
+    await asyncio.sleep(0)
+    fetch.release()
+
+    assert all(result.is_ok() for result in await asyncio.gather(*refreshes))
+    assert fetch.calls == 1
+    assert registry._refreshing is None
+
+
+@pytest.mark.asyncio
+async def test_refresh_caller_cancelled():
+
+    fetch = Fetch()
+    registry = SymbolsRegistry("test", fetch, persist=False)
+
+    caller = asyncio.ensure_future(registry.refresh())
+    await asyncio.sleep(0)
+    caller.cancel()
+    await asyncio.gather(caller, return_exceptions=True)
+
+    # fetch keeps going, shared with later callers
+    background = registry.refresh_in_background()
+    assert not background.done()
+    fetch.release()
+    await background
+
+    # cleared once done: next refresh fetches again
+    assert registry._refreshing is None
+    next_refresh = registry.refresh_in_background()
+    assert next_refresh is not background
+    await next_refresh
+    assert fetch.calls == 2
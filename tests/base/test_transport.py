@@ -0,0 +1,51 @@
+import asyncio
+
+import httpx
+
+from noobit_markets.base.transport import HttpTransport, with_transport
+from noobit_markets.exchanges.kraken import endpoints
+
+
+URL = "https://api.kraken.com/0/public/Time"
+
+
+def test_transport_two_event_loops():
+
+    transport = HttpTransport(endpoints.KRAKEN_ENDPOINTS, max_per_host=1)
+    clients = []
+
+    async def run():
+        client = transport.client
+        clients.append(client)
+
+        async def request(method, url, **kwargs):
+            await asyncio.sleep(0.01)
+            return httpx.Response(200, request=httpx.Request(method, url))
+
+        client.request = request
+
+        # concurrent requests wait on the host semaphore
+        responses = await asyncio.gather(transport.get(URL), transport.get(URL))
+        assert [r.status_code for r in responses] == [200, 200]
+
+    # used to fail with "got Future attached to a different loop"
+    asyncio.run(run())
+    asyncio.run(run())
+
+    assert clients[0] is not clients[1]
+
+
+def test_with_transport_injects_client():
+
+    transport = object()
+
+    async def get(client, symbol, depth=10):
+        return client, symbol, depth
+
+    wrapped = with_transport(get, transport)
+    other = object()
+
+    assert asyncio.run(wrapped(symbol="XBT-USD")) == (transport, "XBT-USD", 10)
+    assert asyncio.run(wrapped(None, "XBT-USD", 5)) == (transport, "XBT-USD", 5)
+    assert asyncio.run(wrapped(client=None, symbol="XBT-USD")) == (transport, "XBT-USD", 10)
+    assert asyncio.run(wrapped(other, "XBT-USD")) == (other, "XBT-USD", 10)
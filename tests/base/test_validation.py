@@ -0,0 +1,75 @@
+import pytest
+
+from noobit_markets.base.models.trusted import validate_level, VALIDATION_LEVELS
+from noobit_markets.base.models.interface import with_validation
+from noobit_markets.exchanges.kraken.interface import KRAKEN
+from noobit_markets.exchanges.kraken import endpoints
+from noobit_markets.exchanges.kraken.rest.public.ohlc.get import get_ohlc_kraken
+from noobit_markets.exchanges.kraken.rest.public.trades.get import get_trades_kraken
+from noobit_markets.exchanges.kraken.rest.public.orderbook.get import get_orderbook_kraken
+from noobit_markets.exchanges.ftx.rest.public.ohlc.get import get_ohlc_ftx
+from noobit_markets.exchanges.ftx.rest.public.trades.get import get_trades_ftx
+from noobit_markets.exchanges.ftx.rest.public.orderbook.get import get_orderbook_ftx
+from noobit_markets.exchanges.binance.rest.public.ohlc.get import get_ohlc_binance
+from noobit_markets.exchanges.binance.rest.public.trades.get import get_trades_binance
+from noobit_markets.exchanges.binance.rest.public.orderbook.get import get_orderbook_binance
+
+
+SYMBOLS = {"XBT-USD": "XXBTZUSD"}
+
+
+
+
+def test_validate_level():
+
+    assert VALIDATION_LEVELS == ("full", "response", "none")
+    for level in VALIDATION_LEVELS:
+        assert validate_level(level).value == level
+
+    for level in ("Full", "", None, True):
+        result = validate_level(level)
+        assert result.is_err() and isinstance(result.value, ValueError)
+
+
+def test_with_validation():
+
+    result = with_validation(KRAKEN, "fast")
+    assert result.is_err() and isinstance(result.value, ValueError)
+
+    result = with_validation(KRAKEN, "none")
+    assert result.is_ok()
+    assert result.value.rest.private == KRAKEN.rest.private
+
+
+@pytest.mark.asyncio
+async def test_with_validation_caller_level():
+
+    ohlc = with_validation(KRAKEN, "none").value.rest.public.ohlc
+    base_url = endpoints.KRAKEN_ENDPOINTS.public.url
+    endpoint = endpoints.KRAKEN_ENDPOINTS.public.endpoints.ohlc
+
+    # level of the caller is used (and rejected) before any request, whether keyword or positional
+    result = await ohlc(None, "XBT-USD", SYMBOLS, "1H", 0, validation="fast")
+    assert result.is_err() and isinstance(result.value, ValueError)
+
+    result = await ohlc(None, "XBT-USD", SYMBOLS, "1H", 0, base_url, endpoint, "fast")
+    assert result.is_err() and isinstance(result.value, ValueError)
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("getter, args", [
+    (get_ohlc_kraken, ("1H", 0)),
+    (get_trades_kraken, (0, )),
+    (get_orderbook_kraken, (10, )),
+    (get_ohlc_ftx, ("1H", 0)),
+    (get_trades_ftx, (0, )),
+    (get_orderbook_ftx, (10, )),
+    (get_ohlc_binance, ("1H", 0)),
+    (get_trades_binance, ()),
+    (get_orderbook_binance, (10, )),
+])
+async def test_getters_unknown_level(getter, args):
+
+    # returned before any request is sent
+    result = await getter(None, "XBT-USD", SYMBOLS, *args, validation="fast")
+    assert result.is_err() and isinstance(result.value, ValueError)
@@ -0,0 +1,16 @@
+import os
+import shutil
+import tempfile
+
+
+# symbols registries write their cache file to $NOOBIT_CACHE_DIR when they are created (on import),
+# tests must not read or write the cache of the user
+_CACHE_DIR = tempfile.mkdtemp(prefix="noobit_markets_tests_")
+
+
+def pytest_configure(config):
+    os.environ["NOOBIT_CACHE_DIR"] = _CACHE_DIR
+
+
+def pytest_unconfigure(config):
+    shutil.rmtree(_CACHE_DIR, ignore_errors=True)
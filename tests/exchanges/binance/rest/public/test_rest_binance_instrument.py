@@ -1,7 +1,7 @@
 import pytest
 import httpx
 
-from noobit_markets.exchanges.binance.rest.public.instrument.get import get_instrument_binance
+from noobit_markets.exchanges.binance.rest.public.instrument.get import get_instrument_binance, get_instruments_binance
 
 from noobit_markets.base.models.result import Ok, Err, Result
 from noobit_markets.base.models.rest.response import NoobitResponseInstrument
@@ -34,6 +34,27 @@ async def test_instrument_binance():
         assert isinstance(symbols.value, NoobitResponseInstrument)
 
 
+
+@pytest.mark.asyncio
+@pytest.mark.vcr()
+async def test_instruments_binance():
+
+    async with httpx.AsyncClient() as client:
+
+        # single request: ticker/24hr?symbols=["BTCUSDT","ETHUSDT"]
+        instruments = await get_instruments_binance(
+            client,
+            ["XBT-USD", "ETH-USD"],
+            {"XBT-USD": "BTCUSDT", "ETH-USD": "ETHUSDT"},
+        )
+
+        assert isinstance(instruments, Ok)
+        assert set(instruments.value) == {"XBT-USD", "ETH-USD"}
+        for symbol, instrument in instruments.value.items():
+            assert isinstance(instrument, NoobitResponseInstrument)
+            assert instrument.symbol == symbol
+
+
 if __name__ == '__main__':
     pytest.main(['-s', __file__, '--block-network'])
     # record run
@@ -4,6 +4,7 @@ import httpx
 from noobit_markets.exchanges.binance.rest.public.ohlc.get import get_ohlc_binance
 
 from noobit_markets.base.models.result import Ok, Err, Result
+from noobit_markets.base.models.rest.columnar import NoobitColumnsOhlc
 from noobit_markets.base.models.rest.response import NoobitResponseOhlc
 
 
@@ -36,6 +37,28 @@ async def test_ohlc():
         assert isinstance(symbols.value, NoobitResponseOhlc)
 
 
+
+@pytest.mark.asyncio
+@pytest.mark.vcr("test_ohlc.yaml")
+async def test_ohlc_columnar():
+
+    async with httpx.AsyncClient() as client:
+
+        columns = await get_ohlc_binance(
+            client=client,
+            symbol="XBT-USD",
+            symbol_to_exchange={"XBT-USD": "BTCUSDT"},
+            timeframe="1H",
+            since=None,
+            columnar=True
+        )
+
+        assert isinstance(columns, Ok)
+        assert isinstance(columns.value, NoobitColumnsOhlc)
+        assert len(columns.value) == len(columns.value.rawJson)
+        assert isinstance(columns.value.to_model(), NoobitResponseOhlc)
+
+
 if __name__ == '__main__':
     pytest.main(['-s', __file__, '--block-network'])
     # record run
@@ -0,0 +1,33 @@
+import pytest
+import httpx
+
+from noobit_markets.exchanges.binance.rest.public.spread.get import get_spreads_binance
+
+from noobit_markets.base.models.result import Ok, Err, Result
+from noobit_markets.base.models.rest.response import NoobitResponseSpread
+
+
+@pytest.mark.asyncio
+@pytest.mark.vcr()
+async def test_spreads_binance():
+
+    async with httpx.AsyncClient() as client:
+
+        # single request: ticker/bookTicker?symbols=["BTCUSDT","ETHUSDT"]
+        spreads = await get_spreads_binance(
+            client,
+            ["XBT-USD", "ETH-USD"],
+            {"XBT-USD": "BTCUSDT", "ETH-USD": "ETHUSDT"},
+        )
+
+        assert isinstance(spreads, Ok)
+        assert set(spreads.value) == {"XBT-USD", "ETH-USD"}
+        for symbol, spread in spreads.value.items():
+            assert isinstance(spread, NoobitResponseSpread)
+            assert all(item.symbol == symbol for item in spread.spread)
+
+
+if __name__ == '__main__':
+    pytest.main(['-s', __file__, '--block-network'])
+    # record run
+    # pytest.main(['-s', __file__, '--record-mode=new_episodes'])
@@ -1,7 +1,7 @@
 import pytest
 import httpx
 
-from noobit_markets.exchanges.kraken.rest.public.instrument.get import get_instrument_kraken
+from noobit_markets.exchanges.kraken.rest.public.instrument.get import get_instrument_kraken, get_instruments_kraken
 
 from noobit_markets.base.models.result import Ok, Err, Result
 from noobit_markets.base.models.rest.response import NoobitResponseInstrument
@@ -33,6 +33,47 @@ async def test_instrument():
         assert isinstance(symbols.value, NoobitResponseInstrument)
 
 
+
+@pytest.mark.asyncio
+@pytest.mark.vcr()
+async def test_instruments():
+
+    async with httpx.AsyncClient() as client:
+
+        # single request: Ticker?pair=XXBTZUSD,XETHZUSD
+        instruments = await get_instruments_kraken(
+            client,
+            ["XBT-USD", "ETH-USD"],
+            {"XBT-USD": "XXBTZUSD", "ETH-USD": "XETHZUSD"},
+        )
+
+        assert isinstance(instruments, Ok)
+        assert set(instruments.value) == {"XBT-USD", "ETH-USD"}
+        for symbol, instrument in instruments.value.items():
+            assert isinstance(instrument, NoobitResponseInstrument)
+            assert instrument.symbol == symbol
+
+
+@pytest.mark.asyncio
+@pytest.mark.vcr("test_instruments.yaml")
+async def test_instruments_mapping():
+
+    async with httpx.AsyncClient() as client:
+
+        # only the requested symbols are sent, whatever else is in the mapping
+        instruments = await get_instruments_kraken(
+            client,
+            ["XBT-USD", "ETH-USD"],
+            {"XBT-USD": "XXBTZUSD", "ETH-USD": "XETHZUSD", "LTC-USD": "XLTCZUSD"},
+        )
+        assert isinstance(instruments, Ok)
+        assert set(instruments.value) == {"XBT-USD", "ETH-USD"}
+
+        # no symbols: nothing to request
+        instruments = await get_instruments_kraken(client, [], {"XBT-USD": "XXBTZUSD"})
+        assert isinstance(instruments, Err)
+
+
 if __name__ == '__main__':
     pytest.main(['-s', __file__, '--block-network'])
     # record run
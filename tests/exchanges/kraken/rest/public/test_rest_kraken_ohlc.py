@@ -3,8 +3,10 @@ import httpx
 from pydantic import ValidationError
 
 from noobit_markets.exchanges.kraken.rest.public.ohlc.get import get_ohlc_kraken
+from noobit_markets.exchanges.kraken.rest.public.ohlc.response import parse_result_data_ohlc_columnar
 
 from noobit_markets.base.models.result import Ok, Err, Result
+from noobit_markets.base.models.rest.columnar import NoobitColumnsOhlc
 from noobit_markets.base.models.rest.response import NoobitResponseOhlc
 
 
@@ -36,6 +38,72 @@ async def test_ohlc():
         assert isinstance(symbols.value, NoobitResponseOhlc)
 
 
+
+@pytest.mark.asyncio
+@pytest.mark.vcr("test_ohlc.yaml")
+async def test_ohlc_response_only():
+
+    async with httpx.AsyncClient() as client:
+
+        symbols = await get_ohlc_kraken(
+            client=client,
+            symbol="XBT-USD",
+            symbol_to_exchange={"XBT-USD": "XXBTZUSD"},
+            timeframe="1H",
+            since=None,
+            validation="response"
+        )
+
+        assert isinstance(symbols, Ok)
+        assert isinstance(symbols.value, NoobitResponseOhlc)
+
+
+
+@pytest.mark.asyncio
+@pytest.mark.vcr("test_ohlc.yaml")
+async def test_ohlc_columnar():
+
+    async with httpx.AsyncClient() as client:
+
+        columns = await get_ohlc_kraken(
+            client=client,
+            symbol="XBT-USD",
+            symbol_to_exchange={"XBT-USD": "XXBTZUSD"},
+            timeframe="1H",
+            since=None,
+            columnar=True
+        )
+
+        assert isinstance(columns, Ok)
+        assert isinstance(columns.value, NoobitColumnsOhlc)
+        assert len(columns.value) == len(columns.value.rawJson["XXBTZUSD"])
+        assert isinstance(columns.value.to_model(), NoobitResponseOhlc)
+
+
+
+@pytest.mark.parametrize("payload", [
+    # pair missing
+    {"last": 0},
+    # rows of the wrong length
+    {"XXBTZUSD": [[1600000000, "10000.0"]], "last": 0},
+    # not a number
+    {"XXBTZUSD": [[1600000000, "x", "10010.0", "9990.0", "10005.0", "10002.0", "1.5", 12]], "last": 0},
+    # not rows
+    {"XXBTZUSD": 1, "last": 0},
+])
+def test_ohlc_columnar_malformed(payload):
+
+    result = parse_result_data_ohlc_columnar(payload, "XBT-USD", {"XBT-USD": "XXBTZUSD"})
+    assert isinstance(result, Err)
+
+
+def test_ohlc_columnar_parse():
+
+    result = parse_result_data_ohlc_columnar({"XXBTZUSD": [[1600000000, "10000.0", "10010.0", "9990.0", "10005.0", "10002.0", "1.5", 12]], "last": 0}, "XBT-USD", {"XBT-USD": "XXBTZUSD"})
+    assert isinstance(result, Ok)
+    assert len(result.value) == 1
+
+
 if __name__ == '__main__':
     pytest.main(['-s', __file__, '--block-network'])
     # record run
@@ -1,3 +1,5 @@
+from decimal import Decimal
+
 import pytest
 import httpx
 from pydantic import ValidationError
@@ -6,6 +8,8 @@ from noobit_markets.exchanges.kraken.rest.public.orderbook.get import get_orderb
 
 from noobit_markets.base.models.result import Ok, Err, Result
 from noobit_markets.base.models.rest.response import NoobitResponseOrderBook
+from noobit_markets.base.orderbook import OrderBook
+from noobit_markets.base.fixedpoint import Scale
 
 
 @pytest.mark.asyncio
@@ -35,6 +39,91 @@ async def test_orderbook():
         assert isinstance(symbols.value, NoobitResponseOrderBook)
 
 
+
+@pytest.mark.asyncio
+@pytest.mark.vcr("test_orderbook.yaml")
+async def test_orderbook_trusted():
+
+    async with httpx.AsyncClient() as client:
+
+        symbols = await get_orderbook_kraken(
+            client,
+            "XBT-USD",
+            {"XBT-USD": "XXBTZUSD"},
+            500,
+            validation="none"
+        )
+
+        assert isinstance(symbols, Ok)
+        assert isinstance(symbols.value, NoobitResponseOrderBook)
+        assert all(isinstance(k, Decimal) and isinstance(v, Decimal) for k, v in symbols.value.asks.items())
+        assert all(isinstance(k, Decimal) and isinstance(v, Decimal) for k, v in symbols.value.bids.items())
+
+
+@pytest.mark.asyncio
+@pytest.mark.vcr("test_orderbook.yaml")
+async def test_orderbook_seed_book():
+
+    async with httpx.AsyncClient() as client:
+
+        snapshot = await get_orderbook_kraken(
+            client,
+            "XBT-USD",
+            {"XBT-USD": "XXBTZUSD"},
+            500,
+        )
+
+        assert isinstance(snapshot, Ok)
+
+        book = OrderBook.from_response(snapshot.value, depth=10)
+        assert len(book.asks) == 10 and len(book.bids) == 10
+        assert book.best_ask[0] == min(snapshot.value.asks)
+        assert book.best_bid[0] == max(snapshot.value.bids)
+        assert book.spread > 0
+
+        best_ask, best_bid = book.best_ask[0], book.best_bid[0]
+
+        # remove best ask, insert new best bid
+        new_bid = best_bid + Decimal("0.1")
+        book.apply_update(asks={best_ask: Decimal(0)}, bids={new_bid: Decimal(1)})
+        assert best_ask not in book.asks and len(book.asks) == 9
+        assert book.best_bid == (new_bid, Decimal(1))
+        # worst bid got pushed out
+        assert len(book.bids) == 10
+
+        assert list(book.bids)[:2] == [new_bid, best_bid]
+        assert book.top(3)["bids"][0] == (new_bid, Decimal(1))
+        assert isinstance(book.to_model(), NoobitResponseOrderBook)
+
+
+@pytest.mark.asyncio
+@pytest.mark.vcr("test_orderbook.yaml")
+async def test_orderbook_scaled_book():
+
+    async with httpx.AsyncClient() as client:
+
+        snapshot = await get_orderbook_kraken(
+            client,
+            "XBT-USD",
+            {"XBT-USD": "XXBTZUSD"},
+            500,
+        )
+
+        assert isinstance(snapshot, Ok)
+
+        book = OrderBook.from_response(snapshot.value, depth=10)
+        scaled = OrderBook.from_response(snapshot.value, depth=10, scale=Scale(1, 8))
+
+        # levels are ints, accessors give back the same Decimals
+        assert all(isinstance(price, int) for price in scaled.asks)
+        assert scaled.best_ask == book.best_ask and scaled.best_bid == book.best_bid
+        assert scaled.spread == book.spread
+        assert scaled.top(10) == book.top(10)
+
+        with pytest.raises(ValueError):
+            scaled.apply_update(asks={Decimal("1.23"): Decimal(1)}, bids={})
+
+
 if __name__ == '__main__':
     pytest.main(['-s', __file__, '--block-network'])
     # record run
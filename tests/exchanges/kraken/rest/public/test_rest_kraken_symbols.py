@@ -2,7 +2,11 @@ import pytest
 import httpx
 from pydantic import ValidationError
 
+import os
+import functools
+
 from noobit_markets.exchanges.kraken.rest.public.symbols.get import get_symbols
+from noobit_markets.base.symbols import SymbolsRegistry, SymbolsIndex, inverse
 
 from noobit_markets.base.models.result import Ok, Err, Result
 from noobit_markets.base.models.rest.response import NoobitResponseSymbols, NoobitResponseOhlc
@@ -22,6 +26,82 @@ async def test_symbols():
         assert isinstance(symbols.value, NoobitResponseSymbols)
 
 
+@pytest.mark.asyncio
+@pytest.mark.vcr("test_symbols.yaml")
+async def test_symbols_registry(tmp_path):
+
+    async with httpx.AsyncClient() as client:
+
+        path = str(tmp_path / "kraken_symbols.json")
+        registry = SymbolsRegistry("kraken", functools.partial(get_symbols, client), path=path)
+
+        symbols = await registry.get()
+        assert isinstance(symbols, Ok)
+        assert registry.fetches == 1
+
+        # served from memory
+        mapping = await registry.symbol_to_exchange()
+        assert mapping.value["XBT-USD"] == symbols.value.asset_pairs["XBT-USD"].exchange_name
+        assert registry.fetches == 1
+
+        # warm start from file, without any request
+        warm = SymbolsRegistry("kraken", functools.partial(get_symbols, client), path=path)
+        warm_symbols = await warm.get()
+        assert isinstance(warm_symbols, Ok)
+        assert warm.fetches == 0
+        assert warm_symbols.value.asset_pairs == symbols.value.asset_pairs
+        assert warm_symbols.value.assets == symbols.value.assets
+
+
+
+@pytest.mark.asyncio
+@pytest.mark.vcr("test_symbols.yaml")
+async def test_symbols_registry_client():
+
+    async with httpx.AsyncClient() as client:
+
+        # no default client: only works if the client of the caller is passed to the fetch
+        registry = SymbolsRegistry("kraken", functools.partial(get_symbols, client=None), persist=False)
+
+        mapping = await registry.symbol_to_exchange(client)
+        assert isinstance(mapping, Ok)
+        assert registry.fetches == 1
+
+
+def test_symbols_registry_cache_dir():
+
+    # set by tests/conftest.py, before the registries are created
+    from noobit_markets.exchanges.kraken.rest.public.symbols.get import KRAKEN_SYMBOLS
+    assert KRAKEN_SYMBOLS.path.startswith(os.environ["NOOBIT_CACHE_DIR"])
+
+
+@pytest.mark.asyncio
+@pytest.mark.vcr("test_symbols.yaml")
+async def test_symbols_index():
+
+    async with httpx.AsyncClient() as client:
+
+        symbols = await get_symbols(
+            client,
+        )
+
+        index = SymbolsIndex.of(symbols.value)
+        # built once
+        assert SymbolsIndex.of(symbols.value) is index
+
+        item = symbols.value.asset_pairs["XBT-USD"]
+        assert index.to_exchange["XBT-USD"] == item.exchange_name
+        assert inverse(index.to_exchange)[item.exchange_name] == "XBT-USD"
+        assert index.to_ws.inverse[item.ws_name] == "XBT-USD"
+        assert index.from_ws(item.ws_name) == "XBT-USD"
+        assert index.to_altname.inverse["XBTUSD"] == "XBT-USD"
+        assert index.assets.inverse[symbols.value.assets["XBT"]] == "XBT"
+        assert index.quotes["XBT-USD"] == "USD"
+
+        for name in ("XBT-USD", item.exchange_name, item.ws_name, "XBTUSD"):
+            assert index.lookup(name) == "XBT-USD"
+
+
 if __name__ == '__main__':
     pytest.main(['-s', __file__, '--block-network'])
     # record run
@@ -1,11 +1,17 @@
+from decimal import Decimal
+
 import pytest
 import httpx
 from pydantic import ValidationError
 
 from noobit_markets.exchanges.kraken.rest.public.trades.get import get_trades_kraken
+from noobit_markets.exchanges.kraken.rest.public.trades.response import parse_result_data_trades_columnar
 
 from noobit_markets.base.models.result import Ok, Err, Result
+from noobit_markets.base.models.rest.columnar import NoobitColumnsTrades
 from noobit_markets.base.models.rest.response import NoobitResponseTrades
+from noobit_markets.base.models.rest.records import TradeRecord, to_records
+from noobit_markets.base.fixedpoint import Scale
 
 
 @pytest.mark.asyncio
@@ -35,6 +41,119 @@ async def test_trades():
         assert isinstance(symbols.value, NoobitResponseTrades)
 
 
+
+@pytest.mark.asyncio
+@pytest.mark.vcr("test_trades.yaml")
+async def test_trades_trusted():
+
+    async with httpx.AsyncClient() as client:
+
+        symbols = await get_trades_kraken(
+            client,
+            "XBT-USD",
+            {"XBT-USD": "XXBTZUSD"},
+            None,
+            validation="none"
+        )
+
+        assert isinstance(symbols, Ok)
+        assert isinstance(symbols.value, NoobitResponseTrades)
+        assert all(isinstance(trade.avgPx, Decimal) for trade in symbols.value.trades)
+
+
+
+@pytest.mark.asyncio
+@pytest.mark.vcr("test_trades.yaml")
+async def test_trades_columnar():
+
+    async with httpx.AsyncClient() as client:
+
+        columns = await get_trades_kraken(
+            client,
+            "XBT-USD",
+            {"XBT-USD": "XXBTZUSD"},
+            None,
+            columnar=True
+        )
+
+        assert isinstance(columns, Ok)
+        assert isinstance(columns.value, NoobitColumnsTrades)
+        assert len(columns.value) == len(columns.value.rawJson["XXBTZUSD"])
+        assert isinstance(columns.value.to_model(), NoobitResponseTrades)
+
+
+
+@pytest.mark.asyncio
+@pytest.mark.vcr("test_trades.yaml")
+async def test_trades_columnar_scaled():
+
+    async with httpx.AsyncClient() as client:
+
+        columns = await get_trades_kraken(
+            client,
+            "XBT-USD",
+            {"XBT-USD": "XXBTZUSD"},
+            None,
+            columnar=True,
+            scale=Scale(1, 8)
+        )
+
+        assert isinstance(columns, Ok)
+        assert columns.value.avgPx.typecode == "q"
+
+        # exact round trip to the raw strings
+        rows = columns.value.rawJson["XXBTZUSD"]
+        trades = columns.value.to_model().trades
+        assert [trade.avgPx for trade in trades] == [Decimal(row[0]) for row in rows]
+        assert [trade.cumQty for trade in trades] == [Decimal(row[1]) for row in rows]
+
+
+
+@pytest.mark.asyncio
+@pytest.mark.vcr("test_trades.yaml")
+async def test_trades_records():
+
+    async with httpx.AsyncClient() as client:
+
+        symbols = await get_trades_kraken(
+            client,
+            "XBT-USD",
+            {"XBT-USD": "XXBTZUSD"},
+            None,
+        )
+
+        assert isinstance(symbols, Ok)
+        records = to_records(symbols.value.trades)
+        assert all(isinstance(record, TradeRecord) for record in records)
+        assert not hasattr(records[0], "__dict__")
+        assert records[0].validate().value == symbols.value.trades[0]
+        assert records[0].to_model() == symbols.value.trades[0]
+
+
+
+@pytest.mark.parametrize("payload", [
+    # pair missing
+    {"last": "0"},
+    # rows of the wrong length
+    {"XXBTZUSD": [["10000.0", "0.5"]], "last": "0"},
+    # not a number
+    {"XXBTZUSD": [["10000.0", "0.5", "x", "b", "m", ""]], "last": "0"},
+    # not rows
+    {"XXBTZUSD": 1, "last": "0"},
+])
+def test_trades_columnar_malformed(payload):
+
+    result = parse_result_data_trades_columnar(payload, "XBT-USD", {"XBT-USD": "XXBTZUSD"})
+    assert isinstance(result, Err)
+
+
+def test_trades_columnar_parse():
+
+    result = parse_result_data_trades_columnar({"XXBTZUSD": [["10000.0", "0.5", 1600000000.1234, "b", "m", ""]], "last": 0}, "XBT-USD", {"XBT-USD": "XXBTZUSD"})
+    assert isinstance(result, Ok)
+    assert len(result.value) == 1
+
+
 if __name__ == '__main__':
     pytest.main(['-s', __file__, '--block-network'])
     # uncomment below to record cassette
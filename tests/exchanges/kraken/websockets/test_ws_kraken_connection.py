@@ -0,0 +1,63 @@
+import asyncio
+
+import pytest
+
+from noobit_markets.exchanges.kraken.websockets import base as ws_base
+from noobit_markets.exchanges.kraken.websockets.public.routing import msg_handler
+
+
+
+
+def _ws_api(connect):
+
+    api = ws_base.KrakenWsPublic.__new__(ws_base.KrakenWsPublic)
+    api.reconnect_base_delay = 0.
+    api._connect = connect
+    api._terminate = False
+    api._reconnects = 0
+    api.msg_handler = msg_handler.copy()
+    api.resubscribed = []
+
+    async def on_reconnect():
+        api.resubscribed.append(api.client)
+
+    api._on_reconnect = on_reconnect
+    return api
+
+
+
+
+@pytest.mark.asyncio
+async def test_reconnect_resubscribes():
+
+    attempts = []
+
+    async def connect():
+        attempts.append(None)
+        if len(attempts) < 3:
+            raise OSError("down")
+        return "new client"
+
+    api = _ws_api(connect)
+    await api._reconnect()
+
+    assert len(attempts) == 3
+    assert api._reconnects == 1
+    assert api.resubscribed == ["new client"]
+
+
+@pytest.mark.asyncio
+async def test_shutdown_while_reconnecting():
+
+    api = _ws_api(None)
+
+    async def connect():
+        # shut down while the connection is down
+        api._terminate = True
+        raise OSError("down")
+
+    api._connect = connect
+    await asyncio.wait_for(api._reconnect(), 1)
+
+    assert api._reconnects == 0
+    assert api.resubscribed == []
@@ -0,0 +1,146 @@
+import asyncio
+from collections import Counter
+from decimal import Decimal
+
+import pytest
+
+from noobit_markets.base.models.result import Ok
+from noobit_markets.exchanges.kraken.websockets import base as ws_base
+from noobit_markets.exchanges.kraken.websockets.public import orderbook
+
+
+# example of https://docs.kraken.com/websockets/#book-checksum
+ASKS = ["0.05005", "0.05010", "0.05015", "0.05020", "0.05025", "0.05030", "0.05035", "0.05040", "0.05045", "0.05050"]
+BIDS = ["0.05000", "0.04995", "0.04990", "0.04980", "0.04975", "0.04970", "0.04965", "0.04960", "0.04955", "0.04950"]
+VOLUME = "0.00000500"
+CHECKSUM = 974947235
+
+
+SNAPSHOT = [
+    0,
+    {
+        "as": [[price, VOLUME, "1534614248.123678"] for price in ASKS],
+        "bs": [[price, VOLUME, "1534614248.765567"] for price in BIDS],
+    },
+    "book-10",
+    "XBT/USD"
+]
+
+
+def _update(asks, checksum):
+    return [0, {"a": [[price, volume, "1534614335.345903"] for price, volume in asks], "c": str(checksum)}, "book-10", "XBT/USD"]
+
+
+def _levels(prices):
+    return {Decimal(price): Decimal(VOLUME) for price in prices}
+
+
+def _valid(frame):
+    return orderbook.validate_parsed(frame, orderbook.parse_msg(frame))
+
+
+
+
+def test_checksum_docs_vector():
+
+    book = orderbook.KrakenOrderBook("XBT-USD", 10)
+    book.apply_snapshot(_levels(ASKS), _levels(BIDS))
+
+    assert book.checksum() == CHECKSUM
+    assert book.verify(CHECKSUM)
+    assert not book.verify(CHECKSUM + 1)
+    # snapshots have no checksum
+    assert book.verify(None)
+
+
+def test_checksum_after_updates():
+
+    book = orderbook.KrakenOrderBook("XBT-USD", 10)
+    book.apply_snapshot(_levels(ASKS), _levels(BIDS))
+
+    # new level pushes the last ask out of the book
+    book.apply_update({Decimal("0.05001"): Decimal("1.5")}, {})
+    assert not book.verify(CHECKSUM)
+
+    # removed, kraken sends the level back in the book with the same update
+    book.apply_update({Decimal("0.05001"): Decimal("0"), Decimal(ASKS[-1]): Decimal(VOLUME)}, {})
+    assert book.verify(CHECKSUM)
+
+
+def test_get_checksum():
+
+    assert orderbook.get_checksum(SNAPSHOT) is None
+    assert orderbook.get_checksum(_update([], CHECKSUM)) == CHECKSUM
+
+
+class _Queue:
+
+    def __init__(self):
+        self.items = []
+
+    async def put(self, item):
+        self.items.append(item)
+
+
+def _ws_api():
+
+    api = ws_base.KrakenWsPublic.__new__(ws_base.KrakenWsPublic)
+    api.client = object()
+    api._terminate = False
+    api._full_books = {}
+    api._book_depths = {"XBT-USD": 10}
+    api._book_scales = {}
+    api._checksum_mismatches = Counter()
+    api._data_queues = {"full_book": _Queue()}
+    return api
+
+
+async def _reader(frames):
+    for frame in frames:
+        yield _valid(frame)
+
+
+@pytest.mark.asyncio
+async def test_checksum_mismatch_resubscribes(monkeypatch):
+
+    resubscribed = []
+
+    async def resubscribe(client, sub_model):
+        resubscribed.append(sub_model.msg)
+
+    monkeypatch.setattr(ws_base, "resubscribe", resubscribe)
+
+    api = _ws_api()
+    frames = [
+        SNAPSHOT,
+        # same volume: checksum unchanged
+        _update([(ASKS[0], VOLUME)], CHECKSUM),
+        # volume changed, but checksum of the previous book
+        _update([(ASKS[0], "1.00000000")], CHECKSUM),
+    ]
+    await api._build_books(_reader(frames))
+
+    # snapshot and first update published, book dropped on the mismatch
+    assert len(api._data_queues["full_book"].items) == 2
+    assert "XBT-USD" not in api._full_books
+    assert api.checksum_stats() == {"XBT-USD": 1}
+
+    assert len(resubscribed) == 1
+    assert resubscribed[0].pair == ["XBT/USD"]
+    assert resubscribed[0].subscription == {"name": "book", "depth": 10}
+
+
+@pytest.mark.asyncio
+async def test_updates_before_snapshot_ignored(monkeypatch):
+
+    async def resubscribe(client, sub_model):
+        raise AssertionError("no resubscribe")
+
+    monkeypatch.setattr(ws_base, "resubscribe", resubscribe)
+
+    api = _ws_api()
+    await api._build_books(_reader([_update([(ASKS[0], "1.00000000")], 1), SNAPSHOT]))
+
+    assert len(api._data_queues["full_book"].items) == 1
+    assert api._full_books["XBT-USD"].checksum() == CHECKSUM
+    assert api.checksum_stats() == {}
@@ -0,0 +1,72 @@
+import asyncio
+import json
+
+import pytest
+
+from noobit_markets.base.models.lazy import WsView
+from noobit_markets.base.models.rest.response import NoobitResponseTrades
+from noobit_markets.exchanges.kraken.websockets import base as ws_base
+from noobit_markets.exchanges.kraken.websockets.public.routing import KrakenPublicRouter, msg_handler
+
+
+SUBSCRIBED = {
+    "channelID": 0, "channelName": "trade", "event": "subscriptionStatus",
+    "pair": "XBT/USD", "status": "subscribed", "subscription": {"name": "trade"}
+}
+TRADE = [0, [["5541.20000", "0.15850568", "1534614057.321597", "s", "l", ""]], "trade", "XBT/USD"]
+
+
+
+
+class _Client:
+    """Websocket sending `msgs`, then open until closed.
+    """
+
+    open = True
+
+    def __init__(self, msgs):
+        self.msgs = [json.dumps(msg) for msg in msgs]
+        self.closed = asyncio.Event()
+
+    def __aiter__(self):
+        return self._iter()
+
+    async def _iter(self):
+        for msg in self.msgs:
+            yield msg
+        await self.closed.wait()
+
+
+
+
+@pytest.mark.asyncio
+async def test_default_feed_routes_views():
+
+    assert KrakenPublicRouter().lazy
+    assert msg_handler.lazy
+
+    api = ws_base.KrakenWsPublic(_Client([SUBSCRIBED, TRADE]), msg_handler, asyncio.get_event_loop())
+    assert api.msg_handler.lazy
+
+    reader = api._reader(api._data_queues, "trade")
+    msg = await asyncio.wait_for(reader.__anext__(), 1)
+    api.shutdown()
+
+    assert isinstance(msg.value, WsView)
+    assert msg.value.rawJson == TRADE
+    # decoded on access
+    assert msg.value.trades[0].symbol == "XBT-USD"
+    assert isinstance(msg.value.validate().value, NoobitResponseTrades)
+    assert api.msg_handler.stats()["trade"].count == 1
+
+
+@pytest.mark.asyncio
+async def test_eager_router():
+
+    router = KrakenPublicRouter(lazy=False)
+    queues = {"trade": asyncio.Queue()}
+
+    await router(json.dumps(SUBSCRIBED), {}, {"subscription": asyncio.Queue()})
+    msg = await router(json.dumps(TRADE), queues, {})
+
+    assert isinstance(msg.value, NoobitResponseTrades)
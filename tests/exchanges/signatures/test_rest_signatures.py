@@ -5,8 +5,8 @@ import pytest
 import httpx
 
 #public instrument
-from noobit_markets.exchanges.binance.rest.public.instrument.get import get_instrument_binance
-from noobit_markets.exchanges.kraken.rest.public.instrument.get import get_instrument_kraken
+from noobit_markets.exchanges.binance.rest.public.instrument.get import get_instrument_binance, get_instruments_binance
+from noobit_markets.exchanges.kraken.rest.public.instrument.get import get_instrument_kraken, get_instruments_kraken
 
 #public ohlc
 from noobit_markets.exchanges.binance.rest.public.ohlc.get import get_ohlc_binance
@@ -24,8 +24,8 @@ from noobit_markets.exchanges.kraken.rest.public.symbols.get import get_symbols
 from noobit_markets.exchanges.ftx.rest.public.symbols.get import get_symbols_ftx
 
 #public spread
-from noobit_markets.exchanges.binance.rest.public.spread.get import get_spread_binance
-from noobit_markets.exchanges.kraken.rest.public.spread.get import get_spread_kraken
+from noobit_markets.exchanges.binance.rest.public.spread.get import get_spread_binance, get_spreads_binance
+from noobit_markets.exchanges.kraken.rest.public.spread.get import get_spread_kraken, get_spreads_kraken
 
 #public trades
 from noobit_markets.exchanges.binance.rest.public.trades.get import get_trades_binance
@@ -115,6 +115,22 @@ def test_instrument_signature():
     _util_test_sigs(sig_kraken, sig_binance)
 
 
+def test_instruments_signature():
+
+    sig_kraken = inspect.signature(get_instruments_kraken)
+    sig_binance = inspect.signature(get_instruments_binance)
+
+    _util_test_sigs(sig_kraken, sig_binance)
+
+
+def test_spreads_signature():
+
+    sig_kraken = inspect.signature(get_spreads_kraken)
+    sig_binance = inspect.signature(get_spreads_binance)
+
+    _util_test_sigs(sig_kraken, sig_binance)
+
+
 def test_ohlc_signature():
     sig_kraken = inspect.signature(get_ohlc_kraken) 
     sig_binance = inspect.signature(get_ohlc_binance)